@@ -0,0 +1,176 @@
+# app/bulk_examples.py
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional
+
+from . import crud, database
+from .config import (
+    BULK_EXAMPLES_WORDS_PER_CALL,
+    BULK_EXAMPLES_CONCURRENCY,
+    BULK_EXAMPLES_JOB_TTL_SECONDS,
+)
+from .metrics import metrics
+from .llm_scheduler import llm_priority
+
+# 모든 일괄 작업이 공유하는 LLM 호출 풀. max_workers가 곧 동시 LLM 호출 상한입니다.
+_llm_executor = ThreadPoolExecutor(
+    max_workers=max(1, BULK_EXAMPLES_CONCURRENCY),
+    thread_name_prefix="bulk-examples",
+)
+
+
+class BulkExampleJob:
+    """사용자 단어장 예문 일괄 생성 작업의 진행 상태."""
+
+    def __init__(
+        self,
+        user_id: str,
+        only_missing: bool,
+        on_progress: Optional[Callable[[float], None]] = None,
+    ):
+        self.job_id = uuid.uuid4().hex
+        self.user_id = user_id
+        self.only_missing = only_missing
+        self.status = "pending"
+        self.total_words = 0
+        self.processed_words = 0
+        self.failed_words: List[str] = []
+        self.inserted_examples = 0
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.on_progress = on_progress
+        self._lock = threading.Lock()
+
+    def add_progress(self, processed: int, failed: List[str]) -> None:
+        with self._lock:
+            self.processed_words += processed
+            self.failed_words.extend(failed)
+            progress = self.processed_words / self.total_words if self.total_words else 1.0
+        if self.on_progress:
+            self.on_progress(progress)
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "job_id": self.job_id,
+                "user_id": self.user_id,
+                "status": self.status,
+                "total_words": self.total_words,
+                "processed_words": self.processed_words,
+                "failed_words": list(self.failed_words),
+                "inserted_examples": self.inserted_examples,
+                "progress": (
+                    self.processed_words / self.total_words if self.total_words else 0.0
+                ),
+                "error": self.error,
+            }
+
+
+_jobs: Dict[str, BulkExampleJob] = {}
+_jobs_lock = threading.Lock()
+
+
+def _evict_finished_jobs_locked(now: float) -> None:
+    """끝난 지 BULK_EXAMPLES_JOB_TTL_SECONDS가 지난 작업을 목록에서 지웁니다."""
+    expired = [
+        job_id
+        for job_id, job in _jobs.items()
+        if job.finished_at is not None and now - job.finished_at > BULK_EXAMPLES_JOB_TTL_SECONDS
+    ]
+    for job_id in expired:
+        del _jobs[job_id]
+
+
+def _generate_chunk(words: List[str]) -> Dict[str, List[str]]:
+    # 일괄 작업은 사용자 요청보다 뒤로 밀리도록 batch 우선순위로 호출합니다.
+    with llm_priority("batch"):
+        return crud.word_examples.generate_examples_for_words(words)
+
+
+def _chunks(items: List[Any], size: int) -> List[List[Any]]:
+    size = max(1, size)
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def run_bulk_examples(job: BulkExampleJob) -> Dict[str, Any]:
+    """
+    단어를 BULK_EXAMPLES_WORDS_PER_CALL개씩 묶어 LLM을 호출하고,
+    모든 결과를 모아 word_examples에 한 번에 INSERT합니다.
+    """
+    db = database.SessionLocal()
+    started = time.perf_counter()
+    try:
+        job.status = "running"
+        words = crud.words.get_words_by_user_sorted_by_created_time(db, user_id=job.user_id)
+        if job.only_missing:
+            has_examples = crud.word_examples.get_last_example_sequences(
+                db, [w.words_id for w in words]
+            )
+            words = [w for w in words if w.words_id not in has_examples]
+        job.total_words = len(words)
+
+        ids_by_name: Dict[str, List[int]] = {}
+        for w in words:
+            ids_by_name.setdefault(w.word_name, []).append(w.words_id)
+        names = list(ids_by_name.keys())
+
+        examples_by_word_id: Dict[int, List[str]] = {}
+        futures = {
+            _llm_executor.submit(_generate_chunk, chunk): chunk
+            for chunk in _chunks(names, BULK_EXAMPLES_WORDS_PER_CALL)
+        }
+        for future in as_completed(futures):
+            chunk = futures[future]
+            try:
+                generated = future.result()
+            except Exception as e:
+                print(f"Bulk examples: chunk of {len(chunk)} words failed: {e}")
+                generated = {}
+            failed = [name for name in chunk if name not in generated]
+            for name, examples in generated.items():
+                for word_id in ids_by_name[name]:
+                    examples_by_word_id[word_id] = examples
+            metrics.increment("bulk_examples.llm_calls")
+            job.add_progress(
+                sum(len(ids_by_name[name]) for name in chunk), failed
+            )
+
+        job.inserted_examples = crud.word_examples.bulk_create_word_examples(
+            db, examples_by_word_id
+        )
+        job.status = "completed"
+        metrics.increment("bulk_examples.inserted", job.inserted_examples)
+        print(
+            f"Bulk examples: user '{job.user_id}' {job.total_words} words, "
+            f"{job.inserted_examples} examples in {time.perf_counter() - started:.2f}s"
+        )
+    except Exception as e:
+        job.status = "failed"
+        job.error = str(e)
+        print(f"Bulk examples: job {job.job_id} failed: {e}")
+    finally:
+        job.finished_at = time.time()
+        metrics.observe("bulk_examples.job", time.perf_counter() - started)
+        db.close()
+    return job.to_dict()
+
+
+def start_bulk_examples(user_id: str, only_missing: bool = True) -> BulkExampleJob:
+    """작업을 등록하고 백그라운드 스레드에서 실행합니다."""
+    job = BulkExampleJob(user_id=user_id, only_missing=only_missing)
+    with _jobs_lock:
+        _evict_finished_jobs_locked(time.time())
+        _jobs[job.job_id] = job
+    threading.Thread(
+        target=run_bulk_examples, args=(job,), name=f"bulk-examples-{job.job_id[:8]}", daemon=True
+    ).start()
+    return job
+
+
+def get_bulk_examples_job(job_id: str) -> Optional[BulkExampleJob]:
+    with _jobs_lock:
+        _evict_finished_jobs_locked(time.time())
+        return _jobs.get(job_id)
@@ -0,0 +1,164 @@
+# app/chains.py
+"""
+요청마다 ChatPromptTemplate / ChatOpenAI / LCEL 체인을 새로 만들지 않도록
+작업(task)별 체인을 한 번만 조립해 재사용하는 레지스트리입니다.
+체인은 (task, 모델 설정) 조합으로 캐시되며 애플리케이션 시작 시 warm_chains()로 미리 만듭니다.
+"""
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, Optional
+
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import Runnable
+
+from . import config
+from .llm_clients import get_chat_model
+
+# 단어 예문 생성 (crud.word_examples.exsen)
+EXSEN_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        (
+            "system",
+            "사용자가 제공한 단어와 관련된 다양한 예문 5개를 길지 않게 생성하라. "
+            "각 예문은 서로 다른 구조와 어휘와 형용사형 전성 어미, 동사형 접미사를 사용하여 해당 단어의 다양한 활용형을 포함해야 한다. "
+            "예문의 내용을 설명하지 말 것. "
+            "사용자가 제공한 단어 부분을 볼드체로 하라. "
+            "글머리를 넣지 마라. "
+            "부가적인 요소를 추가하지 마라.",
+        ),
+        ("human", "{input}"),
+    ]
+)
+
+# 단어 ID 기반 예문 생성 (crud.word_examples.bring_exsen). 단어는 {word} 변수로 받습니다.
+BRING_EXSEN_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        (
+            "system",
+            """'{word}'와 관련된 다양한 예문 5개를 길지 않게 생성하라.
+            각 예문은 서로 다른 구조와 어휘와 형용사형 전성 어미, 동사형 접미사를 사용하여 해당 단어의 다양한 활용형을 포함해야 한다.
+            예문의 내용을 설명하지 말 것.
+            사용자가 제공한 단어 부분을 볼드체로 하라.
+            글머리를 넣지 마라.
+            부가적인 요소를 추가하지 마라.
+            한국어로 생성해.""",
+        )
+    ]
+)
+
+# 쉬운 뜻 생성 (routers.words.easy_min)
+EASY_MIN_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        (
+            "system",
+            """
+    사용자가 제공한 단어의 정확한 사전적 의미만을 참고하여, 그 뜻을 초등학생 수준에 맞춰 가장 쉽고 명확하게 설명하십시오.
+
+엄격한 제약 조건:
+
+1. 절대 예시나 문맥을 사용하지 마십시오. 오직 단어의 뜻 자체만을 설명해야 합니다.
+2. 부가적인 내용이나 사족을 어떠한 경우에도 넣지 마십시오.
+3. 친근하거나 대화체인 말투는 일체 사용하지 마십시오. 특히, '~의미해', '~있어', '~단어야', '~하는 거야', '예를 들어' 와 같은 표현은 절대 금지합니다.
+4. 존댓말을 사용하지 마십시오.
+5. 사전이나 백과사전에서 정의를 내릴 때 사용하는 방식처럼 격식 있고 간결한 어투를 사용하십시오.
+6. 단어에 동음이의어가 하나라도 존재한다면, 반드시 모든 의미를 빠짐없이 나열하여 설명하십시오. 단 하나의 의미라도 빠뜨리는 것을 금지합니다.(예: 1. 과일의 일종으로...열매. \n2. 물 위에 ...사용)
+7. 초등학생이 이해할 수 있도록 어려운 한자어나 전문 용어는 피하고 일상적인 언어로 설명하십시오.
+8. 설명하고자 하는 단어를 반복적으로 사용하지 마십시오. 특히, 문장이나 문단 시작 시 해당 단어의 반복 사용을 엄격히 금지합니다.
+9. 다음과 같은 구조의 문장 사용을 금지합니다: '단어는/는 ...이다' (예: 배는 ...이다).
+10. 설명 외에 부가적인 정보나 묘사를 추가하지 마십시오. 정의 그 자체에 집중하십시오.
+
+우선순위:
+
+위에 제시된 '엄격한 제약 조건'들을 최우선으로 따르십시오. '쉽게 설명'하는 것은 언어 선택과 개념의 단순화에 한정되며, 말투나 형식에 대한 제약 조건을 위반해서는 안 됩니다.
+    """,
+        ),
+        ("human", "{input}"),
+    ]
+)
+
+# 유사 단어 추천 (routers.words.get_related_words)
+RELATED_WORDS_PROMPT = ChatPromptTemplate.from_template(
+    """
+"{word}"라는 단어의 뜻은 다음과 같습니다: {explanation}.
+이 뜻을 기반으로 의미적으로 유사하지만 서로 다른 한국어 단어 5개를 추천해 주세요.
+형태는 JSON 리스트로만 응답해 주세요. 예: ["단어1", "단어2", ...]
+"""
+)
+
+# 에피소드 콘텐츠 생성 (routers/episodes.py 일반/스트리밍, 백그라운드 작업)
+EPISODE_CONTENT_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        (
+            "system",
+            "당신은 주어진 내용을 바탕으로 창의적이고 흥미로운 에피소드 콘텐츠를 작성하거나 수정하는 AI 작가입니다. 기존 내용을 참고하여 요청에 따라 더 발전된 내용을 생성해주세요.",
+        ),
+        (
+            "human",
+            "기존 에피소드 내용:\n"
+            "--------------------\n"
+            "{existing_content}\n"
+            "--------------------\n\n"
+            "다음은 이 내용을 바탕으로 추가적으로 고려해야 할 사항 또는 방향입니다 (만약 이 내용이 비어있다면, 기존 내용을 바탕으로 자유롭게 더 흥미롭게 발전시켜주세요):\n"
+            "--------------------\n"
+            "{additional_prompt}\n"
+            "--------------------\n\n"
+            "위 정보를 종합하여 새롭거나 수정된 에피소드 콘텐츠를 작성해주세요. 다른 부연 설명 없이, 최종 결과물인 에피소드 콘텐츠 본문만 제공해주세요.",
+        ),
+    ]
+)
+
+
+@dataclass(frozen=True)
+class ChainSpec:
+    model: Optional[str]
+    temperature: float
+    max_tokens: Optional[int] = None
+    cache: bool = False
+    parse_str: bool = True
+
+
+_PROMPTS: Dict[str, ChatPromptTemplate] = {
+    "exsen": EXSEN_PROMPT,
+    "bring_exsen": BRING_EXSEN_PROMPT,
+    "easy_min": EASY_MIN_PROMPT,
+    "related_words": RELATED_WORDS_PROMPT,
+    "episode_content": EPISODE_CONTENT_PROMPT,
+}
+
+# 설정값은 호출 시점에 읽어 (task, 설정) 조합을 캐시 키로 씁니다.
+_SPECS: Dict[str, Callable[[], ChainSpec]] = {
+    "exsen": lambda: ChainSpec(config.AI_UTILS_MODEL, 0.8, 500),
+    "bring_exsen": lambda: ChainSpec(config.AI_UTILS_MODEL, 0.8, 500),
+    "easy_min": lambda: ChainSpec(config.EASY_MIN_MODEL, 0, 500, cache=True),
+    "related_words": lambda: ChainSpec(
+        config.LLM_GENERATE_MODEL, config.LLM_GENERATE_TEMP, cache=True, parse_str=False
+    ),
+    "episode_content": lambda: ChainSpec(config.EPISODE_LLM_MODEL, 0.1),
+}
+
+
+@lru_cache(maxsize=None)
+def _compile(task: str, spec: ChainSpec) -> Runnable:
+    llm = get_chat_model(spec.model, spec.temperature, spec.max_tokens, cache=spec.cache)
+    chain = _PROMPTS[task] | llm
+    if spec.parse_str:
+        chain = chain | StrOutputParser()
+    return chain
+
+
+def get_chain(task: str) -> Runnable:
+    """task에 해당하는 조립된 체인을 돌려줍니다. 같은 (task, 설정)이면 항상 같은 객체입니다."""
+    return _compile(task, _SPECS[task]())
+
+
+def warm_chains() -> None:
+    """애플리케이션 시작 시 모든 체인을 미리 조립합니다."""
+    started = time.perf_counter()
+    for task in _SPECS:
+        try:
+            get_chain(task)
+        except Exception as e:
+            print(f"Chain '{task}' warm-up failed: {e}")
+    print(f"Chains warmed: {len(_SPECS)} in {(time.perf_counter() - started) * 1000:.1f}ms")
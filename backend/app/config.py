@@ -37,11 +37,145 @@ LANGSMITH_TRACING = os.getenv("LANGSMITH_TRACING", "false").lower() == "true"
 DIALOGUE_LLM_MODEL = os.getenv("DIALOGUE_LLM_MODEL_NAME", "gpt-4o-mini")  # 기본값 설정
 DIALOGUE_LLM_TEMP = float(os.getenv("DIALOGUE_LLM_TEMPERATURE", "0.7"))  # 기본값 설정
 
+# 에피소드 콘텐츠 생성용 LLM 설정
+EPISODE_LLM_MODEL = os.getenv("MODEL_NAME")
+
 # AI_UTILS 설정
 AI_UTILS_MODEL = os.getenv("AI_UTILS_MODEL_NAME", "gpt-4o-mini")  # 기본값 설정
+EASY_MIN_MODEL = os.getenv("EASY_MIN_MODEL_NAME", "gpt-4o-mini")  # 쉬운 뜻풀이(easy_min)용
 
 OPENSEARCH_RAG_INDEX_NAME = os.getenv(
     "OPENSEARCH_RAG_INDEX_NAME", "works_rag_content_index"
 )
 
 
+# 추측(speculative) 웹 검색 설정: RAG 조회와 동시에 DuckDuckGo 검색을 미리 시작
+SPECULATIVE_WEB_SEARCH = os.getenv("SPECULATIVE_WEB_SEARCH", "false").lower() == "true"
+SPECULATIVE_WEB_MAX_PER_MINUTE = int(os.getenv("SPECULATIVE_WEB_MAX_PER_MINUTE", "30"))
+SPECULATIVE_WEB_WORKERS = int(os.getenv("SPECULATIVE_WEB_WORKERS", "4"))
+# web_search 노드가 추측 검색 결과를 기다리는 최대 시간 (초). 초과하면 다시 검색하지 않고 웹 단계를 버립니다.
+SPECULATIVE_WEB_WAIT_SECONDS = float(os.getenv("SPECULATIVE_WEB_WAIT_SECONDS", "15"))
+
+# 웹 검색 제공자 설정 (duckduckgo | fixture)
+WEB_SEARCH_PROVIDER = os.getenv("WEB_SEARCH_PROVIDER", "duckduckgo").lower()
+WEB_SEARCH_TIMEOUT_SECONDS = float(os.getenv("WEB_SEARCH_TIMEOUT_SECONDS", "8"))
+WEB_SEARCH_MAX_RESULTS = int(os.getenv("WEB_SEARCH_MAX_RESULTS", "10"))  # 캐시 키가 흩어지지 않도록 고정
+WEB_SEARCH_MAX_CONCURRENCY = int(os.getenv("WEB_SEARCH_MAX_CONCURRENCY", "4"))
+WEB_SEARCH_CACHE_TTL_SECONDS = float(os.getenv("WEB_SEARCH_CACHE_TTL_SECONDS", "3600"))
+WEB_SEARCH_CACHE_MAX_ENTRIES = int(os.getenv("WEB_SEARCH_CACHE_MAX_ENTRIES", "1000"))
+WEB_SEARCH_FIXTURE_PATH = os.getenv(
+    "WEB_SEARCH_FIXTURE_PATH",
+    os.path.join(os.path.dirname(__file__), "fixtures", "web_search_fixtures.json"),
+)
+WEB_SEARCH_FIXTURE_LATENCY_MS = float(os.getenv("WEB_SEARCH_FIXTURE_LATENCY_MS", "0"))
+
+# find-related 배치 API 설정
+FIND_RELATED_BATCH_MAX_QUERIES = int(os.getenv("FIND_RELATED_BATCH_MAX_QUERIES", "100"))
+FIND_RELATED_BATCH_CONCURRENCY = int(os.getenv("FIND_RELATED_BATCH_CONCURRENCY", "8"))
+
+# find-related 요청 지연 예산 설정 (0이면 제한 없음)
+FIND_RELATED_DEFAULT_BUDGET_MS = int(os.getenv("FIND_RELATED_DEFAULT_BUDGET_MS", "0"))
+FIND_RELATED_WEB_MIN_BUDGET_MS = int(os.getenv("FIND_RELATED_WEB_MIN_BUDGET_MS", "1500"))
+FIND_RELATED_LLM_MIN_BUDGET_MS = int(os.getenv("FIND_RELATED_LLM_MIN_BUDGET_MS", "800"))
+
+# OpenAI HTTP 클라이언트 공용 설정 (커넥션 풀/keep-alive/타임아웃)
+# OPENAI_BASE_URL을 로컬 stand-in 서버(app.openai_standin)로 지정하면 실제 토큰 없이 부하 테스트가 가능합니다.
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL") or None
+OPENAI_TIMEOUT_SECONDS = float(os.getenv("OPENAI_TIMEOUT_SECONDS", "60"))
+OPENAI_CONNECT_TIMEOUT_SECONDS = float(os.getenv("OPENAI_CONNECT_TIMEOUT_SECONDS", "5"))
+OPENAI_MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", "50"))
+OPENAI_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("OPENAI_MAX_KEEPALIVE_CONNECTIONS", "20"))
+OPENAI_KEEPALIVE_EXPIRY_SECONDS = float(os.getenv("OPENAI_KEEPALIVE_EXPIRY_SECONDS", "30"))
+OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "2"))
+
+# 결정적(저온) LLM 호출 응답 캐시 설정
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+LLM_CACHE_PATH = os.getenv(
+    "LLM_CACHE_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), "llm_cache.sqlite3"),
+)
+LLM_CACHE_TTL_SECONDS = float(os.getenv("LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "50000"))
+LLM_CACHE_MAX_TEMPERATURE = float(os.getenv("LLM_CACHE_MAX_TEMPERATURE", "0.2"))
+
+# 단어장 전체 예문 일괄 생성 설정
+BULK_EXAMPLES_WORDS_PER_CALL = int(os.getenv("BULK_EXAMPLES_WORDS_PER_CALL", "10"))
+BULK_EXAMPLES_PER_WORD = int(os.getenv("BULK_EXAMPLES_PER_WORD", "5"))
+BULK_EXAMPLES_CONCURRENCY = int(os.getenv("BULK_EXAMPLES_CONCURRENCY", "4"))
+BULK_EXAMPLES_JOB_TTL_SECONDS = float(os.getenv("BULK_EXAMPLES_JOB_TTL_SECONDS", "3600"))  # 끝난 작업 상태 보관 시간
+
+# Postgres 기반 백그라운드 작업 큐 설정
+JOB_WORKER_COUNT = int(os.getenv("JOB_WORKER_COUNT", "2"))
+JOB_POLL_INTERVAL_SECONDS = float(os.getenv("JOB_POLL_INTERVAL_SECONDS", "1.0"))
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+JOB_RETRY_BASE_SECONDS = float(os.getenv("JOB_RETRY_BASE_SECONDS", "2"))
+JOB_RETRY_MAX_SECONDS = float(os.getenv("JOB_RETRY_MAX_SECONDS", "300"))
+JOB_LEASE_SECONDS = float(os.getenv("JOB_LEASE_SECONDS", "600"))
+
+# 로컬 OpenAI 호환 stand-in 서버 설정 (app/openai_standin.py)
+STANDIN_LATENCY_DISTRIBUTION = os.getenv("STANDIN_LATENCY_DISTRIBUTION", "lognormal")  # fixed | uniform | lognormal
+STANDIN_FIRST_TOKEN_MS = float(os.getenv("STANDIN_FIRST_TOKEN_MS", "400"))
+STANDIN_FIRST_TOKEN_SPREAD = float(os.getenv("STANDIN_FIRST_TOKEN_SPREAD", "0.5"))
+STANDIN_TOKENS_PER_SECOND = float(os.getenv("STANDIN_TOKENS_PER_SECOND", "60"))
+STANDIN_DEFAULT_COMPLETION_TOKENS = int(os.getenv("STANDIN_DEFAULT_COMPLETION_TOKENS", "120"))
+STANDIN_ERROR_RATE = float(os.getenv("STANDIN_ERROR_RATE", "0"))
+STANDIN_SEED = os.getenv("STANDIN_SEED")
+STANDIN_RESPONSES_PATH = os.getenv(
+    "STANDIN_RESPONSES_PATH",
+    os.path.join(os.path.dirname(__file__), "fixtures", "openai_standin_responses.json"),
+)
+
+# 프롬프트 토큰 예산 설정 (0이면 자르지 않음)
+PROMPT_CONTEXT_TOKEN_BUDGET = int(os.getenv("PROMPT_CONTEXT_TOKEN_BUDGET", "1500"))
+PROMPT_MIN_DOC_TOKENS = int(os.getenv("PROMPT_MIN_DOC_TOKENS", "50"))
+EPISODE_CONTENT_TOKEN_BUDGET = int(os.getenv("EPISODE_CONTENT_TOKEN_BUDGET", "6000"))
+
+# 에피소드 목록 요약의 본문 미리보기 길이 (글자 수)
+EPISODE_PREVIEW_CHARS = int(os.getenv("EPISODE_PREVIEW_CHARS", "120"))
+
+# OpenAI 호출 공용 스케줄러 설정 (동시성/토큰 상한, 429 백오프)
+LLM_SCHEDULER_ENABLED = os.getenv("LLM_SCHEDULER_ENABLED", "true").lower() == "true"
+LLM_MAX_CONCURRENT_REQUESTS = int(os.getenv("LLM_MAX_CONCURRENT_REQUESTS", "16"))
+LLM_MAX_CONCURRENT_TOKENS = int(os.getenv("LLM_MAX_CONCURRENT_TOKENS", "60000"))
+LLM_DEFAULT_COMPLETION_TOKENS = int(os.getenv("LLM_DEFAULT_COMPLETION_TOKENS", "512"))
+LLM_SCHEDULER_MAX_RETRIES = int(os.getenv("LLM_SCHEDULER_MAX_RETRIES", "4"))
+LLM_SCHEDULER_MAX_QUEUE_SECONDS = float(os.getenv("LLM_SCHEDULER_MAX_QUEUE_SECONDS", "60"))
+LLM_BACKOFF_BASE_SECONDS = float(os.getenv("LLM_BACKOFF_BASE_SECONDS", "0.5"))
+LLM_BACKOFF_MAX_SECONDS = float(os.getenv("LLM_BACKOFF_MAX_SECONDS", "30"))
+
+# SBERT 임베딩 기반 의미(semantic) 응답 캐시 설정
+SEMANTIC_CACHE_ENABLED = os.getenv("SEMANTIC_CACHE_ENABLED", "true").lower() == "true"
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.93"))
+SEMANTIC_CACHE_MAX_ENTRIES = int(os.getenv("SEMANTIC_CACHE_MAX_ENTRIES", "5000"))
+SEMANTIC_CACHE_TTL_SECONDS = float(os.getenv("SEMANTIC_CACHE_TTL_SECONDS", str(24 * 3600)))
+SEMANTIC_CACHE_SAMPLE_RATE = float(os.getenv("SEMANTIC_CACHE_SAMPLE_RATE", "0.1"))
+SEMANTIC_CACHE_SAMPLE_SIZE = int(os.getenv("SEMANTIC_CACHE_SAMPLE_SIZE", "200"))
+
+# 단어 저장 직후 AI 결과(예문/쉬운 뜻/관련 단어) 미리 생성
+WORD_ENRICHMENT_ENABLED = os.getenv("WORD_ENRICHMENT_ENABLED", "true").lower() == "true"
+
+# 데이터베이스 연결 풀 설정 (database.create_db_engine 하나만 사용)
+DATABASE_URL = os.getenv("DATABASE_URL")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT_SECONDS = float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30"))
+DB_POOL_RECYCLE_SECONDS = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "30000"))  # PostgreSQL만, 0이면 끔
+
+# 단어 정렬 목록 keyset 페이지네이션
+WORD_PAGE_MAX_LIMIT = int(os.getenv("WORD_PAGE_MAX_LIMIT", "200"))
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# 단어 조회수 write-behind 버퍼 (조회마다 UPDATE하지 않고 모아서 반영)
+VIEW_COUNT_FLUSH_SECONDS = float(os.getenv("VIEW_COUNT_FLUSH_SECONDS", "5"))
+VIEW_COUNT_MAX_PENDING_WORDS = int(os.getenv("VIEW_COUNT_MAX_PENDING_WORDS", "5000"))
+VIEW_COUNT_FLUSH_BATCH_SIZE = int(os.getenv("VIEW_COUNT_FLUSH_BATCH_SIZE", "1000"))
+
+# 사용자 단어장 검색 (pg_trgm / tsvector, PostgreSQL 전용)
+SEARCH_DEFAULT_LIMIT = int(os.getenv("SEARCH_DEFAULT_LIMIT", "20"))
+SEARCH_MAX_LIMIT = int(os.getenv("SEARCH_MAX_LIMIT", "100"))
+SEARCH_MAX_OFFSET = int(os.getenv("SEARCH_MAX_OFFSET", "1000"))  # 깊은 offset은 앞 행을 모두 정렬해야 해서 제한
+SEARCH_MAX_QUERY_LENGTH = int(os.getenv("SEARCH_MAX_QUERY_LENGTH", "100"))
+SEARCH_FUZZY_THRESHOLD = float(os.getenv("SEARCH_FUZZY_THRESHOLD", "0.4"))  # word_similarity 하한 (0~1)
+SEARCH_PREVIEW_CHARS = int(os.getenv("SEARCH_PREVIEW_CHARS", "120"))
@@ -5,4 +5,8 @@ from . import episodes
 from . import characters  
 from . import worlds 
 from . import plannings
-from . import word_examples
\ No newline at end of file
+from . import word_examples
+from . import jobs
+from . import word_enrichments
+from . import search
+from . import aio
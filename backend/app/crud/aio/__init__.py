@@ -0,0 +1,7 @@
+# 비동기(AsyncSession) 버전의 자주 호출되는 조회 CRUD.
+# 응답 스키마가 읽는 관계는 selectinload로 미리 불러옵니다 (비동기 세션은 지연 로딩을 할 수 없음).
+from . import words
+from . import word_examples
+from . import works
+from . import episodes
+from . import search
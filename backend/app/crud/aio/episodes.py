@@ -0,0 +1,42 @@
+from typing import List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
+
+from ... import models
+from ..episodes import episode_summaries_query
+
+_WITH_CONTENT = undefer(models.Episode.episode_content)
+
+
+async def get_episodes_by_work_id(db: AsyncSession, work_id: int) -> List[models.Episode]:
+    """
+    특정 작품(work_id)에 속한 모든 에피소드 목록을 조회합니다.
+    """
+    result = await db.execute(
+        select(models.Episode).options(_WITH_CONTENT).where(models.Episode.works_id == work_id)
+    )
+    return list(result.scalars().all())
+
+
+async def get_episode_summaries_by_work_id(db: AsyncSession, work_id: int):
+    """
+    특정 작품(work_id)에 속한 에피소드 요약 목록(미리보기, 길이)을 조회합니다.
+    """
+    result = await db.execute(episode_summaries_query(work_id))
+    return result.all()
+
+
+async def get_episode_by_id_and_work_id(
+    db: AsyncSession, work_id: int, episode_id: int
+) -> Optional[models.Episode]:
+    """
+    특정 작품(work_id)에 속한 특정 에피소드(episode_id)를 조회합니다.
+    """
+    result = await db.execute(
+        select(models.Episode)
+        .options(_WITH_CONTENT)
+        .where(models.Episode.episode_id == episode_id, models.Episode.works_id == work_id)
+    )
+    return result.scalars().first()
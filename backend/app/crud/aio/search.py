@@ -0,0 +1,18 @@
+from typing import List, Optional, Tuple
+
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..search import fuzzy_threshold_statement, split_search_page, word_search_query
+
+
+async def search_words(
+    db: AsyncSession, user_id: str, q: str, mode: str = "substring", limit: int = 20, offset: int = 0
+) -> Tuple[List[Row], Optional[int]]:
+    """사용자 단어장 검색 (한 페이지와 다음 offset을 반환). 모드가 잘못되면 ValueError."""
+    stmt = word_search_query(user_id, q, mode, limit, offset)
+    if mode == "fuzzy":
+        # 같은 트랜잭션 안에서만 유효한 설정이므로 검색 쿼리보다 먼저 실행합니다.
+        await db.execute(fuzzy_threshold_statement())
+    result = await db.execute(stmt)
+    return split_search_page(list(result.all()), limit, offset)
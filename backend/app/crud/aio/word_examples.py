@@ -0,0 +1,34 @@
+from typing import List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ... import models
+
+
+# 단어 예문 조회
+async def get_word_examples_by_word_id(
+    db: AsyncSession, word_id: int
+) -> List[models.WordExample]:
+    """특정 단어에 속한 모든 예문을 조회합니다."""
+    result = await db.execute(
+        select(models.WordExample)
+        .where(models.WordExample.words_id == word_id)
+        .order_by(models.WordExample.example_sequence)
+    )
+    return list(result.scalars().all())
+
+
+async def get_word_example_by_ids(
+    db: AsyncSession, word_id: int, example_sequence: int
+) -> Optional[models.WordExample]:
+    """
+    특정 단어 ID와 예문 시퀀스 번호로 단일 예문을 조회합니다.
+    """
+    result = await db.execute(
+        select(models.WordExample).where(
+            models.WordExample.words_id == word_id,
+            models.WordExample.example_sequence == example_sequence,
+        )
+    )
+    return result.scalars().first()
@@ -0,0 +1,72 @@
+from typing import List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from ... import models
+from ..words import sorted_words_query, split_page
+
+
+def _word_query():
+    # schemas.Word 응답에 examples가 포함되므로 함께 불러옵니다.
+    return select(models.Word).options(selectinload(models.Word.examples))
+
+
+async def get_word_by_id(db: AsyncSession, word_id: int) -> Optional[models.Word]:
+    result = await db.execute(_word_query().where(models.Word.words_id == word_id))
+    return result.scalars().first()
+
+
+async def get_word_by_id_and_user_id(
+    db: AsyncSession, word_id: int, user_id: str
+) -> Optional[models.Word]:
+    """특정 사용자의 특정 단어를 ID로 조회합니다."""
+    result = await db.execute(
+        _word_query().where(models.Word.words_id == word_id, models.Word.user_id == user_id)
+    )
+    return result.scalars().first()
+
+
+# 단어 이름으로 단어 조회
+async def get_word_by_name_and_user(
+    db: AsyncSession, word_name: str, user_id: str
+) -> Optional[models.Word]:
+    result = await db.execute(
+        _word_query().where(models.Word.word_name == word_name, models.Word.user_id == user_id)
+    )
+    return result.scalars().first()
+
+
+async def _sorted_words_page(
+    db: AsyncSession, user_id: str, sort: str, cursor: Optional[str], limit: Optional[int]
+) -> Tuple[List[models.Word], Optional[str]]:
+    stmt = sorted_words_query(user_id, sort, cursor, limit).options(
+        selectinload(models.Word.examples)
+    )
+    result = await db.execute(stmt)
+    return split_page(sort, list(result.scalars().all()), limit)
+
+
+# 단어 카운트 수로 정렬 (한 페이지와 다음 페이지 커서를 반환, limit이 없으면 전체)
+async def get_words_by_user_sorted_by_count(
+    db: AsyncSession, user_id: str, cursor: Optional[str] = None, limit: Optional[int] = None
+) -> Tuple[List[models.Word], Optional[str]]:
+    return await _sorted_words_page(db, user_id, "count", cursor, limit)
+
+
+# 단어 생성 시간으로 정렬
+async def get_words_by_user_sorted_by_created_time(
+    db: AsyncSession, user_id: str, cursor: Optional[str] = None, limit: Optional[int] = None
+) -> Tuple[List[models.Word], Optional[str]]:
+    return await _sorted_words_page(db, user_id, "created_time", cursor, limit)
+
+
+async def get_word_explanation_by_name(
+    db: AsyncSession, word_name: str, user_id: Optional[str] = None
+) -> Optional[str]:
+    stmt = select(models.Word.word_content).where(models.Word.word_name == word_name)
+    if user_id is not None:
+        stmt = stmt.where(models.Word.user_id == user_id)
+    result = await db.execute(stmt.limit(1))
+    return result.scalars().first()
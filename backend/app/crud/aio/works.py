@@ -0,0 +1,53 @@
+from typing import List, Optional
+
+from sqlalchemy import exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ... import models
+from ..works import work_children_options, work_summaries_query
+
+
+def _work_query():
+    return select(models.Work).options(*work_children_options())
+
+
+async def get_works_by_user_id(db: AsyncSession, user_id: str) -> List[models.Work]:
+    """
+    특정 사용자의 모든 작품 목록을 조회합니다.
+    """
+    result = await db.execute(_work_query().where(models.Work.user_id == user_id))
+    return list(result.scalars().all())
+
+
+async def get_work_by_id(db: AsyncSession, work_id: int) -> Optional[models.Work]:
+    """
+    작품 ID로 특정 작품을 하위 요소와 함께 조회합니다.
+    """
+    result = await db.execute(_work_query().where(models.Work.works_id == work_id))
+    return result.scalars().first()
+
+
+async def get_work_by_id_and_user_id(
+    db: AsyncSession, work_id: int, user_id: str
+) -> Optional[models.Work]:
+    """
+    작품 ID와 사용자 ID로 특정 작품을 조회합니다. (소유권 확인용)
+    """
+    result = await db.execute(
+        _work_query().where(models.Work.works_id == work_id, models.Work.user_id == user_id)
+    )
+    return result.scalars().first()
+
+
+async def get_work_summaries_by_user_id(db: AsyncSession, user_id: str):
+    """
+    특정 사용자의 작품 요약 목록(ID, 제목, 하위 요소 개수)을 조회합니다.
+    """
+    result = await db.execute(work_summaries_query(user_id))
+    return result.all()
+
+
+async def work_exists(db: AsyncSession, work_id: int) -> bool:
+    """하위 요소를 불러오지 않고 작품 존재 여부만 확인합니다."""
+    result = await db.execute(select(exists().where(models.Work.works_id == work_id)))
+    return bool(result.scalar())
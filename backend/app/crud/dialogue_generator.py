@@ -1,23 +1,100 @@
-from openai import OpenAI
+from typing import AsyncIterator, Dict, List
 from app.config import OPENAI_API_KEY, DIALOGUE_LLM_MODEL, DIALOGUE_LLM_TEMP
+from app.llm_clients import get_openai_client, get_async_openai_client
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+from .. import crud, schemas
 
-if OPENAI_API_KEY:
-    client = OpenAI(api_key=OPENAI_API_KEY)
-else:
+if not OPENAI_API_KEY:
     print("Warning: OPENAI_API_KEY is not set. Dialogue generation will not work.")
-    client = None
 
 
-def generate_dialogue_from_context(
+def load_dialogue_context(
+    db: Session, work_id: int, request: schemas.DialogueGenerationRequest
+) -> dict:
+    """대사 생성에 필요한 작품/에피소드/캐릭터/계획 컨텍스트를 DB에서 조회합니다."""
+    db_work = crud.works.get_work_by_id(db, work_id=work_id)
+    if not db_work:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"ID가 {work_id}인 작품을 찾을 수 없습니다.",
+        )
+    worlds_content_data = (
+        db_work.worlds_content
+        if hasattr(db_work, "worlds_content")
+        else "세계관 정보 없음"
+    )
+    episode_content_data = "에피소드 정보 없음"
+    if request.context_ids.episode_id is not None:
+        db_episode = (
+            crud.episodes.get_episode_by_id_and_work_id(  
+                db, work_id=work_id, episode_id=request.context_ids.episode_id
+            )
+        )
+        if not db_episode:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"작품 ID {work_id}에 에피소드 ID {request.context_ids.episode_id}를 찾을 수 없습니다.",
+            )
+        episode_content_data = (
+            db_episode.episode_content
+            if hasattr(db_episode, "episode_content")
+            else "에피소드 내용 없음"
+        )
+    character_settings_data = "캐릭터 설정 정보 없음"
+    if request.context_ids.character_id is not None:
+        if hasattr(crud, "characters") and hasattr(
+            crud.characters, "get_character_by_id_and_work_id"
+        ):
+            db_character = crud.characters.get_character_by_id_and_work_id(
+                db, work_id=work_id, character_id=request.context_ids.character_id
+            )
+            if not db_character:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"작품 ID {work_id}에 캐릭터 ID {request.context_ids.character_id}를 찾을 수 없습니다.",
+                )
+            character_settings_data = (
+                db_character.character_settings
+                if hasattr(db_character, "character_settings")
+                else "캐릭터 설정 없음"
+            )
+        else:
+            print(
+                f"Warning: crud.characters.get_character_by_id_and_work_id function not found. Skipping character settings."
+            )
+    plan_content_data = "스토리 계획 정보 없음"
+    if request.context_ids.plan_id is not None:
+        db_plan = (
+            crud.plannings.get_planning_by_id_and_work_id(  
+                db, work_id=work_id, plan_id=request.context_ids.plan_id
+            )
+        )
+        if not db_plan:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"작품 ID {work_id}에 계획 ID {request.context_ids.plan_id}를 찾을 수 없습니다.",
+            )
+        plan_content_data = (
+            db_plan.plan_content
+            if hasattr(db_plan, "plan_content")
+            else "스토리 계획 내용 없음"
+        )
+    return {
+        "worlds_content": worlds_content_data,
+        "episode_content": episode_content_data,
+        "character_settings": character_settings_data,
+        "plan_content": plan_content_data,
+    }
+
+
+def _build_dialogue_messages(
     worlds_content: str,
     episode_content: str,
     character_settings: str,
     plan_content: str,
     prompt: str,
-) -> str:
-    if not client:
-        raise ConnectionError("OpenAI client is not initialized. Check API key.")
-
+) -> List[Dict[str, str]]:
     system_message = """
     당신은 창의적인 스토리 작가입니다. 주어진 세계관, 에피소드 내용, 캐릭터 설정, 스토리 계획을 바탕으로,
     사용자의 요청에 가장 적합하고 자연스러운 대사를 생성해야 합니다.
@@ -46,14 +123,29 @@ def generate_dialogue_from_context(
 
     ### 생성할 대사:
     """  
+    return [
+        {"role": "system", "content": system_message},
+        {"role": "user", "content": full_prompt},
+    ]
+
 
+def generate_dialogue_from_context(
+    worlds_content: str,
+    episode_content: str,
+    character_settings: str,
+    plan_content: str,
+    prompt: str,
+) -> str:
+    if not OPENAI_API_KEY:
+        raise ConnectionError("OpenAI client is not initialized. Check API key.")
+
+    messages = _build_dialogue_messages(
+        worlds_content, episode_content, character_settings, plan_content, prompt
+    )
     try:
-        response = client.chat.completions.create(
+        response = get_openai_client().chat.completions.create(
             model=DIALOGUE_LLM_MODEL,
-            messages=[
-                {"role": "system", "content": system_message},
-                {"role": "user", "content": full_prompt},
-            ],
+            messages=messages,
             temperature=DIALOGUE_LLM_TEMP,
             max_tokens=200,  
         )
@@ -62,3 +154,32 @@ def generate_dialogue_from_context(
     except Exception as e:
         print(f"Error during OpenAI API call: {e}")
         raise  
+
+
+async def stream_dialogue_from_context(
+    worlds_content: str,
+    episode_content: str,
+    character_settings: str,
+    plan_content: str,
+    prompt: str,
+) -> AsyncIterator[str]:
+    """generate_dialogue_from_context의 스트리밍 버전. 제너레이터가 닫히면 업스트림 스트림도 닫습니다."""
+    if not OPENAI_API_KEY:
+        raise ConnectionError("OpenAI client is not initialized. Check API key.")
+
+    messages = _build_dialogue_messages(
+        worlds_content, episode_content, character_settings, plan_content, prompt
+    )
+    stream = await get_async_openai_client().chat.completions.create(
+        model=DIALOGUE_LLM_MODEL,
+        messages=messages,
+        temperature=DIALOGUE_LLM_TEMP,
+        max_tokens=200,
+        stream=True,
+    )
+    try:
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    finally:
+        await stream.close()
@@ -0,0 +1,45 @@
+# app/crud/episode_generator.py
+from langchain_core.runnables import Runnable
+from app.chains import EPISODE_CONTENT_PROMPT, get_chain
+from app.config import EPISODE_LLM_MODEL, EPISODE_CONTENT_TOKEN_BUDGET
+from app.prompt_budget import count_tokens, truncate_middle, log_prompt_stats
+
+
+def episode_prompt_inputs(existing_content: str, user_additional_prompt: str) -> dict:
+    # 긴 에피소드는 앞/뒤를 남기고 가운데를 잘라 EPISODE_CONTENT_TOKEN_BUDGET 안에 맞춥니다.
+    model = EPISODE_LLM_MODEL or ""
+    tokens_in = count_tokens(existing_content, model)
+    if EPISODE_CONTENT_TOKEN_BUDGET > 0 and tokens_in > EPISODE_CONTENT_TOKEN_BUDGET:
+        existing_content = truncate_middle(
+            existing_content, EPISODE_CONTENT_TOKEN_BUDGET, model
+        )
+    inputs = {
+        "existing_content": (
+            existing_content if existing_content else "내용 없음"
+        ),
+        "additional_prompt": (
+            user_additional_prompt
+            if user_additional_prompt
+            else "특별한 추가 요청 없음"
+        ),
+    }
+    log_prompt_stats(
+        "episode.rewrite",
+        EPISODE_CONTENT_PROMPT.format(**inputs),
+        model,
+        {
+            "context_tokens_in": tokens_in,
+            "context_tokens_out": count_tokens(existing_content, model),
+        },
+    )
+    return inputs
+
+
+def get_episode_chain() -> Runnable:
+    return get_chain("episode_content")
+
+
+def generate_episode_content(existing_content: str, user_additional_prompt: str) -> str:
+    return get_episode_chain().invoke(
+        episode_prompt_inputs(existing_content, user_additional_prompt)
+    )
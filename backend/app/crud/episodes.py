@@ -1,6 +1,11 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, undefer
 from typing import List, Optional
 from .. import models, schemas  
+from ..config import EPISODE_PREVIEW_CHARS
+
+# 본문(episode_content)은 지연 로딩 컬럼이라 개별/목록 조회에서는 함께 불러옵니다.
+_WITH_CONTENT = undefer(models.Episode.episode_content)
 
 
 def create_work_episode(
@@ -23,7 +28,37 @@ def get_episodes_by_work_id(db: Session, work_id: int) -> List[models.Episode]:
     """
     특정 작품(work_id)에 속한 모든 에피소드 목록을 조회합니다.
     """
-    return db.query(models.Episode).filter(models.Episode.works_id == work_id).all()
+    return (
+        db.query(models.Episode)
+        .options(_WITH_CONTENT)
+        .filter(models.Episode.works_id == work_id)
+        .all()
+    )
+
+
+def episode_summaries_query(work_id: int):
+    """
+    에피소드 목록 화면용 요약 쿼리. 본문 전체 대신 앞부분 미리보기와 길이를 SQL에서 계산합니다.
+    (crud.aio.episodes도 같은 쿼리를 사용)
+    """
+    content = func.coalesce(models.Episode.episode_content, "")
+    return (
+        select(
+            models.Episode.episode_id,
+            models.Episode.works_id,
+            func.substr(content, 1, EPISODE_PREVIEW_CHARS).label("preview"),
+            func.length(content).label("content_length"),
+        )
+        .where(models.Episode.works_id == work_id)
+        .order_by(models.Episode.episode_id)
+    )
+
+
+def get_episode_summaries_by_work_id(db: Session, work_id: int):
+    """
+    특정 작품(work_id)에 속한 에피소드 요약 목록을 조회합니다.
+    """
+    return db.execute(episode_summaries_query(work_id)).all()
 
 
 def get_episode_by_id_and_work_id(
@@ -35,6 +70,7 @@ def get_episode_by_id_and_work_id(
     """
     return (
         db.query(models.Episode)
+        .options(_WITH_CONTENT)
         .filter(
             models.Episode.episode_id == episode_id, models.Episode.works_id == work_id
         )
@@ -50,6 +86,7 @@ def get_episode_by_work_and_episode_id(
     """
     return (
         db.query(models.Episode)
+        .options(_WITH_CONTENT)
         .filter(
             models.Episode.works_id == work_id, models.Episode.episode_id == episode_id
         )
@@ -282,6 +319,7 @@ def get_episode_by_ids(
     """
     return (
         db.query(models.Episode)
+        .options(_WITH_CONTENT)
         .filter(
             models.Episode.episode_id == episode_id, models.Episode.works_id == work_id
         )
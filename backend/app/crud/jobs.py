@@ -0,0 +1,179 @@
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+
+from .. import models
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+# 작업 등록
+def enqueue_job(
+    db: Session, job_type: str, payload: Dict[str, Any], max_attempts: int
+) -> models.Job:
+    db_job = models.Job(
+        job_type=job_type,
+        status="queued",
+        payload=payload,
+        attempts=0,
+        max_attempts=max_attempts,
+        run_after=_utcnow(),
+    )
+    db.add(db_job)
+    db.commit()
+    db.refresh(db_job)
+    return db_job
+
+
+# 작업 조회
+def get_job_by_id(db: Session, job_id: int) -> Optional[models.Job]:
+    return db.query(models.Job).filter(models.Job.job_id == job_id).first()
+
+
+def claim_next_job(
+    db: Session, worker_id: str, lease_seconds: float
+) -> Optional[models.Job]:
+    """
+    실행할 작업 하나를 가져와 running 상태로 바꿉니다.
+    SELECT ... FOR UPDATE SKIP LOCKED로 다른 워커가 잡고 있는 행은 건너뛰며,
+    워커가 죽어 lease가 만료된 running 작업도 다시 가져옵니다.
+    """
+    while True:
+        now = _utcnow()
+        db_job = (
+            db.query(models.Job)
+            .filter(
+                or_(
+                    and_(models.Job.status == "queued", models.Job.run_after <= now),
+                    and_(
+                        models.Job.status == "running",
+                        models.Job.lease_expires_at < now,
+                    ),
+                )
+            )
+            .order_by(models.Job.run_after, models.Job.job_id)
+            .with_for_update(skip_locked=True)
+            .limit(1)
+            .first()
+        )
+        if not db_job:
+            db.commit()
+            return None
+
+        if db_job.status == "running" and db_job.attempts >= db_job.max_attempts:
+            # 재시도 횟수를 모두 쓴 작업이 lease 만료로 남아 있으면 실패 처리하고 다음 작업을 찾습니다.
+            db_job.status = "failed"
+            db_job.error = db_job.error or "Worker lease expired"
+            db_job.finished_at = now
+            db_job.locked_by = None
+            db_job.lease_expires_at = None
+            db.commit()
+            continue
+
+        db_job.status = "running"
+        db_job.attempts = (db_job.attempts or 0) + 1
+        db_job.locked_by = worker_id
+        db_job.started_at = now
+        db_job.lease_expires_at = now + timedelta(seconds=lease_seconds)
+        db.commit()
+        db.refresh(db_job)
+        return db_job
+
+
+def _owned_by(job_id: int, worker_id: str, attempt: int):
+    # lease가 만료돼 다른 워커(또는 다음 시도)가 가져간 작업이면 조건이 거짓이 됩니다.
+    return and_(
+        models.Job.job_id == job_id,
+        models.Job.status == "running",
+        models.Job.locked_by == worker_id,
+        models.Job.attempts == attempt,
+    )
+
+
+def extend_job_lease(
+    db: Session, job_id: int, worker_id: str, attempt: int, lease_seconds: float
+) -> bool:
+    """실행 중인 작업의 lease를 연장합니다. 작업을 더 이상 갖고 있지 않으면 False."""
+    updated = (
+        db.query(models.Job)
+        .filter(_owned_by(job_id, worker_id, attempt))
+        .update(
+            {models.Job.lease_expires_at: _utcnow() + timedelta(seconds=lease_seconds)},
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+    return updated == 1
+
+
+def complete_job(db: Session, job_id: int, worker_id: str, attempt: int, result: Any) -> bool:
+    """성공을 기록합니다. 그 사이 다른 워커가 작업을 가져갔으면 아무것도 바꾸지 않고 False."""
+    updated = db.query(models.Job).filter(_owned_by(job_id, worker_id, attempt)).update(
+        {
+            models.Job.status: "succeeded",
+            models.Job.result: result,
+            models.Job.error: None,
+            models.Job.progress: 1.0,
+            models.Job.finished_at: _utcnow(),
+            models.Job.locked_by: None,
+            models.Job.lease_expires_at: None,
+        },
+        synchronize_session=False,
+    )
+    db.commit()
+    return updated == 1
+
+
+def fail_job(
+    db: Session,
+    job_id: int,
+    worker_id: str,
+    attempt: int,
+    error: str,
+    retryable: bool,
+    retry_base_seconds: float,
+    retry_max_seconds: float,
+) -> str:
+    """
+    실패를 기록합니다. 재시도 가능하고 시도 횟수가 남아 있으면
+    지수 백오프(+지터) 뒤에 다시 queued 상태로 돌리고, 아니면 failed로 끝냅니다.
+    바뀐 상태를 반환합니다 (다른 워커가 가져간 작업이면 "lost").
+    """
+    db_job = db.query(models.Job).filter(models.Job.job_id == job_id).with_for_update().first()
+    if not db_job:
+        db.commit()
+        return "missing"
+    if (
+        db_job.status != "running"
+        or db_job.locked_by != worker_id
+        or db_job.attempts != attempt
+    ):
+        db.commit()
+        return "lost"
+
+    now = _utcnow()
+    if retryable and db_job.attempts < db_job.max_attempts:
+        delay = min(retry_max_seconds, retry_base_seconds * (2 ** (db_job.attempts - 1)))
+        delay = delay * random.uniform(0.5, 1.0)
+        db_job.status = "queued"
+        db_job.run_after = now + timedelta(seconds=delay)
+    else:
+        db_job.status = "failed"
+        db_job.finished_at = now
+    db_job.error = error
+    db_job.locked_by = None
+    db_job.lease_expires_at = None
+    db.commit()
+    return db_job.status
+
+
+def update_job_progress(db: Session, job_id: int, progress: float) -> None:
+    db.query(models.Job).filter(models.Job.job_id == job_id).update(
+        {models.Job.progress: progress}, synchronize_session=False
+    )
+    db.commit()
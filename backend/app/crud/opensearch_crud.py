@@ -178,7 +178,11 @@ def search_relevant_documents(
         response = os_client.search(
             index=RAG_WORKS_CONTENT_INDEX_NAME, body=search_body
         )
-        return [hit["_source"] for hit in response["hits"]["hits"]]
+        # 프롬프트 예산 배분(prompt_budget)에서 순위로 쓰도록 검색 점수를 함께 돌려줍니다.
+        return [
+            {**hit["_source"], "score": hit.get("_score")}
+            for hit in response["hits"]["hits"]
+        ]
     except NotFoundError:
         print(f"Index {RAG_WORKS_CONTENT_INDEX_NAME} not found during search.")
         return []
@@ -1,15 +1,23 @@
 # app/crud/plannings.py
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer
 from typing import List, Optional
 from .. import models, schemas
 
+# 본문(plan_content)은 지연 로딩 컬럼이라 개별/목록 조회에서는 함께 불러옵니다.
+_WITH_CONTENT = undefer(models.Planning.plan_content)
+
 
 def get_planning_by_id(db: Session, plan_id: int) -> Optional[models.Planning]:
     """
     플랜 ID로 특정 플랜을 조회합니다.
     """
-    return db.query(models.Planning).filter(models.Planning.plan_id == plan_id).first()
+    return (
+        db.query(models.Planning)
+        .options(_WITH_CONTENT)
+        .filter(models.Planning.plan_id == plan_id)
+        .first()
+    )
 
 
 def get_planning_by_id_and_work_id(
@@ -21,6 +29,7 @@ def get_planning_by_id_and_work_id(
     """
     return (
         db.query(models.Planning)
+        .options(_WITH_CONTENT)
         .filter(models.Planning.plan_id == plan_id, models.Planning.works_id == work_id)
         .first()
     )
@@ -34,6 +43,7 @@ def get_plannings_by_work_id(
     """
     return (
         db.query(models.Planning)
+        .options(_WITH_CONTENT)
         .filter(models.Planning.works_id == work_id)
         .all()
     )
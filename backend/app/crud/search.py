@@ -0,0 +1,168 @@
+from typing import List, Optional, Tuple
+
+from sqlalchemy import Float, case, cast, distinct, literal, literal_column, select, text, union_all
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+from .. import models
+from ..config import SEARCH_FUZZY_THRESHOLD, SEARCH_PREVIEW_CHARS
+
+# --- 사용자 단어장 검색 (PostgreSQL 전용) ---
+# 검색 대상은 단어 이름 / 설명 / 예문이고, 모드마다 쓰는 인덱스가 다릅니다 (models.SEARCH_DDL).
+#   substring: ILIKE '%q%'            -> gin_trgm_ops 인덱스
+#   fuzzy:     q <% 컬럼 (word_similarity) -> gin_trgm_ops 인덱스, 오타/일부 일치 허용
+#   fulltext:  search_vector @@ websearch_to_tsquery -> tsvector GIN 인덱스
+# 대상마다 따로 조회해 UNION ALL로 합치므로 각 조회가 자기 인덱스를 탑니다.
+# 단어별로 가장 높은 점수를 쓰고, 어디에서 일치했는지(matched_in)를 함께 돌려줍니다.
+SEARCH_MODES = ("substring", "fuzzy", "fulltext")
+
+# 일치한 위치별 가중치 (이름 > 설명 > 예문)
+_CONTENT_WEIGHT = 0.8
+_EXAMPLE_WEIGHT = 0.6
+
+# 생성 컬럼은 모델에 매핑하지 않았으므로 이름으로 참조합니다.
+_WORD_TSV = literal_column("words.search_vector")
+_EXAMPLE_TSV = literal_column("word_examples.search_vector")
+
+
+def _escape_like(q: str) -> str:
+    return q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _constant(value):
+    # UNION / CASE 안의 바인드 파라미터는 PostgreSQL이 text로 추론하므로 상수로 넣습니다.
+    return literal_column(repr(value))
+
+
+def _branches(mode: str, q: str):
+    """(일치 위치, 조건, 점수, 예문 대상 여부) 목록."""
+    Word, Example = models.Word, models.WordExample
+    if mode == "substring":
+        pattern = f"%{_escape_like(q)}%"
+        lowered = q.lower()
+        name_score = case(
+            (func.lower(Word.word_name) == lowered, _constant(1.0)),
+            (func.lower(Word.word_name).startswith(lowered, autoescape=True), _constant(0.9)),
+            else_=_constant(0.7),
+        )
+        return [
+            ("name", Word.word_name.ilike(pattern, escape="\\"), name_score, False),
+            ("content", Word.word_content.ilike(pattern, escape="\\"), _constant(0.5), False),
+            ("example", Example.word_example_content.ilike(pattern, escape="\\"), _constant(0.4), True),
+        ]
+    if mode == "fuzzy":
+        query = literal(q)
+        return [
+            ("name", query.op("<%")(Word.word_name), func.word_similarity(query, Word.word_name), False),
+            (
+                "content",
+                query.op("<%")(Word.word_content),
+                func.word_similarity(query, Word.word_content) * _CONTENT_WEIGHT,
+                False,
+            ),
+            (
+                "example",
+                query.op("<%")(Example.word_example_content),
+                func.word_similarity(query, Example.word_example_content) * _EXAMPLE_WEIGHT,
+                True,
+            ),
+        ]
+    if mode == "fulltext":
+        tsquery = func.websearch_to_tsquery("simple", q)
+        # 이름(A 가중치)과 설명(B)이 한 tsvector에 있으므로 이름 일치 여부만 따로 확인합니다.
+        name_matches = func.to_tsvector("simple", func.coalesce(Word.word_name, "")).op("@@")(tsquery)
+        return [
+            (
+                case((name_matches, literal_column("'name'")), else_=literal_column("'content'")),
+                _WORD_TSV.op("@@")(tsquery),
+                # 정규화 32: rank / (rank + 1), 0~1 범위
+                func.ts_rank_cd(_WORD_TSV, tsquery, 32),
+                False,
+            ),
+            (
+                "example",
+                _EXAMPLE_TSV.op("@@")(tsquery),
+                func.ts_rank_cd(_EXAMPLE_TSV, tsquery, 32) * _EXAMPLE_WEIGHT,
+                True,
+            ),
+        ]
+    raise ValueError(f"Unknown search mode '{mode}'. Available: {list(SEARCH_MODES)}")
+
+
+def word_search_query(user_id: str, q: str, mode: str, limit: int, offset: int = 0):
+    """
+    사용자 단어 검색 쿼리. 점수 내림차순(같으면 조회수, 최신 ID 순)으로 정렬하고
+    다음 페이지 존재 여부를 알 수 있도록 limit + 1행을 가져옵니다. 모드가 잘못되면 ValueError.
+    """
+    Word, Example = models.Word, models.WordExample
+    branches = []
+    for source, condition, score, on_examples in _branches(mode, q):
+        if isinstance(source, str):
+            source = literal_column(f"'{source}'")
+        stmt = select(
+            Word.words_id.label("words_id"),
+            cast(score, Float).label("score"),
+            source.label("source"),
+        )
+        if on_examples:
+            stmt = stmt.select_from(Example).join(Word, Word.words_id == Example.words_id)
+        branches.append(stmt.where(Word.user_id == user_id, condition))
+
+    hits = union_all(*branches).subquery("hits")
+    ranked = (
+        select(
+            hits.c.words_id,
+            func.max(hits.c.score).label("score"),
+            func.array_agg(distinct(hits.c.source)).label("matched_in"),
+        )
+        .group_by(hits.c.words_id)
+        .subquery("ranked")
+    )
+    return (
+        select(
+            Word.words_id,
+            Word.user_id,
+            Word.word_name,
+            func.left(Word.word_content, SEARCH_PREVIEW_CHARS).label("word_preview"),
+            Word.word_count,
+            Word.word_created_time,
+            ranked.c.score,
+            ranked.c.matched_in,
+        )
+        .join(ranked, ranked.c.words_id == Word.words_id)
+        .order_by(
+            ranked.c.score.desc(),
+            func.coalesce(Word.word_count, 0).desc(),
+            Word.words_id.desc(),
+        )
+        .offset(offset)
+        .limit(limit + 1)
+    )
+
+
+def fuzzy_threshold_statement():
+    """
+    fuzzy 모드의 `<%` 연산자가 쓰는 임계값을 현재 트랜잭션에만 설정합니다.
+    (word_similarity(...) >= x 로 거르면 인덱스를 쓰지 못하므로 연산자 + GUC를 씁니다.)
+    """
+    return text("SELECT set_config('pg_trgm.word_similarity_threshold', :threshold, true)").bindparams(
+        threshold=str(SEARCH_FUZZY_THRESHOLD)
+    )
+
+
+def split_search_page(rows: List[Row], limit: int, offset: int) -> Tuple[List[Row], Optional[int]]:
+    """limit + 1로 가져온 결과를 (이번 페이지, 다음 offset)으로 나눕니다."""
+    if len(rows) <= limit:
+        return rows, None
+    return rows[:limit], offset + limit
+
+
+def search_words(
+    db: Session, user_id: str, q: str, mode: str = "substring", limit: int = 20, offset: int = 0
+) -> Tuple[List[Row], Optional[int]]:
+    stmt = word_search_query(user_id, q, mode, limit, offset)
+    if mode == "fuzzy":
+        db.execute(fuzzy_threshold_statement())
+    rows = db.execute(stmt).all()
+    return split_search_page(list(rows), limit, offset)
@@ -0,0 +1,74 @@
+from typing import Any, List, Optional
+
+from sqlalchemy.orm import Session
+
+from .. import models
+
+
+# 단어 ID로 미리 생성된 AI 결과 조회
+def get_enrichment(db: Session, words_id: int) -> Optional[models.WordEnrichment]:
+    return (
+        db.query(models.WordEnrichment)
+        .filter(models.WordEnrichment.words_id == words_id)
+        .first()
+    )
+
+
+# 단어 이름으로 완료된 AI 결과 조회 (해당 사용자의 단어만)
+def get_ready_enrichment_by_word_name(
+    db: Session, word_name: str, user_id: str
+) -> Optional[models.WordEnrichment]:
+    """사용자 단어의 준비된 AI 결과. 결과는 그 사용자의 설명으로 만든 것이라 다른 사용자와 공유하지 않습니다."""
+    return (
+        db.query(models.WordEnrichment)
+        .join(models.Word, models.Word.words_id == models.WordEnrichment.words_id)
+        .filter(
+            models.Word.word_name == word_name,
+            models.Word.user_id == user_id,
+            models.WordEnrichment.status == "ready",
+        )
+        .first()
+    )
+
+
+# 생성 대기 상태로 표시 (없으면 새로 만듦)
+def mark_enrichment_pending(db: Session, words_id: int) -> models.WordEnrichment:
+    db_enrichment = get_enrichment(db, words_id)
+    if db_enrichment is None:
+        db_enrichment = models.WordEnrichment(words_id=words_id, status="pending")
+        db.add(db_enrichment)
+    else:
+        db_enrichment.status = "pending"
+        db_enrichment.error = None
+    db.commit()
+    db.refresh(db_enrichment)
+    return db_enrichment
+
+
+def save_enrichment(
+    db: Session,
+    words_id: int,
+    examples: Optional[str],
+    easy_meaning: Optional[str],
+    related_words: Optional[List[Any]],
+    error: Optional[str] = None,
+) -> Optional[models.WordEnrichment]:
+    """
+    생성 결과를 저장합니다. 하나라도 만들어졌으면 ready, 모두 실패했으면 failed.
+    그 사이 단어가 삭제되었으면 None을 반환합니다.
+    """
+    if db.get(models.Word, words_id) is None:
+        return None
+    db_enrichment = get_enrichment(db, words_id)
+    if db_enrichment is None:
+        db_enrichment = models.WordEnrichment(words_id=words_id)
+        db.add(db_enrichment)
+    db_enrichment.examples = examples
+    db_enrichment.easy_meaning = easy_meaning
+    db_enrichment.related_words = related_words
+    db_enrichment.error = error
+    has_result = examples is not None or easy_meaning is not None or related_words is not None
+    db_enrichment.status = "ready" if has_result else "failed"
+    db.commit()
+    db.refresh(db_enrichment)
+    return db_enrichment
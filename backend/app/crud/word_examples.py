@@ -1,22 +1,22 @@
-from langchain_openai import ChatOpenAI  
-from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import ChatPromptTemplate
-from openai import OpenAI
-from app.config import OPENAI_API_KEY, AI_UTILS_MODEL
-from langchain_openai import ChatOpenAI
-from langchain.prompts import ChatPromptTemplate
-from typing import Dict, Any, Optional
-from langchain.schema.output_parser import StrOutputParser
-from .. import crud, models, schemas, database
+from app.config import OPENAI_API_KEY, AI_UTILS_MODEL, BULK_EXAMPLES_PER_WORD
+from app.llm_clients import get_chat_model
+from app.chains import get_chain
+from app.semantic_cache import get_semantic_cache
+from typing import Dict, Any, List, Optional
+from pydantic import BaseModel, Field
+from sqlalchemy import insert
+from sqlalchemy.sql import func
+from .. import models, schemas
 from sqlalchemy.orm import Session
+import hashlib
 import os
+import re
+import json
 from fastapi import HTTPException
 
-if OPENAI_API_KEY:
-    client = OpenAI(api_key=OPENAI_API_KEY)
-else:
+if not OPENAI_API_KEY:
     print("Warning: OPENAI_API_KEY is not set. Dialogue generation will not work.")
-    client = None
 
 
 def exsen(word: str) -> dict:
@@ -38,30 +38,18 @@ def exsen(word: str) -> dict:
                 "examples": "",
             }
 
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                (
-                    "system",
-                    "사용자가 제공한 단어와 관련된 다양한 예문 5개를 길지 않게 생성하라. "
-                    "각 예문은 서로 다른 구조와 어휘와 형용사형 전성 어미, 동사형 접미사를 사용하여 해당 단어의 다양한 활용형을 포함해야 한다. "
-                    "예문의 내용을 설명하지 말 것. "
-                    "사용자가 제공한 단어 부분을 볼드체로 하라. "
-                    "글머리를 넣지 마라. "
-                    "부가적인 요소를 추가하지 마라.",
-                ),
-                ("human", "{input}"),
-            ]
-        )
-
-        llm = ChatOpenAI(
-            model=AI_UTILS_MODEL, 
-            temperature=0.8,
-            max_tokens=500,
-        )
-
-        chain = prompt | llm | StrOutputParser()
-
-        result = chain.invoke({"input": word})
+        semantic_cache = get_semantic_cache("exsen")
+        result = None
+        if semantic_cache:
+            # 비슷한 이웃 단어의 예문은 요청한 단어를 포함하지 않으므로, 의미 매칭은 예문에 단어가 있을 때만 씁니다.
+            target = word.strip()
+            result = semantic_cache.lookup(
+                word, accept=lambda examples: isinstance(examples, str) and target in examples
+            )
+        if result is None:
+            result = get_chain("exsen").invoke({"input": word})
+            if semantic_cache:
+                semantic_cache.store(word, result)
 
         return {
             "success": True,
@@ -107,30 +95,7 @@ def bring_exsen(word_id: int, db: Session) -> Dict[str, Any]:
                 detail=f"ID {word_id}에 해당하는 단어를 찾을 수 없습니다.",
             )
 
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                (
-                    "system",
-                    f"""'{word.word_name}'와 관련된 다양한 예문 5개를 길지 않게 생성하라.
-            각 예문은 서로 다른 구조와 어휘와 형용사형 전성 어미, 동사형 접미사를 사용하여 해당 단어의 다양한 활용형을 포함해야 한다.
-            예문의 내용을 설명하지 말 것.
-            사용자가 제공한 단어 부분을 볼드체로 하라.
-            글머리를 넣지 마라.
-            부가적인 요소를 추가하지 마라.
-            한국어로 생성해.""",
-                )
-            ]
-        )
-
-        llm = ChatOpenAI(
-            model=AI_UTILS_MODEL,
-            temperature=0.8,
-            max_tokens=500,
-        )
-
-        chain = prompt | llm | StrOutputParser()
-
-        result = chain.invoke({"word": word.word_name})
+        result = get_chain("bring_exsen").invoke({"word": word.word_name})
 
         return {
             "success": True,
@@ -148,6 +113,79 @@ def bring_exsen(word_id: int, db: Session) -> Dict[str, Any]:
         }
 
 
+def easy_min(word: str) -> dict:
+    """
+    단어의 뜻을 아주 쉽게 설명하는 함수
+    
+    Args:
+        word (str): 뜻을 생성할 단어
+        
+    Returns:
+        dict: 결과를 포함한 딕셔너리
+    """
+    try:
+        if not word or word.strip() == "":
+            return {
+                "success": False,
+                "message": "단어를 입력해주세요.",
+                "word": word,
+                "easy_meaning": ""
+            }
+
+        result = get_chain("easy_min").invoke({"input": word})
+        
+        return {
+            "success": True,
+            "message": "쉬운 단어 설명 생성 완료",
+            "word": word,
+            "easy_meaning": result
+        }
+        
+    except Exception as e:
+        return {
+            "success": False,
+            "message": f"오류가 발생했습니다: {str(e)}",
+            "word": word,
+            "easy_meaning": ""
+        }
+
+
+def generate_related_words(
+    word_name: str, explanation: str, user_id: Optional[str] = None
+) -> List[Any]:
+    """
+    단어 설명을 바탕으로 유사 단어 목록을 생성합니다.
+    LLM 결과가 JSON 리스트로 파싱되지 않으면 ValueError.
+    캐시는 단어로 찾되, 설명은 사용자마다 다르므로 (사용자, 설명 해시)가 같은 항목끼리만 매칭합니다.
+    비슷한 단어의 목록에는 요청한 단어가 들어 있을 수 있으므로 그런 의미 매칭 결과는 쓰지 않습니다.
+    """
+    semantic_cache = get_semantic_cache("related_words")
+    explanation_hash = hashlib.sha256((explanation or "").encode("utf-8")).hexdigest()
+    scope = f"{user_id or ''}:{explanation_hash}"
+    cached = None
+    if semantic_cache:
+        target = word_name.strip()
+        cached = semantic_cache.lookup(
+            word_name,
+            scope=scope,
+            accept=lambda words: isinstance(words, list)
+            and all(str(w).strip() != target for w in words),
+        )
+    if cached is not None:
+        return cached
+
+    result = get_chain("related_words").invoke({"word": word_name, "explanation": explanation})
+    raw_output = getattr(result, "content", str(result))
+
+    # 마크다운 코드 블록 제거
+    json_text = re.sub(r"```json|```", "", raw_output).strip()
+    related_words = json.loads(json_text)  # JSONDecodeError는 ValueError의 하위 클래스
+
+    if semantic_cache:
+        semantic_cache.store(word_name, related_words, scope=scope)
+    return related_words
+
+
 def get_word_example_by_ids(
     db: Session, word_id: int, example_sequence: int
 ) -> Optional[models.WordExample]:
@@ -192,3 +230,99 @@ def delete_word_example(db: Session, db_example: models.WordExample) -> None:
     db.delete(db_example)
     db.commit()
     return None 
+
+
+class _WordExamples(BaseModel):
+    word: str = Field(description="입력으로 받은 단어 (그대로)")
+    examples: List[str] = Field(description="해당 단어의 예문 목록")
+
+
+class _WordExamplesBatch(BaseModel):
+    items: List[_WordExamples]
+
+
+BULK_EXAMPLES_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        (
+            "system",
+            "사용자가 제공한 단어 목록의 각 단어마다 다양한 예문 {examples_per_word}개를 길지 않게 생성하라. "
+            "각 예문은 서로 다른 구조와 어휘와 형용사형 전성 어미, 동사형 접미사를 사용하여 해당 단어의 다양한 활용형을 포함해야 한다. "
+            "예문의 내용을 설명하지 말 것. "
+            "해당 단어 부분을 볼드체로 하라. "
+            "글머리를 넣지 마라. "
+            "한국어로 생성해. "
+            "items의 word에는 입력받은 단어를 그대로 적어라.",
+        ),
+        ("human", "{words}"),
+    ]
+)
+
+
+def generate_examples_for_words(words: List[str]) -> Dict[str, List[str]]:
+    """
+    여러 단어의 예문을 한 번의 structured-output LLM 호출로 생성하고 단어별로 나눠 반환합니다.
+    응답에서 누락된 단어는 결과 딕셔너리에 포함되지 않습니다.
+    """
+    llm = get_chat_model(AI_UTILS_MODEL, 0.8).with_structured_output(_WordExamplesBatch)
+    chain = BULK_EXAMPLES_PROMPT | llm
+    batch: _WordExamplesBatch = chain.invoke(
+        {
+            "examples_per_word": BULK_EXAMPLES_PER_WORD,
+            "words": "\n".join(words),
+        }
+    )
+
+    requested = {w.strip(): w for w in words}
+    results: Dict[str, List[str]] = {}
+    for item in batch.items:
+        original = requested.get(item.word.strip())
+        examples = [e.strip() for e in item.examples if e and e.strip()]
+        if original is not None and examples:
+            results[original] = examples[:BULK_EXAMPLES_PER_WORD]
+    return results
+
+
+def get_last_example_sequences(db: Session, word_ids: List[int]) -> Dict[int, int]:
+    """여러 단어의 마지막 예문 시퀀스 번호를 한 번의 GROUP BY 쿼리로 조회합니다."""
+    if not word_ids:
+        return {}
+    rows = (
+        db.query(
+            models.WordExample.words_id,
+            func.max(models.WordExample.example_sequence),
+        )
+        .filter(models.WordExample.words_id.in_(word_ids))
+        .group_by(models.WordExample.words_id)
+        .all()
+    )
+    return {words_id: last_sequence for words_id, last_sequence in rows}
+
+
+def bulk_create_word_examples(
+    db: Session, examples_by_word_id: Dict[int, List[str]]
+) -> int:
+    """
+    여러 단어의 예문을 기존 예문 뒤 순번으로 이어 붙여 한 번의 INSERT로 저장합니다.
+    저장한 예문 수를 반환합니다.
+    """
+    last_sequences = get_last_example_sequences(db, list(examples_by_word_id.keys()))
+    rows = []
+    for word_id, examples in examples_by_word_id.items():
+        start = last_sequences.get(word_id, 0)
+        for offset, content in enumerate(examples, start=1):
+            rows.append(
+                {
+                    "words_id": word_id,
+                    "example_sequence": start + offset,
+                    "word_example_content": content,
+                }
+            )
+    if not rows:
+        return 0
+    try:
+        db.execute(insert(models.WordExample), rows)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return len(rows)
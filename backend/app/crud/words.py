@@ -1,25 +1,88 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from sqlalchemy import DateTime, case, inspect, select, tuple_, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.sql import func
-from sqlalchemy.orm import Session
-from typing import Optional, List
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.orm import Session, selectinload
+from typing import Any, Dict, Optional, List, Tuple
 from .. import models, schemas
 from fastapi import HTTPException
 
 
-# 유저별 단어 추가
-def create_user_word(db: Session, word_data: schemas.WordCreate):
-    db_word = get_word_by_name_and_user(
-        db, word_name=word_data.word_name, user_id=word_data.user_id
+_ON_CONFLICT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+_word_name_index_ready: Optional[bool] = None
+
+
+def _has_word_name_unique_index(db: Session) -> bool:
+    """(user_id, word_name) 고유 인덱스가 실제로 있는지 프로세스당 한 번 확인합니다."""
+    global _word_name_index_ready
+    if _word_name_index_ready is None:
+        indexes = inspect(db.get_bind()).get_indexes(models.Word.__tablename__)
+        _word_name_index_ready = any(
+            index["name"] == models.WORD_NAME_UNIQUE_INDEX and index.get("unique")
+            for index in indexes
+        )
+        if not _word_name_index_ready:
+            print(
+                f"!!! Index {models.WORD_NAME_UNIQUE_INDEX} is missing (duplicate words?); "
+                "creating words with lookup + INSERT instead of ON CONFLICT."
+            )
+    return _word_name_index_ready
+
+
+def _insert_word_on_conflict(db: Session, insert, word_data: schemas.WordCreate) -> models.Word:
+    stmt = (
+        insert(models.Word)
+        .values(
+            user_id=word_data.user_id,
+            word_name=word_data.word_name,
+            word_content=word_data.word_content,
+        )
+        .on_conflict_do_nothing(index_elements=["user_id", "word_name"])
+        .returning(models.Word)
     )
-    if db_word:
+    db_word = db.scalars(stmt).first()
+    if db_word is None:
+        db.rollback()
         raise HTTPException(status_code=400, detail="Word already exists for this user")
+    return db_word
+
 
+def _insert_word_checked(db: Session, word_data: schemas.WordCreate) -> models.Word:
+    """ON CONFLICT를 쓸 수 없을 때: 조회 후 INSERT. 그 사이 생긴 중복 등 제약 위반은 400."""
+    if get_word_by_name_and_user(db, word_data.word_name, word_data.user_id):
+        raise HTTPException(status_code=400, detail="Word already exists for this user")
     db_word = models.Word(
         user_id=word_data.user_id,
         word_name=word_data.word_name,
         word_content=word_data.word_content,
     )
     db.add(db_word)
-    db.flush()  
+    try:
+        db.flush()
+    except IntegrityError as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=f"Could not create word: {e.orig}")
+    return db_word
+
+
+# 유저별 단어 추가
+def create_user_word(db: Session, word_data: schemas.WordCreate):
+    """
+    (user_id, word_name) 고유 인덱스에 기대어 INSERT ... ON CONFLICT DO NOTHING RETURNING 한 번으로 추가합니다.
+    이미 있으면(동시 요청 포함) 아무 행도 돌아오지 않으므로 400.
+    인덱스가 없거나 ON CONFLICT를 지원하지 않는 DB에서는 조회 후 INSERT로 대신합니다.
+    """
+    insert = _ON_CONFLICT_INSERTS.get(db.get_bind().dialect.name)
+    if insert is not None and _has_word_name_unique_index(db):
+        db_word = _insert_word_on_conflict(db, insert, word_data)
+    else:
+        db_word = _insert_word_checked(db, word_data)
 
     if word_data.examples:
         for i, example_data in enumerate(word_data.examples):
@@ -72,7 +135,10 @@ def delete_word(db: Session, word_id: int):
 
 
 # 단어 이름으로 단어 조회
-def get_word_by_name(db: Session, word_name: str):
+# user_id를 주면 (user_id, word_name) 고유 인덱스로 찾습니다. 없으면 이전처럼 아무 사용자의 단어나 하나.
+def get_word_by_name(db: Session, word_name: str, user_id: Optional[str] = None):
+    if user_id is not None:
+        return get_word_by_name_and_user(db, word_name=word_name, user_id=user_id)
     return db.query(models.Word).filter(models.Word.word_name == word_name).first()
 
 
@@ -121,45 +187,125 @@ def get_word_examples_by_word_id(db: Session, word_id: int) -> List[models.WordE
     )
 
 
-# 단어 카운트 수로 정렬
-def get_words_by_user_sorted_by_count(db: Session, user_id: str):
-    return (
-        db.query(models.Word)
-        .filter(models.Word.user_id == user_id)
-        .order_by(models.Word.word_count.desc())
-        .all()
-    )
+# --- 정렬 목록 keyset 페이지네이션 ---
+# (정렬 키, words_id) 내림차순으로 정렬하고, 커서는 마지막 행의 두 값을 담습니다.
+# models.Word의 ix_words_user_count_id / ix_words_user_created_id 인덱스 순서와 같아야 합니다.
+class _sortable_time(FunctionElement):
+    """
+    정렬/커서 비교용 시각. 대부분의 DB에서는 컬럼(값) 그대로지만, SQLite는 시각을 문자열로 저장하고
+    server_default(func.now())는 '2026-10-19 04:40:05', 바인드한 datetime은 '... .000000'처럼
+    형식이 달라 문자열 비교가 틀어지므로 julianday()로 숫자로 바꿔 컬럼과 커서 값을 같은 기준으로 비교합니다.
+    """
 
+    type = DateTime()
+    name = "sortable_time"
+    inherit_cache = True
 
-# 단어 생성 시간으로 정렬
-def get_words_by_user_sorted_by_created_time(db: Session, user_id: str):
-    return (
-        db.query(models.Word)
-        .filter(models.Word.user_id == user_id)
-        .order_by(models.Word.word_created_time.desc())
-        .all()
-    )
 
+@compiles(_sortable_time)
+def _compile_sortable_time(element, compiler, **kw):
+    return compiler.process(element.clauses, **kw)
 
-def increment_word_count_atomic(db: Session, word_id: int):
-    db_word = db.query(models.Word).filter(models.Word.words_id == word_id).first()
-    if db_word:
-        if db_word.word_count is None:
-            db.query(models.Word).filter(models.Word.words_id == word_id).update(
-                {models.Word.word_count: 1}, synchronize_session=False
-            )
-        else:
-            db.query(models.Word).filter(models.Word.words_id == word_id).update(
-                {models.Word.word_count: models.Word.word_count + 1},
-                synchronize_session=False,
-            )
 
-        db.commit()
-        db.refresh(db_word)
-        return db_word
-    return None
+@compiles(_sortable_time, "sqlite")
+def _compile_sortable_time_sqlite(element, compiler, **kw):
+    return f"julianday({compiler.process(element.clauses, **kw)})"
+
+
+WORD_SORT_KEYS = {
+    "count": lambda: func.coalesce(models.Word.word_count, 0),
+    "created_time": lambda: _sortable_time(models.Word.word_created_time),
+}
+
+
+def _sort_value(sort: str, db_word: models.Word):
+    if sort == "count":
+        return db_word.word_count or 0
+    return db_word.word_created_time.isoformat()
+
+
+def encode_word_cursor(sort: str, db_word: models.Word) -> str:
+    raw = json.dumps({"k": _sort_value(sort, db_word), "id": db_word.words_id})
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_word_cursor(sort: str, cursor: str) -> Tuple[Any, int]:
+    """잘못된 커서는 ValueError."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        key, words_id = data["k"], int(data["id"])
+        if sort == "count":
+            return int(key), words_id
+        return datetime.fromisoformat(key), words_id
+    except (KeyError, TypeError, ValueError, binascii.Error) as e:
+        raise ValueError(f"Invalid cursor: {e}")
+
+
+def sorted_words_query(
+    user_id: str, sort: str, cursor: Optional[str] = None, limit: Optional[int] = None
+):
+    """
+    사용자 단어 목록 정렬 쿼리. cursor가 있으면 그 다음 행부터, limit이 있으면 limit + 1행을 가져옵니다
+    (한 행 더 가져와 다음 페이지 존재 여부를 판단).
+    """
+    sort_key = WORD_SORT_KEYS[sort]()
+    stmt = select(models.Word).where(models.Word.user_id == user_id)
+    if cursor:
+        key, words_id = decode_word_cursor(sort, cursor)
+        if sort == "created_time":
+            key = _sortable_time(key)
+        stmt = stmt.where(tuple_(sort_key, models.Word.words_id) < tuple_(key, words_id))
+    stmt = stmt.order_by(sort_key.desc(), models.Word.words_id.desc())
+    if limit is not None:
+        stmt = stmt.limit(limit + 1)
+    return stmt
+
+
+def split_page(
+    sort: str, rows: List[models.Word], limit: Optional[int]
+) -> Tuple[List[models.Word], Optional[str]]:
+    """limit + 1로 가져온 결과를 (이번 페이지, 다음 커서)로 나눕니다."""
+    if limit is None or len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    return page, encode_word_cursor(sort, page[-1])
+
+
+# 단어 카운트 수로 정렬 (전체 목록, 페이지 단위 조회는 crud.aio.words)
+def get_words_by_user_sorted_by_count(db: Session, user_id: str) -> List[models.Word]:
+    stmt = sorted_words_query(user_id, "count").options(selectinload(models.Word.examples))
+    return db.execute(stmt).scalars().all()
+
+
+# 단어 생성 시간으로 정렬
+def get_words_by_user_sorted_by_created_time(db: Session, user_id: str) -> List[models.Word]:
+    stmt = sorted_words_query(user_id, "created_time").options(selectinload(models.Word.examples))
+    return db.execute(stmt).scalars().all()
+
+
+# 조회수 일괄 반영 (view_counter의 write-behind 플러시용)
+def bulk_increment_word_counts(db: Session, deltas: Dict[int, int]) -> int:
+    """
+    {words_id: 증가량}을 UPDATE 한 번(CASE words_id ...)으로 반영하고 갱신된 행 수를 반환합니다.
+    """
+    if not deltas:
+        return 0
+    result = db.execute(
+        update(models.Word)
+        .where(models.Word.words_id.in_(list(deltas)))
+        .values(
+            word_count=func.coalesce(models.Word.word_count, 0)
+            + case(deltas, value=models.Word.words_id, else_=0)
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount
 
 
-def get_word_explanation_by_name(db: Session, word_name: str) -> Optional[str]:
-    word = db.query(models.Word).filter(models.Word.word_name == word_name).first()
+def get_word_explanation_by_name(
+    db: Session, word_name: str, user_id: Optional[str] = None
+) -> Optional[str]:
+    word = get_word_by_name(db, word_name, user_id=user_id)
     return word.word_content if word else None
\ No newline at end of file
@@ -1,5 +1,6 @@
+from sqlalchemy import exists, select
 from sqlalchemy.sql import func
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from typing import Optional, List
 from .. import models, schemas
 from sqlalchemy.inspection import inspect
@@ -22,21 +23,87 @@ def create_user_work(
     return db_work
 
 
+def work_children_options():
+    """
+    schemas.Work가 직렬화하는 하위 목록(characters, worlds, plannings, episodes)을 미리 불러오는 옵션.
+    관계마다 IN 쿼리 한 번(selectinload)이라 작품 수와 관계없이 1 + 4번으로 고정됩니다.
+    (joinedload는 네 개의 일대다를 한 번에 조인하면 행이 곱으로 늘어나므로 쓰지 않습니다.)
+    상세 응답이므로 지연 로딩 본문 컬럼도 같은 쿼리에서 함께 불러옵니다.
+    """
+    return (
+        selectinload(models.Work.characters),
+        selectinload(models.Work.worlds).undefer(models.World.worlds_content),
+        selectinload(models.Work.plannings).undefer(models.Planning.plan_content),
+        selectinload(models.Work.episodes).undefer(models.Episode.episode_content),
+    )
+
+
 def get_works_by_user_id(db: Session, user_id: str) -> List[models.Work]:
     """
-    특정 사용자의 모든 작품 목록을 조회합니다.
+    특정 사용자의 모든 작품 목록을 하위 요소와 함께 조회합니다.
     """
-    return db.query(models.Work).filter(models.Work.user_id == user_id).all()
+    return (
+        db.query(models.Work)
+        .options(*work_children_options())
+        .filter(models.Work.user_id == user_id)
+        .all()
+    )
 
 
 def get_work_by_id(db: Session, work_id: int) -> Optional[models.Work]:
     """
-    작품 ID로 특정 작품을 조회합니다.
-    이때 연관된 Characters, Worlds 등도 함께 로드될 수 있도록 relationship 설정이 중요합니다.
-    (기본적으로 lazy='select'이므로, 접근 시 추가 쿼리가 발생할 수 있음)
-    효율을 위해 joined loading (e.g., options(joinedload(models.Work.characters))) 등을 고려할 수 있습니다.
+    작품 ID로 특정 작품을 하위 요소와 함께 조회합니다.
+    """
+    return (
+        db.query(models.Work)
+        .options(*work_children_options())
+        .filter(models.Work.works_id == work_id)
+        .first()
+    )
+
+
+def work_exists(db: Session, work_id: int) -> bool:
+    """
+    하위 요소를 불러오지 않고 작품 존재 여부만 확인합니다. (하위 요소 추가/수정 전 확인용)
+    """
+    return db.query(exists().where(models.Work.works_id == work_id)).scalar()
+
+
+def _child_count(model):
+    return (
+        select(func.count())
+        .select_from(model)
+        .where(model.works_id == models.Work.works_id)
+        .correlate(models.Work)
+        .scalar_subquery()
+    )
+
+
+def work_summaries_query(user_id: str):
+    """
+    작품 목록 화면용 요약 쿼리. 하위 요소 본문은 읽지 않고 개수만 SQL에서 셉니다.
+    (crud.aio.works도 같은 쿼리를 사용)
+    """
+    return (
+        select(
+            models.Work.works_id,
+            models.Work.user_id,
+            models.Work.works_title,
+            _child_count(models.Character).label("character_count"),
+            _child_count(models.World).label("world_count"),
+            _child_count(models.Planning).label("planning_count"),
+            _child_count(models.Episode).label("episode_count"),
+        )
+        .where(models.Work.user_id == user_id)
+        .order_by(models.Work.works_id)
+    )
+
+
+def get_work_summaries_by_user_id(db: Session, user_id: str):
+    """
+    특정 사용자의 작품 요약 목록(ID, 제목, 하위 요소 개수)을 조회합니다.
     """
-    return db.query(models.Work).filter(models.Work.works_id == work_id).first()
+    return db.execute(work_summaries_query(user_id)).all()
 
 
 # 소유권 확인을 위한 함수 
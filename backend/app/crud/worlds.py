@@ -1,14 +1,22 @@
 # app/crud/worlds.py
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer
 from typing import List, Optional
 from .. import models, schemas
 
+# 본문(worlds_content)은 지연 로딩 컬럼이라 개별/목록 조회에서는 함께 불러옵니다.
+_WITH_CONTENT = undefer(models.World.worlds_content)
+
 
 def get_world_by_id(db: Session, world_id: int) -> Optional[models.World]:
     """
     세계관 ID로 특정 세계관을 조회합니다.
     """
-    return db.query(models.World).filter(models.World.worlds_id == world_id).first()
+    return (
+        db.query(models.World)
+        .options(_WITH_CONTENT)
+        .filter(models.World.worlds_id == world_id)
+        .first()
+    )
 
 
 def get_world_by_id_and_work_id(
@@ -20,6 +28,7 @@ def get_world_by_id_and_work_id(
     """
     return (
         db.query(models.World)
+        .options(_WITH_CONTENT)
         .filter(models.World.worlds_id == world_id, models.World.works_id == work_id)
         .first()
     )
@@ -33,6 +42,7 @@ def get_worlds_by_work_id(
     """
     return (
         db.query(models.World)
+        .options(_WITH_CONTENT)
         .filter(models.World.works_id == work_id)
         .all()
     )
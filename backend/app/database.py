@@ -1,17 +1,116 @@
-import os
-from sqlalchemy import create_engine
+import time
+from functools import lru_cache
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL, Engine, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import sessionmaker
-from dotenv import load_dotenv
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from .config import (
+    DATABASE_URL,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT_SECONDS,
+    DB_POOL_RECYCLE_SECONDS,
+    DB_POOL_PRE_PING,
+    DB_STATEMENT_TIMEOUT_MS,
+)
+from .metrics import metrics
 
-load_dotenv(dotenv_path="../.env")
-print("DATABASE_URL =", os.getenv("DATABASE_URL"))
-SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL")
+SQLALCHEMY_DATABASE_URL = DATABASE_URL
 
 if not SQLALCHEMY_DATABASE_URL:
     raise ValueError("DATABASE_URL environment variable not set.")
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+
+class _WaitTimingMixin:
+    """커넥션을 빌려줄 때 풀에서 기다린 시간({metric_prefix}.wait)을 기록합니다."""
+
+    metric_prefix = "db.pool"
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except Exception:
+            metrics.increment(f"{self.metric_prefix}.checkout_failed")
+            raise
+        finally:
+            metrics.observe(f"{self.metric_prefix}.wait", time.perf_counter() - started)
+
+
+class InstrumentedQueuePool(_WaitTimingMixin, QueuePool):
+    metric_prefix = "db.pool"
+
+
+class InstrumentedAsyncQueuePool(_WaitTimingMixin, AsyncAdaptedQueuePool):
+    metric_prefix = "db.async_pool"
+
+
+def _instrument(engine: Engine, metric_prefix: str, reporter_name: str) -> None:
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        connection_record.info["checked_out_at"] = time.perf_counter()
+        metrics.increment(f"{metric_prefix}.checkouts")
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        checked_out_at = connection_record.info.pop("checked_out_at", None)
+        if checked_out_at is not None:
+            metrics.observe(f"{metric_prefix}.held", time.perf_counter() - checked_out_at)
+
+    def pool_status():
+        pool = engine.pool
+        if not isinstance(pool, QueuePool):
+            return {"pool_class": type(pool).__name__}
+        return {
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+            "max_overflow": DB_MAX_OVERFLOW,
+        }
+
+    metrics.register_reporter(reporter_name, pool_status)
+
+
+def _pool_kwargs(backend: str, poolclass) -> dict:
+    kwargs = {"pool_pre_ping": DB_POOL_PRE_PING}
+    # sqlite는 파일/메모리 여부에 따라 SQLAlchemy가 맞는 풀을 고르게 둡니다.
+    if backend != "sqlite":
+        kwargs.update(
+            poolclass=poolclass,
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT_SECONDS,
+            pool_recycle=DB_POOL_RECYCLE_SECONDS,
+        )
+    return kwargs
+
+
+def create_db_engine(url: str = SQLALCHEMY_DATABASE_URL) -> Engine:
+    """
+    앱 전체가 공유하는 엔진을 만듭니다. 풀 크기 / pre-ping / recycle은 config에서,
+    PostgreSQL이면 커넥션마다 statement_timeout을 겁니다.
+    """
+    backend = make_url(url).get_backend_name()
+    kwargs = _pool_kwargs(backend, InstrumentedQueuePool)
+    if backend == "postgresql" and DB_STATEMENT_TIMEOUT_MS > 0:
+        kwargs["connect_args"] = {"options": f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}"}
+
+    db_engine = create_engine(url, **kwargs)
+    _instrument(db_engine, "db.pool", "db_pool")
+    return db_engine
+
+
+engine = create_db_engine()
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -24,3 +123,50 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# --- 비동기 경로 (asyncpg) ---
+# 동기 엔진과 같은 DATABASE_URL / 풀 설정을 쓰고 드라이버만 바꿉니다.
+# asyncpg가 필요한 시점에만 만들도록 지연 생성합니다.
+_ASYNC_DRIVERS = {"postgresql": "postgresql+asyncpg", "sqlite": "sqlite+aiosqlite"}
+
+
+def _async_url(url: str) -> URL:
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in _ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for database backend '{backend}'")
+    return parsed.set(drivername=_ASYNC_DRIVERS[backend])
+
+
+@lru_cache(maxsize=1)
+def get_async_engine() -> AsyncEngine:
+    url = _async_url(SQLALCHEMY_DATABASE_URL)
+    backend = url.get_backend_name()
+    kwargs = _pool_kwargs(backend, InstrumentedAsyncQueuePool)
+    if backend == "postgresql" and DB_STATEMENT_TIMEOUT_MS > 0:
+        kwargs["connect_args"] = {
+            "server_settings": {"statement_timeout": str(DB_STATEMENT_TIMEOUT_MS)}
+        }
+
+    async_engine = create_async_engine(url, **kwargs)
+    _instrument(async_engine.sync_engine, "db.async_pool", "db_async_pool")
+    return async_engine
+
+
+@lru_cache(maxsize=1)
+def get_async_sessionmaker() -> async_sessionmaker:
+    # 커밋 후에도 응답 직렬화에서 속성을 읽을 수 있도록 expire하지 않습니다 (비동기에서는 지연 로딩 불가).
+    return async_sessionmaker(
+        get_async_engine(), autoflush=False, expire_on_commit=False, class_=AsyncSession
+    )
+
+
+async def get_async_db():
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+
+async def dispose_async_engine() -> None:
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
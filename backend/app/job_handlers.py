@@ -0,0 +1,122 @@
+# app/job_handlers.py
+from typing import Optional
+
+from fastapi import HTTPException
+from pydantic import BaseModel, Field
+
+from . import crud, database, schemas
+from .bulk_examples import BulkExampleJob, run_bulk_examples
+from .crud import dialogue_generator, episode_generator
+from .job_queue import JobContext, PermanentJobError, register_job_handler
+from .word_enrichment import WORD_ENRICHMENT_JOB_TYPE, enrich_word
+
+
+class EpisodeAIContentPayload(BaseModel):
+    work_id: int
+    episode_id: int
+    additional_prompt: Optional[str] = None
+
+
+class DialogueWithContextPayload(schemas.DialogueGenerationRequest):
+    work_id: int
+
+
+class WordExamplesPayload(BaseModel):
+    word: str = Field(..., min_length=1)
+
+
+class WordEnrichmentPayload(BaseModel):
+    words_id: int
+
+
+class BulkExamplesPayload(BaseModel):
+    user_id: str
+    only_missing: bool = True
+
+
+@register_job_handler("episode_ai_content", EpisodeAIContentPayload)
+def run_episode_ai_content(payload: EpisodeAIContentPayload, ctx: JobContext) -> dict:
+    """generate_and_update_ai_episode_content와 같은 작업을 요청 밖에서 수행합니다."""
+    db = database.SessionLocal()
+    try:
+        db_episode = crud.episodes.get_episode_by_work_and_episode_id(
+            db=db, work_id=payload.work_id, episode_id=payload.episode_id
+        )
+        if not db_episode:
+            raise PermanentJobError("Episode not found")
+        existing_content = db_episode.episode_content or ""
+    finally:
+        db.close()
+
+    content = episode_generator.generate_episode_content(
+        existing_content, payload.additional_prompt or ""
+    )
+    if not content or not content.strip():
+        raise ValueError("AI failed to generate valid content. The response was empty.")
+
+    db = database.SessionLocal()
+    try:
+        updated = crud.episodes.update_episode_content(
+            db=db,
+            work_id=payload.work_id,
+            episode_id=payload.episode_id,
+            content=content,
+        )
+        if not updated:
+            raise PermanentJobError("Episode not found")
+        return {
+            "work_id": payload.work_id,
+            "episode_id": payload.episode_id,
+            "episode_content": updated.episode_content,
+        }
+    finally:
+        db.close()
+
+
+@register_job_handler("dialogue_with_context", DialogueWithContextPayload)
+def run_dialogue_with_context(payload: DialogueWithContextPayload, ctx: JobContext) -> dict:
+    db = database.SessionLocal()
+    try:
+        context = dialogue_generator.load_dialogue_context(db, payload.work_id, payload)
+    except HTTPException as e:
+        raise PermanentJobError(e.detail)
+    finally:
+        db.close()
+
+    try:
+        generated_text = dialogue_generator.generate_dialogue_from_context(
+            **context, prompt=payload.prompt
+        )
+    except ConnectionError as e:
+        raise PermanentJobError(str(e))
+    return {"generated_dialogue": generated_text}
+
+
+@register_job_handler("word_examples", WordExamplesPayload)
+def run_word_examples(payload: WordExamplesPayload, ctx: JobContext) -> dict:
+    result = crud.word_examples.exsen(payload.word)
+    if not result["success"]:
+        raise RuntimeError(result["message"])
+    return result
+
+
+@register_job_handler("bulk_examples", BulkExamplesPayload)
+def run_bulk_examples_job(payload: BulkExamplesPayload, ctx: JobContext) -> dict:
+    job = BulkExampleJob(
+        user_id=payload.user_id,
+        only_missing=payload.only_missing,
+        on_progress=ctx.report_progress,
+    )
+    result = run_bulk_examples(job)
+    if job.status == "failed":
+        raise RuntimeError(job.error or "Bulk example generation failed")
+    return result
+
+
+@register_job_handler(WORD_ENRICHMENT_JOB_TYPE, WordEnrichmentPayload)
+def run_word_enrichment(payload: WordEnrichmentPayload, ctx: JobContext) -> dict:
+    """단어 저장 직후 예문 / 쉬운 뜻 / 관련 단어를 미리 생성합니다."""
+    try:
+        return enrich_word(payload.words_id)
+    except LookupError as e:
+        raise PermanentJobError(str(e))
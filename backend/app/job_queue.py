@@ -0,0 +1,233 @@
+# app/job_queue.py
+import os
+import socket
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Type
+
+from pydantic import BaseModel
+
+from . import crud, database
+from .config import (
+    JOB_WORKER_COUNT,
+    JOB_POLL_INTERVAL_SECONDS,
+    JOB_RETRY_BASE_SECONDS,
+    JOB_RETRY_MAX_SECONDS,
+    JOB_LEASE_SECONDS,
+)
+from .metrics import metrics
+from .llm_scheduler import llm_priority
+
+
+class PermanentJobError(Exception):
+    """재시도해도 결과가 바뀌지 않는 실패 (대상 없음, 잘못된 입력 등)."""
+
+
+class JobContext:
+    """핸들러에 전달되는 실행 정보. 진행률 보고와 lease 연장에 사용합니다."""
+
+    def __init__(self, job_id: int, attempt: int, worker_id: str):
+        self.job_id = job_id
+        self.attempt = attempt
+        self.worker_id = worker_id
+        self.lease_lost = False
+
+    def extend_lease(self) -> bool:
+        """lease를 JOB_LEASE_SECONDS만큼 연장합니다. 작업을 잃었으면 False (lease_lost도 설정)."""
+        db = database.SessionLocal()
+        try:
+            owned = crud.jobs.extend_job_lease(
+                db, self.job_id, self.worker_id, self.attempt, JOB_LEASE_SECONDS
+            )
+        except Exception as e:
+            print(f"Job {self.job_id}: failed to extend lease: {e}")
+            return True  # 일시적인 DB 오류는 다음 연장에서 다시 시도
+        finally:
+            db.close()
+        if not owned and not self.lease_lost:
+            self.lease_lost = True
+            metrics.increment("jobs.lease_lost")
+            print(f"Job {self.job_id}: lease lost, another worker owns it now.")
+        return owned
+
+    def report_progress(self, progress: float) -> None:
+        db = database.SessionLocal()
+        try:
+            crud.jobs.update_job_progress(db, self.job_id, max(0.0, min(1.0, progress)))
+        except Exception as e:
+            print(f"Job {self.job_id}: failed to report progress: {e}")
+        finally:
+            db.close()
+        self.extend_lease()
+
+
+class _LeaseHeartbeat:
+    """
+    핸들러가 실행되는 동안 lease를 주기적으로 연장합니다 (JOB_LEASE_SECONDS의 1/3마다).
+    연장하지 않으면 lease보다 오래 걸리는 작업을 claim_next_job이 만료로 보고 다시 실행합니다.
+    """
+
+    def __init__(self, context: JobContext):
+        self.context = context
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name=f"job-lease-{context.job_id}", daemon=True
+        )
+
+    def _run(self) -> None:
+        interval = max(1.0, JOB_LEASE_SECONDS / 3)
+        while not self._stop.wait(interval):
+            if not self.context.extend_lease():
+                return
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join(timeout=5)
+
+
+class _JobHandler:
+    def __init__(self, fn: Callable[[BaseModel, JobContext], Any], payload_schema: Type[BaseModel]):
+        self.fn = fn
+        self.payload_schema = payload_schema
+
+
+_handlers: Dict[str, _JobHandler] = {}
+
+
+def register_job_handler(job_type: str, payload_schema: Type[BaseModel]):
+    """job_type 실행 함수를 등록하는 데코레이터. payload는 등록 시 받은 스키마로 검증됩니다."""
+
+    def decorator(fn: Callable[[BaseModel, JobContext], Any]):
+        _handlers[job_type] = _JobHandler(fn, payload_schema)
+        return fn
+
+    return decorator
+
+
+def get_job_types() -> List[str]:
+    return sorted(_handlers.keys())
+
+
+def validate_job_payload(job_type: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """제출 시점에 payload를 검증하고 정규화된 dict를 돌려줍니다. 알 수 없는 job_type은 KeyError."""
+    handler = _handlers[job_type]
+    return handler.payload_schema.model_validate(payload).model_dump(mode="json")
+
+
+def _execute(db_job) -> None:
+    handler = _handlers.get(db_job.job_type)
+    started = time.perf_counter()
+    worker_id = db_job.locked_by
+    context = JobContext(db_job.job_id, db_job.attempts, worker_id)
+    db = database.SessionLocal()
+    try:
+        if handler is None:
+            raise PermanentJobError(f"Unknown job type '{db_job.job_type}'")
+        payload = handler.payload_schema.model_validate(db_job.payload)
+        with llm_priority("batch"), _LeaseHeartbeat(context):
+            result = handler.fn(payload, context)
+        if crud.jobs.complete_job(db, db_job.job_id, worker_id, db_job.attempts, result):
+            metrics.increment(f"jobs.{db_job.job_type}.succeeded")
+        else:
+            # lease를 잃은 사이 다른 워커가 다시 실행 중이거나 끝냈으므로 결과를 덮어쓰지 않습니다.
+            metrics.increment(f"jobs.{db_job.job_type}.stale_result")
+            print(f"Job {db_job.job_id} ({db_job.job_type}): result discarded, lease was lost.")
+    except Exception as e:
+        retryable = not isinstance(e, PermanentJobError)
+        try:
+            # 실패한 commit / 쿼리로 세션이 깨져 있을 수 있으므로 먼저 되돌립니다.
+            db.rollback()
+            new_status = crud.jobs.fail_job(
+                db,
+                db_job.job_id,
+                worker_id,
+                db_job.attempts,
+                error=str(e),
+                retryable=retryable,
+                retry_base_seconds=JOB_RETRY_BASE_SECONDS,
+                retry_max_seconds=JOB_RETRY_MAX_SECONDS,
+            )
+        except Exception as record_error:
+            # 기록하지 못해도 lease가 만료되면 claim_next_job이 다시 가져가 재시도합니다.
+            metrics.increment(f"jobs.{db_job.job_type}.fail_record_error")
+            print(f"Job {db_job.job_id} ({db_job.job_type}): failed to record failure ({e}): {record_error}")
+            return
+        outcome = {"queued": "retried", "lost": "stale_result"}.get(new_status, "failed")
+        metrics.increment(f"jobs.{db_job.job_type}.{outcome}")
+        print(
+            f"Job {db_job.job_id} ({db_job.job_type}) attempt {db_job.attempts} failed: {e} -> {new_status}"
+        )
+    finally:
+        metrics.observe(f"jobs.{db_job.job_type}", time.perf_counter() - started)
+        db.close()
+
+
+class JobWorkerPool:
+    """jobs 테이블을 폴링하는 워커 스레드 묶음."""
+
+    def __init__(self, worker_count: int):
+        self.worker_count = worker_count
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._prefix = f"{socket.gethostname()}:{os.getpid()}"
+
+    def _run(self, worker_id: str) -> None:
+        while not self._stop.is_set():
+            db = database.SessionLocal()
+            try:
+                db_job = crud.jobs.claim_next_job(db, worker_id, JOB_LEASE_SECONDS)
+            except Exception as e:
+                print(f"Job worker {worker_id}: failed to claim job: {e}")
+                db_job = None
+            finally:
+                db.close()
+
+            if db_job is None:
+                self._stop.wait(JOB_POLL_INTERVAL_SECONDS)
+                continue
+            try:
+                _execute(db_job)
+            except Exception as e:
+                # 워커 스레드가 죽으면 풀이 줄어들므로 계속 돕니다. 작업은 lease 만료 후 다시 실행됩니다.
+                metrics.increment("jobs.worker_errors")
+                print(f"Job worker {worker_id}: unexpected error on job {db_job.job_id}: {e}")
+
+    def start(self) -> None:
+        for i in range(self.worker_count):
+            worker_id = f"{self._prefix}:{i}"
+            thread = threading.Thread(
+                target=self._run, args=(worker_id,), name=f"job-worker-{i}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+        print(f"Job workers started: {self.worker_count}")
+
+    def stop(self, timeout: float = 10.0) -> None:
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+        self._threads.clear()
+
+
+_pool: Optional[JobWorkerPool] = None
+
+
+def start_job_workers() -> None:
+    global _pool
+    if JOB_WORKER_COUNT <= 0 or _pool is not None:
+        return
+    from . import job_handlers  # noqa: F401  핸들러 등록
+
+    _pool = JobWorkerPool(JOB_WORKER_COUNT)
+    _pool.start()
+
+
+def stop_job_workers() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.stop()
+        _pool = None
@@ -0,0 +1,72 @@
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+from app.llm_scheduler import llm_deadline
+from app.config import (
+    FIND_RELATED_DEFAULT_BUDGET_MS,
+    FIND_RELATED_WEB_MIN_BUDGET_MS,
+    FIND_RELATED_LLM_MIN_BUDGET_MS,
+)
+
+# 단계별로 시작하기 위해 최소한 남아 있어야 하는 예산 (초)
+STAGE_MIN_BUDGET_SECONDS = {
+    "web": FIND_RELATED_WEB_MIN_BUDGET_MS / 1000,
+    "llm": FIND_RELATED_LLM_MIN_BUDGET_MS / 1000,
+}
+
+
+def deadline_from_budget(latency_budget_ms: Optional[int]) -> Optional[float]:
+    """요청 단위 지연 예산(ms)을 time.monotonic() 기준 마감 시각으로 변환합니다."""
+    budget_ms = latency_budget_ms or FIND_RELATED_DEFAULT_BUDGET_MS
+    if not budget_ms:
+        return None
+    return time.monotonic() + budget_ms / 1000
+
+
+def remaining_seconds(state: dict) -> Optional[float]:
+    """남은 예산(초). 마감 시각이 없으면 None을 반환합니다."""
+    deadline = state.get("deadline")
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def deadline_exceeded(state: dict) -> bool:
+    remaining = remaining_seconds(state)
+    return remaining is not None and remaining <= 0
+
+
+def stage_fits_budget(state: dict, stage: str) -> bool:
+    remaining = remaining_seconds(state)
+    return remaining is None or remaining >= STAGE_MIN_BUDGET_SECONDS[stage]
+
+
+def bounded_timeout(state: dict, default: Optional[float] = None) -> Optional[float]:
+    """default와 남은 예산 중 작은 값을 호출 타임아웃으로 사용합니다."""
+    remaining = remaining_seconds(state)
+    if remaining is None:
+        return default
+    remaining = max(remaining, 0.0)
+    return remaining if default is None else min(default, remaining)
+
+
+def with_dropped_source(state: dict, source: str, reason: str) -> list:
+    """state의 dropped_sources에 항목을 추가한 새 목록을 반환합니다."""
+    return state.get("dropped_sources", []) + [{"source": source, "reason": reason}]
+
+
+@contextmanager
+def llm_deadline_scope(state: dict):
+    """
+    with 블록 안의 LLM 호출이 스케줄러 대기열 / 429 cooldown / 재시도까지 포함해 state의 마감 안에 끝나게 합니다.
+    (timeout 인자는 HTTP 요청 한 번에만 적용됩니다.)
+    """
+    with llm_deadline(state.get("deadline")):
+        yield
+
+
+def llm_timeout_kwargs(state: dict) -> dict:
+    """남은 예산이 있으면 LLM 호출에 넘길 timeout 인자를 만듭니다."""
+    timeout = bounded_timeout(state)
+    return {} if timeout is None else {"timeout": timeout}
@@ -3,22 +3,37 @@ from app.langgraph_nodes.rag_node import check_rag_function
 from app.langgraph_nodes.web_search_node import web_search_node
 from app.langgraph_nodes.llm_generate_node import llm_generate_node
 from app.langgraph_nodes.merge_node import merge_node
+from app.langgraph_nodes.speculative_web import discard_speculative_web_search
+from app.langgraph_logic.instrumentation import instrument_node
+from app.langgraph_logic.deadline import stage_fits_budget
 
 
 def build_graph():
     builder = StateGraph(dict)
 
-    builder.add_node("check_rag", check_rag_function)
-    builder.add_node("web_search", web_search_node)
-    builder.add_node("llm_generate", llm_generate_node)
+    builder.add_node("check_rag", instrument_node("check_rag", check_rag_function))
+    builder.add_node("web_search", instrument_node("web_search", web_search_node))
     builder.add_node(
-        "merge_results", merge_node
+        "llm_generate", instrument_node("llm_generate", llm_generate_node)
+    )
+    builder.add_node(
+        "merge_results", instrument_node("merge_results", merge_node)
     )
 
-    builder.add_edge(START, "check_rag")
+    def route_from_start(state: dict):
+        # 배치 API는 RAG 조회를 미리 끝낸 상태(rag_done)로 그래프를 호출합니다.
+        if state.get("rag_done"):
+            return route_after_rag(state)
+        return "to_check_rag"
 
     def route_after_rag(state: dict):
-        print(f"--- Router after RAG (State: {state}) ---")
+        route = _decide_after_rag(state)
+        if route != "to_web_search":
+            discard_speculative_web_search(state)
+        return route
+
+    def _decide_after_rag(state: dict):
+        print("--- Router after RAG ---")
         if state.get("error"):
             print("Routing to: merge_results (due to RAG error)")
             return "to_merge" 
@@ -29,16 +44,27 @@ def build_graph():
         if missing_web == 0 and missing_llm == 0:  
             print("Routing to: merge_results (RAG sufficient)")
             return "to_merge"
-        elif missing_web > 0:
+        elif missing_web > 0 and stage_fits_budget(state, "web"):
             print("Routing to: web_search")
             return "to_web_search"
-        elif missing_llm > 0:
+        elif missing_llm > 0 and stage_fits_budget(state, "llm"):
             print("Routing to: llm_generate (skipping web)")
             return "to_llm_direct"
         else:  
-            print("Routing to: merge_results (fallback from after_rag)")
+            print("Routing to: merge_results (fallback or latency budget exhausted)")
             return "to_merge"
 
+    builder.add_conditional_edges(
+        START,
+        route_from_start,
+        {
+            "to_check_rag": "check_rag",
+            "to_merge": "merge_results",
+            "to_web_search": "web_search",
+            "to_llm_direct": "llm_generate",
+        },
+    )
+
     builder.add_conditional_edges(
         "check_rag",
         route_after_rag,
@@ -50,17 +76,17 @@ def build_graph():
     )
 
     def route_after_web(state: dict):
-        print(f"--- Router after Web Search (State: {state}) ---")
+        print("--- Router after Web Search ---")
         if state.get("error"):
             print("Routing to: merge_results (due to web_search error)")
             return "to_merge"
 
         missing_llm = state.get("missing_llm", 0)
-        if missing_llm > 0:  
+        if missing_llm > 0 and stage_fits_budget(state, "llm"):  
             print("Routing to: llm_generate")
             return "to_llm"
         else:  
-            print("Routing to: merge_results (web_search sufficient or no llm needed)")
+            print("Routing to: merge_results (web_search sufficient, no llm needed or budget exhausted)")
             return "to_merge"
 
     builder.add_conditional_edges(
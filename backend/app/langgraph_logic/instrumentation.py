@@ -0,0 +1,60 @@
+import functools
+import time
+from typing import Callable
+
+from langchain_community.callbacks.manager import get_openai_callback
+
+from app.metrics import metrics
+
+# 노드는 전체 상태를 새로 반환하므로, 요청 단위로 유지되어야 하는 키는 이어 붙입니다.
+CARRY_OVER_KEYS = ("deadline", "planned_sources", "completed_sources", "dropped_sources")
+
+
+def instrument_node(node_name: str, node_fn: Callable[[dict], dict]) -> Callable[[dict], dict]:
+    """
+    LangGraph 노드를 감싸 실행 시간, 토큰 사용량, 오류를 기록합니다.
+    기록은 state["node_metrics"][node_name]과 metrics 레지스트리에 함께 남습니다.
+    """
+
+    @functools.wraps(node_fn)
+    def wrapper(state: dict) -> dict:
+        started = time.perf_counter()
+        with get_openai_callback() as cb:
+            try:
+                result = node_fn(state)
+            except Exception as e:
+                elapsed = time.perf_counter() - started
+                metrics.observe(f"find_related.node.{node_name}", elapsed)
+                metrics.increment(f"find_related.node.{node_name}.errors")
+                print(f"Node '{node_name}' raised after {elapsed * 1000:.1f}ms: {e}")
+                raise
+        elapsed = time.perf_counter() - started
+
+        node_metric = {
+            "wall_ms": round(elapsed * 1000, 2),
+            "prompt_tokens": cb.prompt_tokens,
+            "completion_tokens": cb.completion_tokens,
+            "total_tokens": cb.total_tokens,
+            "cost_usd": cb.total_cost,
+            "error": result.get("error"),
+        }
+        metrics.observe(f"find_related.node.{node_name}", elapsed)
+        if cb.total_tokens:
+            metrics.increment(f"find_related.node.{node_name}.tokens", cb.total_tokens)
+            metrics.increment(f"find_related.node.{node_name}.cost_usd", cb.total_cost)
+        if node_metric["error"]:
+            metrics.increment(f"find_related.node.{node_name}.errors")
+        print(
+            f"Node '{node_name}': {node_metric['wall_ms']}ms, tokens={cb.total_tokens}"
+        )
+
+        for key in CARRY_OVER_KEYS:
+            if key in state and key not in result:
+                result[key] = state[key]
+        result["node_metrics"] = {
+            **state.get("node_metrics", {}),
+            node_name: node_metric,
+        }
+        return result
+
+    return wrapper
@@ -1,17 +1,20 @@
 from langchain_core.messages import HumanMessage
-from langchain_openai import ChatOpenAI
+from app.llm_clients import get_chat_model
 from app.config import (  
     LLM_GENERATE_MODEL,
     LLM_GENERATE_TEMP,
     OPENAI_API_KEY,
 )
+from app.langgraph_logic.deadline import (
+    deadline_exceeded,
+    llm_deadline_scope,
+    llm_timeout_kwargs,
+    stage_fits_budget,
+    with_dropped_source,
+)
 
 try:
-    llm_gen = ChatOpenAI(
-        model=LLM_GENERATE_MODEL,
-        temperature=LLM_GENERATE_TEMP,
-        api_key=OPENAI_API_KEY if OPENAI_API_KEY else None,
-    )
+    llm_gen = get_chat_model(LLM_GENERATE_MODEL, LLM_GENERATE_TEMP, cache=True)
     print(
         f"ChatOpenAI for llm_generate ({LLM_GENERATE_MODEL}, temp={LLM_GENERATE_TEMP}) loaded."
     )
@@ -22,7 +25,7 @@ except Exception as e:
 
 # --- llm_generate_node ---
 def llm_generate_node(state: dict) -> dict:
-    print(f"--- Node: llm_generate (Input State: {state}) ---")
+    print(f"--- Node: llm_generate (query: {state.get('query')}) ---")
     if llm_gen is None:
         print("Error: LLM not initialized for llm_generate_node.")
         return {
@@ -43,8 +46,13 @@ def llm_generate_node(state: dict) -> dict:
         w.lower() for w in rag_words + web_words + [query]
     )  
     final_llm_words = []
+    dropped_sources = state.get("dropped_sources", [])
+    completed_sources = state.get("completed_sources", [])
 
-    if num_to_find_from_llm > 0:
+    if num_to_find_from_llm > 0 and not stage_fits_budget(state, "llm"):
+        print("LLM Generate: Skipping, remaining latency budget is too small.")
+        dropped_sources = with_dropped_source(state, "llm", "deadline")
+    elif num_to_find_from_llm > 0:
         context_parts = []
         if rag_words:
             context_parts.append(
@@ -68,7 +76,10 @@ def llm_generate_node(state: dict) -> dict:
             f"결과는 반드시 콤마(,)로 구분된 단어 목록으로만 응답해주세요. 다른 어떤 설명도 포함하지 마세요."
         )
         try:
-            response = llm_gen.invoke([HumanMessage(content=prompt_content)])
+            with llm_deadline_scope(state):
+                response = llm_gen.invoke(
+                    [HumanMessage(content=prompt_content)], **llm_timeout_kwargs(state)
+                )
             response_text = response.content.strip()
             if response_text:
                 raw_words = [
@@ -83,8 +94,12 @@ def llm_generate_node(state: dict) -> dict:
                         unique_llm_words.append(word)
                 final_llm_words = unique_llm_words[:num_to_find_from_llm]
                 print(f"LLM Generate: LLM generated words: {final_llm_words}")
+            completed_sources = completed_sources + ["llm"]
         except Exception as e:
             print(f"Error during LLM generation in llm_generate_node: {e}")
+            dropped_sources = with_dropped_source(
+                state, "llm", "timeout" if deadline_exceeded(state) else "error"
+            )
     else:
         print("LLM Generate: Skipping LLM generation as missing_llm is 0.")
 
@@ -94,4 +109,6 @@ def llm_generate_node(state: dict) -> dict:
         "web_search_words": web_words,
         "llm_generated_words": final_llm_words,
         "target_word_count": state.get("target_word_count"),
+        "completed_sources": completed_sources,
+        "dropped_sources": dropped_sources,
     }
@@ -1,5 +1,5 @@
 def merge_node(state: dict) -> dict:
-    print(f"--- Node: merge (Input State: {state}) ---")
+    print(f"--- Node: merge (query: {state.get('query')}) ---")
     query = state.get("query")
     rag_words = state.get("retrieved_from_rag", [])
     web_words = state.get("web_search_words", [])
@@ -16,6 +16,22 @@ def merge_node(state: dict) -> dict:
             seen_words_lower.add(word.lower())
 
     final_selected_words = final_unique_words[:target_word_count]
+
+    # 계획되었지만 라우터가 건너뛴 단계도 누락된 소스로 보고합니다.
+    dropped_sources = list(state.get("dropped_sources", []))
+    reported = {d["source"] for d in dropped_sources}
+    completed = set(state.get("completed_sources", []))
+    for source in state.get("planned_sources", []):
+        if source not in completed and source not in reported:
+            if state.get("error"):
+                reason = "error"
+            elif state.get("deadline") is not None:
+                reason = "deadline"
+            else:
+                reason = "skipped"
+            dropped_sources.append({"source": source, "reason": reason})
+    if dropped_sources:
+        print(f"Merge: Returning partial result, dropped sources: {dropped_sources}")
     print(
         f"Merge: Final selected {len(final_selected_words)} words: {final_selected_words}"
     )
@@ -27,4 +43,5 @@ def merge_node(state: dict) -> dict:
         "rag_source_count": len(rag_words),
         "web_source_count": len(web_words),
         "llm_source_count": len(llm_words),
+        "dropped_sources": dropped_sources,
     }
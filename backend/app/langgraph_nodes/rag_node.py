@@ -1,3 +1,4 @@
+from typing import List
 from opensearchpy import OpenSearch
 
 from sentence_transformers import SentenceTransformer  
@@ -8,6 +9,7 @@ from app.config import (
     SIMILARITY_THRESHOLD,
     OPENSEARCH_INDEX_NAME,
 )
+from app.langgraph_nodes.speculative_web import start_speculative_web_search
 
 try:
     client = OpenSearch(hosts=[{"host": OPENSEARCH_HOST, "port": OPENSEARCH_PORT}])
@@ -43,49 +45,19 @@ class SBERTEmbedder:
 embedder = SBERTEmbedder(embedder_sbert)
 
 
-# --- check_rag_function ---
-def check_rag_function(state: dict) -> dict:
-    print(f"--- Node: check_rag (Input State: {state}) ---")
-    if client is None or embedder.model is None:
-        print("Error: OpenSearch client or SBERT embedder not initialized.")
-        return {
-            "query": state.get("query"),
-            "retrieved_from_rag": [],
-            "missing_count_after_rag": state.get(
-                "target_word_count", 5
-            ),  
-            "error": "RAG components not initialized",
+def _build_script_query(vector) -> dict:
+    return {
+        "script_score": {
+            "query": {"match_all": {}},
+            "script": {
+                "source": "cosineSimilarity(params.query_vector, doc['embedding']) + 1.0",  
+                "params": {"query_vector": vector.tolist()},
+            },
         }
+    }
 
-    query = state["query"]
-    target_word_count = state.get("target_word_count", 5)  
-
-    try:
-        vector = embedder.encode([query])[0]
-        script_query = {
-            "script_score": {
-                "query": {"match_all": {}},
-                "script": {
-                    "source": "cosineSimilarity(params.query_vector, doc['embedding']) + 1.0",  
-                    "params": {"query_vector": vector.tolist()},
-                },
-            }
-        }
-        response = client.search(
-            index=OPENSEARCH_INDEX_NAME,  
-            body={"query": script_query, "size": 10},  
-        )
-        hits = response["hits"]["hits"]
-    except Exception as e:
-        print(f"Error during OpenSearch query in check_rag_function: {e}")
-        return {
-            "query": query,
-            "retrieved_from_rag": [],
-            "missing_count_after_rag": target_word_count,
-            "target_word_count": target_word_count,
-            "error": f"OpenSearch query failed: {str(e)}",
-        }
 
+def _rag_state_from_hits(query: str, target_word_count: int, hits: list) -> dict:
     if not hits:
         print("RAG: No hits found.")
         return {
@@ -131,4 +103,108 @@ def check_rag_function(state: dict) -> dict:
         "missing_web": missing_web,
         "missing_llm": missing_llm,
         "target_word_count": target_word_count,  
+        "planned_sources": (["web"] if missing_web else []) + (["llm"] if missing_llm else []),
     }
+
+
+# --- check_rag_function ---
+def check_rag_function(state: dict) -> dict:
+    print(f"--- Node: check_rag (query: {state.get('query')}) ---")
+    if client is None or embedder.model is None:
+        print("Error: OpenSearch client or SBERT embedder not initialized.")
+        return {
+            "query": state.get("query"),
+            "retrieved_from_rag": [],
+            "missing_count_after_rag": state.get(
+                "target_word_count", 5
+            ),  
+            "error": "RAG components not initialized",
+        }
+
+    query = state["query"]
+    target_word_count = state.get("target_word_count", 5)  
+    # OpenSearch 조회와 동시에 웹 검색을 미리 시작 (SPECULATIVE_WEB_SEARCH 설정 시)
+    speculative_web = start_speculative_web_search(query)
+
+    try:
+        vector = embedder.encode([query])[0]
+        response = client.search(
+            index=OPENSEARCH_INDEX_NAME,  
+            body={"query": _build_script_query(vector), "size": 10},  
+        )
+        hits = response["hits"]["hits"]
+    except Exception as e:
+        print(f"Error during OpenSearch query in check_rag_function: {e}")
+        return {
+            "query": query,
+            "retrieved_from_rag": [],
+            "missing_count_after_rag": target_word_count,
+            "target_word_count": target_word_count,
+            "error": f"OpenSearch query failed: {str(e)}",
+            "speculative_web": speculative_web,
+        }
+
+    rag_state = _rag_state_from_hits(query, target_word_count, hits)
+    rag_state["speculative_web"] = speculative_web
+    return rag_state
+
+
+def check_rag_batch(queries: List[str], target_word_count: int) -> List[dict]:
+    """
+    여러 쿼리를 한 번의 SBERT 배치 임베딩과 한 번의 OpenSearch msearch로 조회합니다.
+    반환되는 상태에는 rag_done=True가 표시되어 그래프가 check_rag 노드를 건너뜁니다.
+    """
+    print(f"--- Batch RAG for {len(queries)} queries ---")
+    if client is None or embedder.model is None:
+        print("Error: OpenSearch client or SBERT embedder not initialized.")
+        return [
+            {
+                "query": query,
+                "retrieved_from_rag": [],
+                "missing_count_after_rag": target_word_count,
+                "target_word_count": target_word_count,
+                "error": "RAG components not initialized",
+                "rag_done": True,
+            }
+            for query in queries
+        ]
+
+    try:
+        vectors = embedder.encode(queries)
+        msearch_body = []
+        for vector in vectors:
+            msearch_body.append({"index": OPENSEARCH_INDEX_NAME})
+            msearch_body.append({"query": _build_script_query(vector), "size": 10})
+        responses = client.msearch(body=msearch_body)["responses"]
+    except Exception as e:
+        print(f"Error during OpenSearch msearch in check_rag_batch: {e}")
+        return [
+            {
+                "query": query,
+                "retrieved_from_rag": [],
+                "missing_count_after_rag": target_word_count,
+                "target_word_count": target_word_count,
+                "error": f"OpenSearch query failed: {str(e)}",
+                "rag_done": True,
+            }
+            for query in queries
+        ]
+
+    rag_states = []
+    for query, response in zip(queries, responses):
+        if "error" in response:
+            print(f"Error in msearch response for '{query}': {response['error']}")
+            rag_state = {
+                "query": query,
+                "retrieved_from_rag": [],
+                "missing_count_after_rag": target_word_count,
+                "target_word_count": target_word_count,
+                "error": f"OpenSearch query failed: {response['error']}",
+            }
+        else:
+            rag_state = _rag_state_from_hits(
+                query, target_word_count, response["hits"]["hits"]
+            )
+        rag_state["rag_done"] = True
+        rag_states.append(rag_state)
+    return rag_states
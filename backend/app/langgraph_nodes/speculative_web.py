@@ -0,0 +1,67 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+
+from app.config import (
+    SPECULATIVE_WEB_SEARCH,
+    SPECULATIVE_WEB_MAX_PER_MINUTE,
+    SPECULATIVE_WEB_WORKERS,
+)
+from app.langgraph_nodes.web_search_node import fetch_web_snippets
+
+
+class SpeculativeBudget:
+    """최근 window_seconds 동안 시작할 수 있는 추측 검색 수를 제한합니다."""
+
+    def __init__(self, max_per_window: int, window_seconds: float = 60.0):
+        self.max_per_window = max_per_window
+        self.window_seconds = window_seconds
+        self._started_at = deque()
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            while self._started_at and now - self._started_at[0] >= self.window_seconds:
+                self._started_at.popleft()
+            if len(self._started_at) >= self.max_per_window:
+                return False
+            self._started_at.append(now)
+            return True
+
+
+speculative_budget = SpeculativeBudget(SPECULATIVE_WEB_MAX_PER_MINUTE)
+_executor = ThreadPoolExecutor(
+    max_workers=SPECULATIVE_WEB_WORKERS, thread_name_prefix="speculative-web"
+)
+
+
+def start_speculative_web_search(query: str) -> Optional[Future]:
+    """
+    RAG 조회와 동시에 웹 검색을 미리 시작합니다.
+    검색어와 결과 수는 web_search 노드와 같으므로 결과가 검색 캐시에도 그대로 재사용됩니다.
+    """
+    if not SPECULATIVE_WEB_SEARCH:
+        return None
+    if not speculative_budget.try_acquire():
+        print("Speculative Web: Budget exhausted, skipping speculative search.")
+        return None
+
+    print(f"Speculative Web: Started for '{query}'.")
+    return _executor.submit(fetch_web_snippets, query)
+
+
+def discard_speculative_web_search(state: dict) -> None:
+    """
+    RAG만으로 충분하거나 웹 검색을 건너뛰는 경우 추측 검색을 취소합니다.
+    이미 실행 중인 검색은 중단할 수 없으므로, 끝나더라도 결과를 버립니다.
+    """
+    future = state.get("speculative_web")
+    if future is None:
+        return
+    if future.cancel():
+        print("Speculative Web: Cancelled before start.")
+    else:
+        print("Speculative Web: Already running, result will be discarded.")
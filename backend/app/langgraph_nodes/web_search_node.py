@@ -1,16 +1,26 @@
-from langchain_community.tools.ddg_search.tool import DuckDuckGoSearchResults
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import List, Optional
 from langchain_core.messages import HumanMessage
-from langchain_openai import ChatOpenAI  
+from app.llm_clients import get_chat_model
 from app.config import (
     LLM_WEB_SEARCH_MODEL,
     LLM_WEB_SEARCH_TEMP,
+    SPECULATIVE_WEB_WAIT_SECONDS,
+    WEB_SEARCH_MAX_RESULTS,
+    WEB_SEARCH_TIMEOUT_SECONDS,
+)
+from app.search_provider import get_search_provider, SearchTimeoutError
+from app.langgraph_logic.deadline import (
+    bounded_timeout,
+    deadline_exceeded,
+    llm_deadline_scope,
+    llm_timeout_kwargs,
+    stage_fits_budget,
+    with_dropped_source,
 )
 
 try:
-    llm_web = ChatOpenAI(
-        model=LLM_WEB_SEARCH_MODEL,
-        temperature=LLM_WEB_SEARCH_TEMP,
-    )
+    llm_web = get_chat_model(LLM_WEB_SEARCH_MODEL, LLM_WEB_SEARCH_TEMP)
     print(
         f"ChatOpenAI for web_search ({LLM_WEB_SEARCH_MODEL}, temp={LLM_WEB_SEARCH_TEMP}) loaded."
     )
@@ -18,9 +28,21 @@ except Exception as e:
     print(f"Error initializing ChatOpenAI for web_search_node: {e}")
     llm_web = None
 
-# DuckDuckGoSearchResults는 llm을 필요로 하지 않음, 웹 서치 결과를 llm으로 가공해서 전달
+
+def fetch_web_snippets(query: str, timeout: Optional[float] = None) -> List[str]:
+    """
+    설정된 검색 제공자로 웹 검색을 수행하고 LLM에 넘길 스니펫 목록을 반환합니다.
+    찾을 개수와 관계없이 같은 검색어/결과 수로 검색해서 단어별로 캐시가 맞도록 합니다.
+    """
+    search_prompt = f"'{query.strip()}'와 관련된 다양한 동의어, 유의어, 연관 검색어 또는 주제어"
+    return get_search_provider().search(
+        search_prompt, max_results=WEB_SEARCH_MAX_RESULTS, timeout=timeout
+    )
+
+
+# 검색 제공자는 llm을 필요로 하지 않음, 웹 서치 결과를 llm으로 가공해서 전달
 def web_search_node(state: dict) -> dict:
-    print(f"--- Node: web_search (Input State: {state}) ---")
+    print(f"--- Node: web_search (query: {state.get('query')}) ---")
     if llm_web is None:
         print("Error: LLM not initialized for web_search_node.")
         return {
@@ -36,38 +58,36 @@ def web_search_node(state: dict) -> dict:
     query = state["query"]
     num_to_find_from_web = state.get("missing_web", 0)
     final_web_words = []
+    dropped_sources = state.get("dropped_sources", [])
+    completed_sources = state.get("completed_sources", [])
 
-    if num_to_find_from_web > 0:
-        search_tool = DuckDuckGoSearchResults(
-            max_results=max(
-                5, num_to_find_from_web * 2
-            ),
-        )
+    if num_to_find_from_web > 0 and not stage_fits_budget(state, "web"):
+        print("Web Search: Skipping, remaining latency budget is too small.")
+        dropped_sources = with_dropped_source(state, "web", "deadline")
+    elif num_to_find_from_web > 0:
         try:
-            search_prompt = f"'{query}'와 관련된 다양한 동의어, 유의어, 연관 검색어 또는 주제어 {num_to_find_from_web * 2}개"
-            search_output_raw = search_tool.run(search_prompt)
-
-            search_results_snippets = []
-            if isinstance(search_output_raw, str):
-                import re
-
-                snippets = re.findall(
-                    r"snippet: (.*?)(?:, title:|, link:|$)", search_output_raw
-                )
-                if snippets:
-                    search_results_snippets = snippets
-                else:  
-                    search_results_snippets = [
-                        line.strip()
-                        for line in search_output_raw.split("\n")
-                        if line.strip()
-                    ][:5]
-
-            elif isinstance(search_output_raw, list):  
-                search_results_snippets = [str(item) for item in search_output_raw][:5]
-            else:
-                print(
-                    f"Web Search: Unexpected type from search_tool.run(): {type(search_output_raw)}"
+            search_results_snippets = None
+            fetch_again = True
+            speculative_future = state.get("speculative_web")
+            if speculative_future is not None:
+                # 같은 검색이 이미 진행 중이므로 시간이 초과돼도 다시 검색하지 않습니다
+                # (제공자 부하가 두 배가 되고 최악 지연이 대기 시간 + 검색 타임아웃이 됨).
+                try:
+                    search_results_snippets = speculative_future.result(
+                        timeout=bounded_timeout(state, SPECULATIVE_WEB_WAIT_SECONDS)
+                    )
+                    fetch_again = False
+                    print("Web Search: Using snippets from speculative search.")
+                except FutureTimeoutError:
+                    raise SearchTimeoutError(
+                        "Speculative web search did not finish in time"
+                    )
+                except Exception as e:
+                    print(f"Web Search: Speculative search failed, fetching again: {e}")
+            if fetch_again:
+                search_results_snippets = fetch_web_snippets(
+                    query,
+                    timeout=bounded_timeout(state, WEB_SEARCH_TIMEOUT_SECONDS),
                 )
 
             if search_results_snippets:
@@ -83,7 +103,10 @@ def web_search_node(state: dict) -> dict:
                     f"다른 어떤 설명, 번호 매기기, 문장, 줄바꿈도 포함하지 마세요. "
                     f"오직 단어들만 콤마로 구분해서 한 줄로 응답해야 합니다. '{query}' 자체는 제외해주세요."
                 )
-                response = llm_web.invoke([HumanMessage(content=prompt_content)])
+                with llm_deadline_scope(state):
+                    response = llm_web.invoke(
+                        [HumanMessage(content=prompt_content)], **llm_timeout_kwargs(state)
+                    )
                 response_text = response.content.strip()
 
                 if response_text:
@@ -100,9 +123,14 @@ def web_search_node(state: dict) -> dict:
                     print(f"Web Search: LLM extracted words: {final_web_words}")
             else:
                 print("Web Search: No usable search snippets found to pass to LLM.")
+            completed_sources = completed_sources + ["web"]
 
         except Exception as e:
             print(f"Error during web search or LLM processing in web_search_node: {e}")
+            timed_out = isinstance(e, SearchTimeoutError) or deadline_exceeded(state)
+            dropped_sources = with_dropped_source(
+                state, "web", "timeout" if timed_out else "error"
+            )
     else:
         print("Web Search: Skipping web search as missing_web is 0.")
 
@@ -112,4 +140,6 @@ def web_search_node(state: dict) -> dict:
         "web_search_words": final_web_words,
         "missing_llm": state.get("missing_llm", 0),  
         "target_word_count": state.get("target_word_count"),
+        "completed_sources": completed_sources,
+        "dropped_sources": dropped_sources,
     }
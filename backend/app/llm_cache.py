@@ -0,0 +1,138 @@
+# app/llm_cache.py
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from langchain_core.caches import BaseCache, RETURN_VAL_TYPE
+from langchain_core.load import dumps, loads
+
+from . import config
+from .metrics import metrics
+
+
+# 호출마다 남은 지연 예산으로 정해지는 timeout 인자 (llm_timeout_kwargs). 응답에 영향이 없으므로 키에서 뺍니다.
+_TIMEOUT_PARAM = re.compile(r", \('(?:request_)?timeout', [^()]*\)")
+
+
+class PersistentLLMCache(BaseCache):
+    """
+    SQLite 파일에 저장되는 정확 일치(exact-match) LLM 응답 캐시.
+    키는 llm_string(모델명, temperature 등 호출 파라미터, timeout 제외)과 전체 프롬프트의 SHA-256 해시입니다.
+    TTL이 지난 항목은 조회 시 삭제되고, 최대 개수를 넘으면 가장 오래 사용되지 않은 항목부터 지웁니다.
+    """
+
+    def __init__(self, path: str, ttl_seconds: float, max_entries: int):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                total_tokens INTEGER NOT NULL DEFAULT 0,
+                created_at REAL NOT NULL,
+                last_used_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_llm_cache_last_used_at ON llm_cache (last_used_at)"
+        )
+        self._conn.commit()
+        print(f"LLM response cache opened at {path}")
+
+    @staticmethod
+    def _key(prompt: str, llm_string: str) -> str:
+        llm_string = _TIMEOUT_PARAM.sub("", llm_string)
+        return hashlib.sha256(f"{llm_string}\x00{prompt}".encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _total_tokens(return_val: RETURN_VAL_TYPE) -> int:
+        total = 0
+        for generation in return_val:
+            message = getattr(generation, "message", None)
+            usage = getattr(message, "usage_metadata", None) if message else None
+            if usage:
+                total += usage.get("total_tokens", 0)
+        return total
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        key = self._key(prompt, llm_string)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, total_tokens, created_at FROM llm_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is not None and now - row[2] > self.ttl_seconds:
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                row = None
+            if row is None:
+                metrics.increment("llm_cache.misses")
+                return None
+            self._conn.execute(
+                "UPDATE llm_cache SET last_used_at = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+        metrics.increment("llm_cache.hits")
+        metrics.increment("llm_cache.tokens_saved", row[1])
+        return [loads(value) for value in json.loads(row[0])]
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        key = self._key(prompt, llm_string)
+        now = time.time()
+        value = json.dumps([dumps(generation) for generation in return_val])
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, total_tokens, created_at, last_used_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, value, self._total_tokens(return_val), now, now),
+            )
+            self._conn.execute(
+                "DELETE FROM llm_cache WHERE key IN ("
+                "SELECT key FROM llm_cache ORDER BY last_used_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self._conn.commit()
+
+    def clear(self, **kwargs: Any) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache")
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+        counters = metrics.snapshot_counters("llm_cache.")
+        hits = counters.get("llm_cache.hits", 0)
+        misses = counters.get("llm_cache.misses", 0)
+        return {
+            "entries": entries,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "tokens_saved": counters.get("llm_cache.tokens_saved", 0),
+        }
+
+
+@lru_cache()
+def get_llm_cache() -> Optional[PersistentLLMCache]:
+    if not config.LLM_CACHE_ENABLED:
+        return None
+    cache = PersistentLLMCache(
+        config.LLM_CACHE_PATH,
+        ttl_seconds=config.LLM_CACHE_TTL_SECONDS,
+        max_entries=config.LLM_CACHE_MAX_ENTRIES,
+    )
+    metrics.register_reporter("llm_cache", cache.stats)
+    return cache
@@ -0,0 +1,113 @@
+# app/llm_clients.py
+from functools import lru_cache
+from typing import Optional
+
+import httpx
+from openai import OpenAI, AsyncOpenAI
+from langchain_openai import ChatOpenAI
+
+from . import config
+from .llm_cache import get_llm_cache
+from .llm_scheduler import ScheduledTransport, AsyncScheduledTransport, get_llm_scheduler
+
+
+def _http_timeout() -> httpx.Timeout:
+    # SDK/ChatOpenAI에 float를 넘기면 요청마다 이 값을 덮어써서 connect 타임아웃이 사라지므로 같은 객체를 넘깁니다.
+    return httpx.Timeout(
+        config.OPENAI_TIMEOUT_SECONDS, connect=config.OPENAI_CONNECT_TIMEOUT_SECONDS
+    )
+
+
+def _http_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=config.OPENAI_MAX_CONNECTIONS,
+        max_keepalive_connections=config.OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=config.OPENAI_KEEPALIVE_EXPIRY_SECONDS,
+    )
+
+
+def _max_retries() -> int:
+    # 스케줄러가 재시도를 맡으면 SDK 자체 재시도는 끕니다 (이중 재시도 방지).
+    return 0 if config.LLM_SCHEDULER_ENABLED else config.OPENAI_MAX_RETRIES
+
+
+@lru_cache()
+def get_http_client() -> httpx.Client:
+    """모든 동기 OpenAI 호출이 공유하는 커넥션 풀."""
+    transport = httpx.HTTPTransport(limits=_http_limits())
+    if config.LLM_SCHEDULER_ENABLED:
+        transport = ScheduledTransport(get_llm_scheduler(), transport)
+    return httpx.Client(timeout=_http_timeout(), transport=transport)
+
+
+@lru_cache()
+def get_async_http_client() -> httpx.AsyncClient:
+    """모든 비동기 OpenAI 호출이 공유하는 커넥션 풀."""
+    transport = httpx.AsyncHTTPTransport(limits=_http_limits())
+    if config.LLM_SCHEDULER_ENABLED:
+        transport = AsyncScheduledTransport(get_llm_scheduler(), transport)
+    return httpx.AsyncClient(timeout=_http_timeout(), transport=transport)
+
+
+@lru_cache()
+def get_openai_client() -> OpenAI:
+    return OpenAI(
+        api_key=config.OPENAI_API_KEY,
+        base_url=config.OPENAI_BASE_URL,
+        http_client=get_http_client(),
+        timeout=_http_timeout(),
+        max_retries=_max_retries(),
+    )
+
+
+@lru_cache()
+def get_async_openai_client() -> AsyncOpenAI:
+    return AsyncOpenAI(
+        api_key=config.OPENAI_API_KEY,
+        base_url=config.OPENAI_BASE_URL,
+        http_client=get_async_http_client(),
+        timeout=_http_timeout(),
+        max_retries=_max_retries(),
+    )
+
+
+@lru_cache()
+def get_chat_model(
+    model: str,
+    temperature: float,
+    max_tokens: Optional[int] = None,
+    cache: bool = False,
+) -> ChatOpenAI:
+    """
+    (model, temperature, max_tokens, cache) 조합별로 ChatOpenAI를 한 번만 만들어 재사용합니다.
+    내부 HTTP 커넥션 풀은 모든 조합이 공유합니다.
+    cache=True이고 temperature가 LLM_CACHE_MAX_TEMPERATURE 이하이면 응답 캐시를 사용합니다.
+    """
+    response_cache = None
+    if cache and temperature <= config.LLM_CACHE_MAX_TEMPERATURE:
+        response_cache = get_llm_cache()
+    print(
+        f"ChatOpenAI created: model={model}, temperature={temperature}, "
+        f"max_tokens={max_tokens}, cached={response_cache is not None}, "
+        f"base_url={config.OPENAI_BASE_URL or 'default'}"
+    )
+    return ChatOpenAI(
+        model=model,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        api_key=config.OPENAI_API_KEY if config.OPENAI_API_KEY else None,
+        base_url=config.OPENAI_BASE_URL,
+        http_client=get_http_client(),
+        http_async_client=get_async_http_client(),
+        timeout=_http_timeout(),
+        max_retries=_max_retries(),
+        cache=response_cache if response_cache is not None else False,
+    )
+
+
+async def close_llm_clients() -> None:
+    """애플리케이션 종료 시 공용 커넥션 풀을 닫습니다."""
+    if get_http_client.cache_info().currsize:
+        get_http_client().close()
+    if get_async_http_client.cache_info().currsize:
+        await get_async_http_client().aclose()
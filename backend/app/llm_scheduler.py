@@ -0,0 +1,432 @@
+# app/llm_scheduler.py
+"""
+모든 OpenAI 호출이 공유하는 동시성 제한 + 429 대응 스케줄러.
+
+llm_clients의 공용 httpx 클라이언트에 전송 계층(transport)으로 끼워 넣으므로
+ai_utils, llm_service, LangGraph 노드, LangChain 체인 등 호출 위치와 상관없이 적용됩니다.
+- 동시 요청 수 / 동시 토큰 수(프롬프트 추정치 + max_tokens) 상한
+- 우선순위 클래스: interactive(기본) > batch. 같은 클래스 안에서는 FIFO
+- 429/5xx는 Retry-After(-ms)를 따르거나 지터가 섞인 지수 백오프로 재시도하고,
+  429를 받으면 모든 호출이 함께 쉬도록 전역 cooldown을 겁니다 (이미 대기열에 있던 요청 포함).
+- llm_deadline으로 마감 시각을 주면 대기열 대기 / cooldown / 재시도 백오프가 모두 그 안에서 끝나고,
+  남은 시간으로 기다릴 수 없으면 재시도하지 않습니다.
+"""
+import asyncio
+import contextvars
+import heapq
+import itertools
+import json
+import random
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional
+
+import httpx
+
+from . import config
+from .metrics import metrics
+
+PRIORITIES = {"interactive": 0, "batch": 1}
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+_priority: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "llm_priority", default="interactive"
+)
+
+
+@contextmanager
+def llm_priority(name: str):
+    """with 블록 안에서 나가는 LLM 호출의 우선순위 클래스를 지정합니다."""
+    token = _priority.set(name if name in PRIORITIES else "interactive")
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> str:
+    return _priority.get()
+
+
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "llm_deadline", default=None
+)
+
+
+@contextmanager
+def llm_deadline(deadline: Optional[float]):
+    """
+    with 블록 안의 LLM 호출 전체(대기열 + 재시도)가 끝나야 하는 time.monotonic() 기준 마감 시각.
+    None이면 제한이 없고, 중첩되면 더 이른 마감을 씁니다.
+    """
+    outer = _deadline.get()
+    if deadline is None or (outer is not None and outer <= deadline):
+        deadline = outer
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def current_deadline() -> Optional[float]:
+    return _deadline.get()
+
+
+class _Waiter:
+    __slots__ = ("priority", "seq", "tokens", "granted", "notify")
+
+    def __init__(self, priority: int, seq: int, tokens: int, notify: Callable[[], None]):
+        self.priority = priority
+        self.seq = seq
+        self.tokens = tokens
+        self.granted = False
+        self.notify = notify
+
+    def __lt__(self, other: "_Waiter") -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+class LLMScheduler:
+    def __init__(self, max_requests: int, max_tokens: int):
+        self.max_requests = max(1, max_requests)
+        self.max_tokens = max(1, max_tokens)
+        self._lock = threading.Lock()
+        self._heap: list = []
+        self._seq = itertools.count()
+        self._in_flight = 0
+        self._tokens_in_flight = 0
+        self._blocked_until = 0.0
+
+    # --- 슬롯 배분 ---
+    def _grant_locked(self) -> None:
+        while self._heap:
+            waiter = self._heap[0]
+            fits_tokens = (
+                self._tokens_in_flight + waiter.tokens <= self.max_tokens
+                or self._in_flight == 0
+            )
+            if self._in_flight >= self.max_requests or not fits_tokens:
+                break
+            heapq.heappop(self._heap)
+            self._in_flight += 1
+            self._tokens_in_flight += waiter.tokens
+            waiter.granted = True
+            waiter.notify()
+
+    def _enqueue(self, priority: str, tokens: int, notify: Callable[[], None]) -> _Waiter:
+        waiter = _Waiter(PRIORITIES.get(priority, 0), next(self._seq), min(tokens, self.max_tokens), notify)
+        with self._lock:
+            heapq.heappush(self._heap, waiter)
+            self._grant_locked()
+        return waiter
+
+    def _abandon(self, waiter: _Waiter) -> bool:
+        """대기 중인 waiter를 취소합니다. 이미 슬롯을 받았다면 False."""
+        with self._lock:
+            if waiter.granted:
+                return False
+            self._heap.remove(waiter)
+            heapq.heapify(self._heap)
+            return True
+
+    def release(self, tokens: int) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._tokens_in_flight -= min(tokens, self.max_tokens)
+            self._grant_locked()
+
+    def acquire(self, priority: str, tokens: int, timeout: float) -> None:
+        event = threading.Event()
+        waiter = self._enqueue(priority, tokens, event.set)
+        if not event.wait(timeout) and self._abandon(waiter):
+            raise TimeoutError("LLM scheduler queue wait timed out")
+
+    async def acquire_async(self, priority: str, tokens: int, timeout: float) -> None:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def notify() -> None:
+            loop.call_soon_threadsafe(lambda: future.done() or future.set_result(True))
+
+        waiter = self._enqueue(priority, tokens, notify)
+        try:
+            await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            if self._abandon(waiter):
+                raise TimeoutError("LLM scheduler queue wait timed out")
+        except asyncio.CancelledError:
+            if not self._abandon(waiter):
+                self.release(tokens)
+            raise
+
+    # --- 전역 cooldown (429) ---
+    def note_rate_limited(self, delay: float) -> None:
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+
+    def cooldown_remaining(self) -> float:
+        with self._lock:
+            return max(0.0, self._blocked_until - time.monotonic())
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            waiting = {name: 0 for name in PRIORITIES}
+            by_value = {v: k for k, v in PRIORITIES.items()}
+            for waiter in self._heap:
+                waiting[by_value.get(waiter.priority, "interactive")] += 1
+            return {
+                "in_flight_requests": self._in_flight,
+                "in_flight_tokens": self._tokens_in_flight,
+                "max_requests": self.max_requests,
+                "max_tokens": self.max_tokens,
+                "waiting": waiting,
+                "cooldown_seconds": max(0.0, self._blocked_until - time.monotonic()),
+            }
+
+
+def estimate_request_tokens(body: bytes) -> int:
+    """프롬프트 길이(대략 3바이트≈1토큰) + 요청한 max_tokens로 토큰 사용량을 추정합니다."""
+    try:
+        payload = json.loads(body or b"{}")
+    except ValueError:
+        return config.LLM_DEFAULT_COMPLETION_TOKENS
+    prompt_bytes = len(json.dumps(payload.get("messages", []), ensure_ascii=False).encode("utf-8"))
+    completion = (
+        payload.get("max_tokens")
+        or payload.get("max_completion_tokens")
+        or config.LLM_DEFAULT_COMPLETION_TOKENS
+    )
+    return prompt_bytes // 3 + int(completion)
+
+
+def _retry_delay(response: Optional[httpx.Response], attempt: int) -> float:
+    if response is not None:
+        retry_after_ms = response.headers.get("retry-after-ms")
+        if retry_after_ms:
+            try:
+                return min(config.LLM_BACKOFF_MAX_SECONDS, float(retry_after_ms) / 1000.0)
+            except ValueError:
+                pass
+        retry_after = response.headers.get("retry-after")
+        if retry_after:
+            try:
+                return min(config.LLM_BACKOFF_MAX_SECONDS, float(retry_after))
+            except ValueError:
+                try:
+                    delta = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                    return min(config.LLM_BACKOFF_MAX_SECONDS, max(0.0, delta))
+                except (TypeError, ValueError):
+                    pass
+    backoff = min(config.LLM_BACKOFF_MAX_SECONDS, config.LLM_BACKOFF_BASE_SECONDS * (2 ** attempt))
+    return random.uniform(backoff / 2, backoff)
+
+
+def _is_scheduled(request: httpx.Request) -> bool:
+    return request.method == "POST" and request.url.path.endswith("/chat/completions")
+
+
+def _record_wait(priority: str, started: float) -> None:
+    metrics.observe(f"llm_scheduler.queue_wait.{priority}", time.monotonic() - started)
+
+
+def _queue_timeout(deadline: Optional[float]) -> float:
+    if deadline is None:
+        return config.LLM_SCHEDULER_MAX_QUEUE_SECONDS
+    return max(0.0, min(config.LLM_SCHEDULER_MAX_QUEUE_SECONDS, deadline - time.monotonic()))
+
+
+def _can_wait(deadline: Optional[float], delay: float) -> bool:
+    """delay만큼 쉬고도 마감 전에 다시 보낼 수 있는지."""
+    return deadline is None or time.monotonic() + delay < deadline
+
+
+def _deadline_error(request: httpx.Request, reason: str) -> httpx.PoolTimeout:
+    metrics.increment("llm_scheduler.deadline_exceeded")
+    return httpx.PoolTimeout(f"LLM request deadline exceeded ({reason})", request=request)
+
+
+class _ReleasingStream(httpx.SyncByteStream):
+    """응답 본문(스트리밍 포함)을 다 읽거나 닫을 때 슬롯을 반납합니다."""
+
+    def __init__(self, stream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+        self._released = False
+
+    def __iter__(self):
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            if not self._released:
+                self._released = True
+                self._release()
+
+
+class _AsyncReleasingStream(httpx.AsyncByteStream):
+    def __init__(self, stream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+        self._released = False
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self._release()
+
+
+class ScheduledTransport(httpx.BaseTransport):
+    def __init__(self, scheduler: LLMScheduler, inner: httpx.BaseTransport):
+        self.scheduler = scheduler
+        self.inner = inner
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if not _is_scheduled(request):
+            return self.inner.handle_request(request)
+        tokens = estimate_request_tokens(request.read())
+        priority = current_priority()
+        deadline = current_deadline()
+        for attempt in range(config.LLM_SCHEDULER_MAX_RETRIES + 1):
+            started = time.monotonic()
+            try:
+                self.scheduler.acquire(priority, tokens, _queue_timeout(deadline))
+            except TimeoutError as e:
+                metrics.increment("llm_scheduler.queue_timeouts")
+                raise httpx.PoolTimeout(str(e), request=request)
+            release = lambda: self.scheduler.release(tokens)
+            # 슬롯을 받은 뒤에도 429 cooldown 중이면 끝날 때까지 보내지 않습니다 (대기열에 있던 요청 포함).
+            cooldown = self.scheduler.cooldown_remaining()
+            if cooldown:
+                if not _can_wait(deadline, cooldown):
+                    release()
+                    raise _deadline_error(request, "rate-limit cooldown")
+                time.sleep(cooldown)
+            _record_wait(priority, started)
+            try:
+                response = self.inner.handle_request(request)
+            except BaseException as e:
+                release()
+                delay = _retry_delay(None, attempt)
+                if (
+                    not isinstance(e, httpx.TransportError)
+                    or attempt >= config.LLM_SCHEDULER_MAX_RETRIES
+                    or not _can_wait(deadline, delay)
+                ):
+                    raise
+                metrics.increment("llm_scheduler.retries.transport_error")
+                time.sleep(delay)
+                continue
+
+            if response.status_code in RETRY_STATUSES and attempt < config.LLM_SCHEDULER_MAX_RETRIES:
+                delay = _retry_delay(response, attempt)
+                if response.status_code == 429:
+                    # 슬롯을 반납하기 전에 걸어야 다음 대기자가 곧바로 다시 보내지 않습니다.
+                    self.scheduler.note_rate_limited(delay)
+                if _can_wait(deadline, delay):
+                    try:
+                        response.read()
+                        response.close()
+                    finally:
+                        release()
+                    metrics.increment(f"llm_scheduler.retries.{response.status_code}")
+                    time.sleep(delay)
+                    continue
+                metrics.increment("llm_scheduler.deadline_exceeded")
+
+            response.stream = _ReleasingStream(response.stream, release)
+            return response
+        raise RuntimeError("unreachable")
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+class AsyncScheduledTransport(httpx.AsyncBaseTransport):
+    def __init__(self, scheduler: LLMScheduler, inner: httpx.AsyncBaseTransport):
+        self.scheduler = scheduler
+        self.inner = inner
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if not _is_scheduled(request):
+            return await self.inner.handle_async_request(request)
+        tokens = estimate_request_tokens(await request.aread())
+        priority = current_priority()
+        deadline = current_deadline()
+        for attempt in range(config.LLM_SCHEDULER_MAX_RETRIES + 1):
+            started = time.monotonic()
+            try:
+                await self.scheduler.acquire_async(priority, tokens, _queue_timeout(deadline))
+            except TimeoutError as e:
+                metrics.increment("llm_scheduler.queue_timeouts")
+                raise httpx.PoolTimeout(str(e), request=request)
+            release = lambda: self.scheduler.release(tokens)
+            cooldown = self.scheduler.cooldown_remaining()
+            if cooldown:
+                if not _can_wait(deadline, cooldown):
+                    release()
+                    raise _deadline_error(request, "rate-limit cooldown")
+                try:
+                    await asyncio.sleep(cooldown)
+                except BaseException:
+                    release()
+                    raise
+            _record_wait(priority, started)
+            try:
+                response = await self.inner.handle_async_request(request)
+            except BaseException as e:
+                release()
+                delay = _retry_delay(None, attempt)
+                if (
+                    not isinstance(e, httpx.TransportError)
+                    or attempt >= config.LLM_SCHEDULER_MAX_RETRIES
+                    or not _can_wait(deadline, delay)
+                ):
+                    raise
+                metrics.increment("llm_scheduler.retries.transport_error")
+                await asyncio.sleep(delay)
+                continue
+
+            if response.status_code in RETRY_STATUSES and attempt < config.LLM_SCHEDULER_MAX_RETRIES:
+                delay = _retry_delay(response, attempt)
+                if response.status_code == 429:
+                    self.scheduler.note_rate_limited(delay)
+                if _can_wait(deadline, delay):
+                    try:
+                        await response.aread()
+                        await response.aclose()
+                    finally:
+                        release()
+                    metrics.increment(f"llm_scheduler.retries.{response.status_code}")
+                    await asyncio.sleep(delay)
+                    continue
+                metrics.increment("llm_scheduler.deadline_exceeded")
+
+            response.stream = _AsyncReleasingStream(response.stream, release)
+            return response
+        raise RuntimeError("unreachable")
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+
+@lru_cache()
+def get_llm_scheduler() -> LLMScheduler:
+    scheduler = LLMScheduler(
+        max_requests=config.LLM_MAX_CONCURRENT_REQUESTS,
+        max_tokens=config.LLM_MAX_CONCURRENT_TOKENS,
+    )
+    metrics.register_reporter("llm_scheduler", scheduler.snapshot)
+    return scheduler
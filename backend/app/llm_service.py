@@ -1,7 +1,10 @@
 # app/llm_service.py
-import openai
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional
 from . import config
+from .llm_clients import get_openai_client, get_async_openai_client
+from .prompt_budget import fit_ranked_documents, log_prompt_stats
+
+DIALOGUE_SYSTEM_MESSAGE = "당신은 이야기의 대사를 창의적으로 작성하는 전문 작가입니다."
 if config.OPENAI_API_KEY:
     pass
 else:
@@ -11,6 +14,15 @@ else:
 
 
 class LLMService:
+    def _fit_context(self, relevant_docs: List[Dict[str, Any]]):
+        """검색된 캐릭터/세계관 문서를 점수 순으로 PROMPT_CONTEXT_TOKEN_BUDGET 안에 맞춥니다."""
+        return fit_ranked_documents(
+            relevant_docs,
+            budget_tokens=config.PROMPT_CONTEXT_TOKEN_BUDGET,
+            model=config.DIALOGUE_LLM_MODEL,
+            min_doc_tokens=config.PROMPT_MIN_DOC_TOKENS,
+        )
+
     def _construct_prompt_for_generation(  
         self,
         relevant_docs: List[Dict[str, Any]],
@@ -20,6 +32,7 @@ class LLMService:
         context_str = "다음은 이 이야기의 캐릭터 및 세계관에 대한 참고 정보입니다:\n"
         characters_info = []
         worlds_info = []
+        relevant_docs, budget_stats = self._fit_context(relevant_docs)
 
         for doc in relevant_docs:
             if doc["content_type"] == "character":
@@ -48,6 +61,7 @@ class LLMService:
             f"{additional_prompt_text}"
             f"생성된 대사:"
         )
+        log_prompt_stats("dialogue.generate", prompt, config.DIALOGUE_LLM_MODEL, budget_stats)
         return prompt
 
     def _construct_prompt_for_modification(
@@ -61,6 +75,7 @@ class LLMService:
         context_str = "다음은 이 이야기의 캐릭터 및 세계관에 대한 참고 정보입니다:\n"
         characters_info = []
         worlds_info = []
+        relevant_docs, budget_stats = self._fit_context(relevant_docs)
         for doc in relevant_docs:
             if doc["content_type"] == "character":
                 characters_info.append(f"- {doc['text_content']}")
@@ -91,6 +106,7 @@ class LLMService:
             f"수정된 전체 대사만 반환해주세요:\n\n"
             f"수정된 대사:"
         )
+        log_prompt_stats("dialogue.modify", prompt, config.DIALOGUE_LLM_MODEL, budget_stats)
         return prompt
 
     def _call_llm(self, prompt: str, temperature: float) -> str:
@@ -103,13 +119,12 @@ class LLMService:
         print(f"--- Model: {config.DIALOGUE_LLM_MODEL}, Temperature: {temperature} ---")
         print("------------------")
         try:
-            client = openai.OpenAI(api_key=config.OPENAI_API_KEY)
-            response = client.chat.completions.create(
+            response = get_openai_client().chat.completions.create(
                 model=config.DIALOGUE_LLM_MODEL,
                 messages=[
                     {
                         "role": "system",
-                        "content": "당신은 이야기의 대사를 창의적으로 작성하는 전문 작가입니다.",
+                        "content": DIALOGUE_SYSTEM_MESSAGE,
                     },
                     {"role": "user", "content": prompt},
                 ],
@@ -121,6 +136,27 @@ class LLMService:
             print(error_msg)
             return error_msg
 
+    async def _stream_llm(self, prompt: str, temperature: float) -> AsyncIterator[str]:
+        """토큰이 도착하는 대로 내보냅니다. 제너레이터가 닫히면 업스트림 스트림도 닫습니다."""
+        if not config.OPENAI_API_KEY:
+            raise ValueError("LLM Error: OPENAI_API_KEY is not configured.")
+        print(f"--- Streaming LLM call (Model: {config.DIALOGUE_LLM_MODEL}, Temperature: {temperature}) ---")
+        stream = await get_async_openai_client().chat.completions.create(
+            model=config.DIALOGUE_LLM_MODEL,
+            messages=[
+                {"role": "system", "content": DIALOGUE_SYSTEM_MESSAGE},
+                {"role": "user", "content": prompt},
+            ],
+            temperature=temperature,
+            stream=True,
+        )
+        try:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            await stream.close()
+
     def generate_dialogue(  
         self,
         relevant_docs: List[Dict[str, Any]],
@@ -133,6 +169,21 @@ class LLMService:
             additional_prompt,
         )
         return self._call_llm(prompt, temperature=config.DIALOGUE_LLM_TEMP)
+
+    def stream_dialogue(
+        self,
+        relevant_docs: List[Dict[str, Any]],
+        user_provided_context: str,
+        additional_prompt: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """generate_dialogue의 스트리밍 버전. 생성되는 토큰을 순서대로 내보냅니다."""
+        prompt = self._construct_prompt_for_generation(
+            relevant_docs,
+            user_provided_context,
+            additional_prompt,
+        )
+        return self._stream_llm(prompt, temperature=config.DIALOGUE_LLM_TEMP)
+
     def modify_dialogue(
         self,
         relevant_docs: List[Dict[str, Any]],
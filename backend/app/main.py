@@ -1,12 +1,20 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
 from contextlib import asynccontextmanager  
 from pathlib import Path
 from dotenv import load_dotenv
 import os
 from fastapi.middleware.cors import CORSMiddleware
-from .routers import words, works, episodes, characters, worlds, plannings, search, wordexamples
+from .routers import words, works, episodes, characters, worlds, plannings, search, wordexamples, jobs
 from .crud.opensearch_crud import create_works_content_index  
 from . import config
+from .metrics import metrics
+from .llm_clients import close_llm_clients
+from .job_queue import start_job_workers, stop_job_workers
+from .chains import warm_chains
+from .semantic_cache import all_semantic_caches
+from .database import dispose_async_engine, engine
+from .models import ensure_schema
+from .view_counter import view_counter
 
 env_path = Path(__file__).resolve().parent.parent / ".env"
 load_dotenv(dotenv_path=env_path)
@@ -35,8 +43,22 @@ async def lifespan(app: FastAPI):
         print(
             f"!!! Critical Error during OpenSearch index setup on startup (lifespan): {e}"
         )
+    warm_chains()
+    try:
+        ensure_schema(engine)
+    except Exception as e:
+        print(f"!!! Error ensuring database tables/indexes: {e}")
+    try:
+        start_job_workers()
+    except Exception as e:
+        print(f"!!! Error starting background job workers: {e}")
+    view_counter.start()
     yield
     print("Application shutdown (lifespan)...")
+    view_counter.stop()
+    stop_job_workers()
+    await close_llm_clients()
+    await dispose_async_engine()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -53,6 +75,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],  
     allow_headers=["*"],  
+    expose_headers=[config.NEXT_CURSOR_HEADER],  # 페이지네이션 커서를 브라우저에서 읽을 수 있게
 )
 
 app.include_router(words.router)  
@@ -62,10 +85,31 @@ app.include_router(characters.router)
 app.include_router(worlds.router)
 app.include_router(plannings.router)
 app.include_router(wordexamples. router)
+app.include_router(jobs.router)
+app.include_router(search.router)
 
 @app.get("/")
 async def root():
     return {"message": "Welcome to Personal Dictionary API"}
 
 
+@app.get("/metrics")
+async def get_metrics():
+    return metrics.snapshot()
+
+
+@app.get("/metrics/semantic-cache/samples")
+async def get_semantic_cache_samples():
+    """의미 캐시 적중 샘플 (오탐 여부 검토용)."""
+    return {name: cache.samples() for name, cache in all_semantic_caches().items()}
+
+
+@app.post("/metrics/semantic-cache/{namespace}/samples/{sample_id}")
+async def review_semantic_cache_sample(namespace: str, sample_id: int, false_hit: bool):
+    cache = all_semantic_caches().get(namespace)
+    if not cache or not cache.mark_sample(sample_id, false_hit):
+        raise HTTPException(status_code=404, detail="샘플을 찾을 수 없습니다.")
+    return cache.stats()
+
+
 # python -m uvicorn app.main:app --reload --host 0.0.0.0 --port 8000
@@ -0,0 +1,62 @@
+# app/metrics.py
+import threading
+from typing import Callable, Dict, Any
+
+
+class MetricsRegistry:
+    """프로세스 내 카운터와 소요 시간을 모아두는 간단한 레지스트리입니다."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = {}
+        self._timers: Dict[str, Dict[str, float]] = {}
+        self._reporters: Dict[str, Callable[[], Dict[str, Any]]] = {}
+
+    def register_reporter(self, name: str, reporter: Callable[[], Dict[str, Any]]) -> None:
+        """snapshot() 시점에 호출되어 현재 상태(캐시 적중률, 풀 상태 등)를 보고하는 함수를 등록합니다."""
+        with self._lock:
+            self._reporters[name] = reporter
+
+    def increment(self, name: str, value: float = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name: str, seconds: float) -> None:
+        with self._lock:
+            timer = self._timers.setdefault(
+                name, {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+            )
+            timer["count"] += 1
+            timer["total_seconds"] += seconds
+            timer["max_seconds"] = max(timer["max_seconds"], seconds)
+
+    def snapshot_counters(self, prefix: str = "") -> Dict[str, float]:
+        with self._lock:
+            return {k: v for k, v in self._counters.items() if k.startswith(prefix)}
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            timers = {}
+            for name, timer in self._timers.items():
+                timers[name] = {
+                    **timer,
+                    "avg_seconds": (
+                        timer["total_seconds"] / timer["count"] if timer["count"] else 0.0
+                    ),
+                }
+            snapshot = {"counters": dict(self._counters), "timers": timers}
+            reporters = dict(self._reporters)
+        for name, reporter in reporters.items():
+            try:
+                snapshot[name] = reporter()
+            except Exception as e:
+                snapshot[name] = {"error": str(e)}
+        return snapshot
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._timers.clear()
+
+
+metrics = MetricsRegistry()
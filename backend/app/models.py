@@ -6,30 +6,16 @@ from sqlalchemy import (
     DateTime,
     Text,
     Integer,
+    Float,
+    JSON,
+    Index,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 from sqlalchemy.sql.expression import (
     text,
 )
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from dotenv import load_dotenv
-from pathlib import Path
-import os
-
-env_path = Path(__file__).resolve().parent.parent / ".env"
-load_dotenv(dotenv_path=env_path)
-
-DATABASE_URL = os.getenv("DATABASE_URL")
-if not DATABASE_URL:
-    raise ValueError("DATABASE_URL is not set in the .env file")
-
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-Base = declarative_base()
+from .database import Base, engine, SessionLocal  # noqa: F401  엔진/세션은 database 한 곳에서만 만듭니다
 
 
 class User(Base):
@@ -42,6 +28,10 @@ class User(Base):
     works = relationship("Work", back_populates="user", cascade="all, delete-orphan")
 
 
+# create_user_word의 ON CONFLICT 대상. 기존 중복 때문에 만들지 못했으면 crud.words가 조회 후 INSERT로 대신합니다.
+WORD_NAME_UNIQUE_INDEX = "ux_words_user_word_name"
+
+
 class Word(Base):
     __tablename__ = "words"
 
@@ -63,6 +53,31 @@ class Word(Base):
     examples = relationship(
         "WordExample", back_populates="word", cascade="all, delete-orphan"
     )
+    enrichment = relationship(
+        "WordEnrichment",
+        back_populates="word",
+        uselist=False,
+        cascade="all, delete-orphan",
+    )
+
+    # 사용자별 정렬 목록(조회수순 / 최신순)의 keyset 페이지네이션용 인덱스.
+    # word_count는 NULL일 수 있어 정렬/인덱스 모두 COALESCE(word_count, 0)을 씁니다.
+    __table_args__ = (
+        # 사용자별 단어 이름 중복 방지 + 이름 조회 (create_user_word의 ON CONFLICT 대상)
+        Index(WORD_NAME_UNIQUE_INDEX, user_id, word_name, unique=True),
+        Index(
+            "ix_words_user_count_id",
+            user_id,
+            func.coalesce(word_count, 0).desc(),
+            words_id.desc(),
+        ),
+        Index(
+            "ix_words_user_created_id",
+            user_id,
+            word_created_time.desc(),
+            words_id.desc(),
+        ),
+    )
 
 
 class WordExample(Base):
@@ -126,9 +141,10 @@ class World(Base):
     works_id = Column(
         BigInteger, ForeignKey("works.works_id"), nullable=False, index=True
     )
-    worlds_content = Column(
+    # 본문은 목록/요약에서 읽지 않으므로 접근하거나 undefer할 때만 불러옵니다.
+    worlds_content = deferred(Column(
         Text, nullable=True, server_default=""
-    )
+    ))
 
     work = relationship("Work", back_populates="worlds")
 
@@ -143,9 +159,9 @@ class Planning(Base):
     plan_title = Column(
         String(200), nullable=True, server_default="unnamed"
     )
-    plan_content = Column(
+    plan_content = deferred(Column(
         Text, nullable=True, server_default=""
-    )
+    ))
 
     work = relationship("Work", back_populates="plannings")
 
@@ -157,12 +173,122 @@ class Episode(Base):
     works_id = Column(
         BigInteger, ForeignKey("works.works_id"), nullable=False, index=True
     )
-    episode_content = Column(
+    episode_content = deferred(Column(
         Text, nullable=True, server_default=""
-    )
+    ))
 
     work = relationship("Work", back_populates="episodes")
 
+
+class Job(Base):
+    """오래 걸리는 AI 작업용 백그라운드 작업 큐. 워커가 FOR UPDATE SKIP LOCKED로 하나씩 가져갑니다."""
+
+    __tablename__ = "jobs"
+
+    job_id = Column(BigInteger, primary_key=True, index=True, autoincrement=True)
+    job_type = Column(String(100), nullable=False)
+    status = Column(
+        String(20), nullable=False, server_default="queued"
+    )  # queued | running | succeeded | failed
+    payload = Column(JSON, nullable=False)
+    result = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    progress = Column(Float, nullable=True)
+    attempts = Column(Integer, nullable=False, server_default=text("0"))
+    max_attempts = Column(Integer, nullable=False, server_default=text("3"))
+    run_after = Column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    locked_by = Column(String(100), nullable=True)
+    lease_expires_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (Index("ix_jobs_status_run_after", "status", "run_after"),)
+
+
+class WordEnrichment(Base):
+    """단어 저장 직후 백그라운드에서 미리 만들어 두는 AI 결과 (예문, 쉬운 뜻, 관련 단어)."""
+
+    __tablename__ = "word_enrichments"
+
+    words_id = Column(
+        BigInteger, ForeignKey("words.words_id", ondelete="CASCADE"), primary_key=True
+    )
+    status = Column(
+        String(20), nullable=False, server_default="pending"
+    )  # pending | ready | failed
+    examples = Column(Text, nullable=True)
+    easy_meaning = Column(Text, nullable=True)
+    related_words = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+    word = relationship("Word", back_populates="enrichment")
+
+
+# 단어 검색(crud.search)용 PostgreSQL 전용 스키마.
+# 생성 tsvector 컬럼은 sqlite에서 만들 수 없고 응답에 쓰지도 않으므로 모델에 매핑하지 않고 DDL로만 만듭니다.
+# 'simple' 설정은 어간 추출 없이 공백/구두점으로만 나눕니다 (한국어 사전 설정이 없음).
+# pg_trgm은 DB의 LC_CTYPE이 C이면 한글을 단어 문자로 보지 않으므로 ko_KR.UTF-8 / C.UTF-8 로케일이 필요합니다.
+SEARCH_DDL = (
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "ALTER TABLE words ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('simple', coalesce(word_name, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(word_content, '')), 'B')) STORED",
+    "ALTER TABLE word_examples ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS ("
+    "to_tsvector('simple', coalesce(word_example_content, ''))) STORED",
+    "CREATE INDEX IF NOT EXISTS ix_words_search_vector ON words USING gin (search_vector)",
+    "CREATE INDEX IF NOT EXISTS ix_word_examples_search_vector ON word_examples USING gin (search_vector)",
+    "CREATE INDEX IF NOT EXISTS ix_words_word_name_trgm ON words USING gin (word_name gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_words_word_content_trgm ON words USING gin (word_content gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_word_examples_content_trgm "
+    "ON word_examples USING gin (word_example_content gin_trgm_ops)",
+)
+
+
+def ensure_search_schema(bind) -> bool:
+    """
+    검색용 확장/생성 컬럼/GIN 인덱스를 만듭니다. PostgreSQL이 아니거나 실패하면 False.
+    문장마다 따로 커밋해서 하나가 실패해도(예: 확장 생성 권한 없음) 나머지는 시도합니다.
+    """
+    if bind.dialect.name != "postgresql":
+        return False
+    ok = True
+    for statement in SEARCH_DDL:
+        try:
+            with bind.begin() as conn:
+                conn.execute(text(statement))
+        except Exception as e:
+            ok = False
+            print(f"!!! Could not apply search schema [{statement[:60]}...]: {e}")
+    return ok
+
+
+def ensure_schema(bind) -> None:
+    """
+    마이그레이션 도구 없이 나중에 추가된 테이블과 인덱스를 없을 때만 만듭니다 (기존 것은 건드리지 않음).
+    """
+    for table in (Job.__table__, WordEnrichment.__table__):
+        table.create(bind=bind, checkfirst=True)
+    for index in Word.__table__.indexes:
+        try:
+            index.create(bind=bind, checkfirst=True)
+        except Exception as e:
+            # 예: 기존 데이터에 (user_id, word_name) 중복이 있으면 고유 인덱스를 만들 수 없음.
+            # 이 경우 crud.words.create_user_word는 ON CONFLICT 대신 조회 후 INSERT로 동작합니다.
+            print(f"!!! Could not create index {index.name}: {e}")
+    ensure_search_schema(bind)
+
+
 if __name__ == "__main__":
     Base.metadata.create_all(bind=engine)
     print("✅ 테이블 생성 완료")
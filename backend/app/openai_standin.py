@@ -0,0 +1,300 @@
+# app/openai_standin.py
+"""
+OpenAI 호환 /v1/chat/completions 로컬 stand-in 서버.
+
+실제 토큰을 쓰지 않고 네트워크 없이 find-related, 대사 생성, 예문 생성 경로를 부하 테스트하기 위한 용도입니다.
+첫 토큰 지연(분포 선택 가능)과 초당 토큰 수를 흉내 내고, 스트리밍/structured output(json_schema, tools)을 지원합니다.
+
+실행:
+    python -m uvicorn app.openai_standin:app --port 8001
+앱 쪽 설정 (.env):
+    OPENAI_BASE_URL=http://localhost:8001/v1
+    OPENAI_API_KEY=standin          # 키 검사 통과용 아무 값
+    WEB_SEARCH_PROVIDER=fixture     # 웹 검색도 오프라인으로
+"""
+import asyncio
+import json
+import random
+import re
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from . import config
+
+_rng = random.Random(config.STANDIN_SEED)
+
+with open(config.STANDIN_RESPONSES_PATH, encoding="utf-8") as f:
+    _RESPONSES: Dict[str, Any] = json.load(f)
+
+app = FastAPI(title="OpenAI stand-in")
+
+
+def _sample_first_token_seconds() -> float:
+    mean = config.STANDIN_FIRST_TOKEN_MS / 1000.0
+    spread = config.STANDIN_FIRST_TOKEN_SPREAD
+    distribution = config.STANDIN_LATENCY_DISTRIBUTION
+    if distribution == "fixed" or mean <= 0:
+        return max(0.0, mean)
+    if distribution == "uniform":
+        return _rng.uniform(mean * (1 - spread), mean * (1 + spread))
+    # lognormal: 중앙값이 mean이고 spread가 시그마인 긴 꼬리 분포 (실제 API 지연과 비슷)
+    return mean * _rng.lognormvariate(0.0, spread)
+
+
+def _message_text(content: Any) -> str:
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return " ".join(part.get("text", "") for part in content if isinstance(part, dict))
+    return ""
+
+
+def _extract_keyword(messages: List[Dict[str, Any]]) -> str:
+    """프롬프트에서 따옴표로 감싼 단어(없으면 마지막 사용자 메시지 첫 단어)를 키워드로 씁니다."""
+    text = " ".join(_message_text(m.get("content")) for m in messages)
+    match = re.search(r"[\"'“‘]([^\"'”’\n]{1,20})[\"'”’]", text)
+    if match:
+        return match.group(1).strip()
+    for message in reversed(messages):
+        if message.get("role") == "user":
+            words = _message_text(message.get("content")).split()
+            if words:
+                return words[0][:20]
+    return _RESPONSES.get("default_keyword", "이야기")
+
+
+def _user_lines(messages: List[Dict[str, Any]]) -> List[str]:
+    for message in reversed(messages):
+        if message.get("role") == "user":
+            lines = [l.strip() for l in _message_text(message.get("content")).splitlines()]
+            return [l for l in lines if l]
+    return []
+
+
+def _templated_text(keyword: str, max_tokens: int) -> str:
+    sentences = _RESPONSES["sentences"]
+    parts: List[str] = []
+    while sum(len(_tokenize(p)) for p in parts) < max_tokens:
+        parts.append(_rng.choice(sentences).format(keyword=keyword))
+    return "".join(_tokenize("\n".join(parts))[:max_tokens])
+
+
+def _tokenize(text: str) -> List[str]:
+    """대략 한국어 2글자 ≈ 1토큰으로 잘라 스트리밍 청크로 씁니다."""
+    return [text[i : i + 2] for i in range(0, len(text), 2)] or [""]
+
+
+def _resolve(schema: Dict[str, Any], root: Dict[str, Any]) -> Dict[str, Any]:
+    ref = schema.get("$ref")
+    if ref and ref.startswith("#/"):
+        node: Any = root
+        for part in ref[2:].split("/"):
+            node = node[part]
+        return node
+    return schema
+
+
+def _fake_from_schema(
+    schema: Dict[str, Any], root: Dict[str, Any], keyword: str, lines: List[str], name: str = ""
+) -> Any:
+    schema = _resolve(schema, root)
+    if "anyOf" in schema:
+        return _fake_from_schema(schema["anyOf"][0], root, keyword, lines, name)
+    kind = schema.get("type")
+    if kind == "object" or "properties" in schema:
+        return {
+            prop: _fake_from_schema(sub, root, keyword, lines, prop)
+            for prop, sub in schema.get("properties", {}).items()
+        }
+    if kind == "array":
+        item_schema = _resolve(schema.get("items", {}), root)
+        if "word" in item_schema.get("properties", {}) and lines:
+            # 여러 단어를 한 번에 보내는 일괄 호출: 입력 줄마다 항목 하나씩
+            return [
+                {
+                    **_fake_from_schema(item_schema, root, line, lines),
+                    "word": line,
+                }
+                for line in lines
+            ]
+        return [_fake_from_schema(item_schema, root, keyword, lines, name) for _ in range(3)]
+    if kind == "integer":
+        return _rng.randint(1, 5)
+    if kind == "number":
+        return round(_rng.random(), 3)
+    if kind == "boolean":
+        return True
+    if name == "word":
+        return keyword
+    return _rng.choice(_RESPONSES["sentences"]).format(keyword=keyword)
+
+
+def _build_completion(body: Dict[str, Any]) -> Dict[str, Any]:
+    """응답 종류(일반 텍스트 / JSON 리스트 / json_schema / tool call)를 판별해 내용을 만듭니다."""
+    messages = body.get("messages", [])
+    keyword = _extract_keyword(messages)
+    lines = _user_lines(messages)
+    max_tokens = body.get("max_tokens") or body.get("max_completion_tokens")
+    target_tokens = min(max_tokens or config.STANDIN_DEFAULT_COMPLETION_TOKENS, config.STANDIN_DEFAULT_COMPLETION_TOKENS)
+    prompt_text = " ".join(_message_text(m.get("content")) for m in messages)
+
+    response_format = body.get("response_format") or {}
+    if response_format.get("type") == "json_schema":
+        schema = response_format.get("json_schema", {}).get("schema", {})
+        return {"content": json.dumps(_fake_from_schema(schema, schema, keyword, lines), ensure_ascii=False)}
+
+    tools = body.get("tools") or []
+    if tools:
+        function = tools[0].get("function", {})
+        schema = function.get("parameters", {})
+        return {
+            "content": None,
+            "tool_calls": [
+                {
+                    "id": f"call_{uuid.uuid4().hex[:24]}",
+                    "type": "function",
+                    "function": {
+                        "name": function.get("name", "tool"),
+                        "arguments": json.dumps(
+                            _fake_from_schema(schema, schema, keyword, lines), ensure_ascii=False
+                        ),
+                    },
+                }
+            ],
+        }
+
+    if "JSON 리스트" in prompt_text or response_format.get("type") == "json_object":
+        words = _rng.sample(_RESPONSES["related_words"], k=min(5, len(_RESPONSES["related_words"])))
+        return {"content": json.dumps(words, ensure_ascii=False)}
+
+    return {"content": _templated_text(keyword, target_tokens)}
+
+
+def _usage(body: Dict[str, Any], completion_tokens: int) -> Dict[str, int]:
+    prompt_chars = sum(len(_message_text(m.get("content"))) for m in body.get("messages", []))
+    prompt_tokens = max(1, prompt_chars // 2)
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+    }
+
+
+def _completion_tokens(message: Dict[str, Any]) -> int:
+    text = message.get("content") or ""
+    for call in message.get("tool_calls", []):
+        text += call["function"]["arguments"]
+    return len(_tokenize(text))
+
+
+def _rate_limited() -> Optional[JSONResponse]:
+    if config.STANDIN_ERROR_RATE > 0 and _rng.random() < config.STANDIN_ERROR_RATE:
+        return JSONResponse(
+            status_code=429,
+            headers={"Retry-After": "1"},
+            content={
+                "error": {
+                    "message": "Rate limit reached (stand-in)",
+                    "type": "rate_limit_error",
+                    "code": "rate_limit_exceeded",
+                }
+            },
+        )
+    return None
+
+
+async def _stream_chunks(body: Dict[str, Any], message: Dict[str, Any], completion_id: str, model: str):
+    created = int(time.time())
+    per_token = 1.0 / config.STANDIN_TOKENS_PER_SECOND if config.STANDIN_TOKENS_PER_SECOND > 0 else 0.0
+
+    def chunk(delta: Dict[str, Any], finish_reason: Optional[str] = None, usage=None) -> str:
+        payload = {
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": created,
+            "model": model,
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}] if usage is None else [],
+        }
+        if usage is not None:
+            payload["usage"] = usage
+        return f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+    await asyncio.sleep(_sample_first_token_seconds())
+    yield chunk({"role": "assistant", "content": ""})
+
+    if message.get("tool_calls"):
+        call = message["tool_calls"][0]
+        yield chunk(
+            {
+                "tool_calls": [
+                    {
+                        "index": 0,
+                        "id": call["id"],
+                        "type": "function",
+                        "function": {"name": call["function"]["name"], "arguments": ""},
+                    }
+                ]
+            }
+        )
+        for piece in _tokenize(call["function"]["arguments"]):
+            await asyncio.sleep(per_token)
+            yield chunk({"tool_calls": [{"index": 0, "function": {"arguments": piece}}]})
+        finish_reason = "tool_calls"
+    else:
+        for piece in _tokenize(message.get("content") or ""):
+            await asyncio.sleep(per_token)
+            yield chunk({"content": piece})
+        finish_reason = "stop"
+
+    yield chunk({}, finish_reason=finish_reason)
+    if (body.get("stream_options") or {}).get("include_usage"):
+        yield chunk({}, usage=_usage(body, _completion_tokens(message)))
+    yield "data: [DONE]\n\n"
+
+
+@app.post("/v1/chat/completions")
+async def chat_completions(request: Request):
+    body = await request.json()
+    limited = _rate_limited()
+    if limited is not None:
+        return limited
+
+    model = body.get("model") or "standin"
+    completion_id = f"chatcmpl-standin-{uuid.uuid4().hex[:12]}"
+    message = {"role": "assistant", **_build_completion(body)}
+
+    if body.get("stream"):
+        return StreamingResponse(
+            _stream_chunks(body, message, completion_id, model),
+            media_type="text/event-stream",
+        )
+
+    completion_tokens = _completion_tokens(message)
+    per_token = 1.0 / config.STANDIN_TOKENS_PER_SECOND if config.STANDIN_TOKENS_PER_SECOND > 0 else 0.0
+    await asyncio.sleep(_sample_first_token_seconds() + completion_tokens * per_token)
+    return {
+        "id": completion_id,
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [
+            {
+                "index": 0,
+                "message": message,
+                "finish_reason": "tool_calls" if message.get("tool_calls") else "stop",
+            }
+        ],
+        "usage": _usage(body, completion_tokens),
+    }
+
+
+@app.get("/v1/models")
+async def list_models():
+    return {
+        "object": "list",
+        "data": [{"id": "standin", "object": "model", "owned_by": "local"}],
+    }
@@ -0,0 +1,109 @@
+# app/prompt_budget.py
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+
+import tiktoken
+
+from .metrics import metrics
+
+
+@lru_cache(maxsize=16)
+def _encoding(model: str):
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        # 모르는 모델명(로컬 stand-in 등)은 최신 OpenAI 기본 인코딩으로 셉니다.
+        return tiktoken.get_encoding("o200k_base")
+
+
+def count_tokens(text: str, model: str) -> int:
+    if not text:
+        return 0
+    return len(_encoding(model).encode(text))
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: str) -> str:
+    """앞에서부터 max_tokens 토큰만 남깁니다."""
+    encoding = _encoding(model)
+    tokens = encoding.encode(text)
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens]).rstrip() + "…"
+
+
+def truncate_middle(text: str, max_tokens: int, model: str, marker: str = "\n...(중략)...\n") -> str:
+    """앞부분과 뒷부분을 반씩 남기고 가운데를 잘라 max_tokens 안에 맞춥니다."""
+    encoding = _encoding(model)
+    tokens = encoding.encode(text)
+    if max_tokens <= 0 or len(tokens) <= max_tokens:
+        return text
+    marker_tokens = len(encoding.encode(marker))
+    keep = max(0, max_tokens - marker_tokens)
+    head = keep // 2
+    tail = keep - head
+    return (
+        encoding.decode(tokens[:head]).rstrip()
+        + marker
+        + encoding.decode(tokens[len(tokens) - tail :]).lstrip()
+    )
+
+
+def fit_ranked_documents(
+    docs: List[Dict[str, Any]],
+    budget_tokens: int,
+    model: str,
+    min_doc_tokens: int,
+    text_key: str = "text_content",
+) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """
+    검색 점수(없으면 검색 순서) 높은 문서부터 예산 안에 담습니다.
+    예산이 모자라면 다음 문서는 남은 만큼 잘라 넣고(min_doc_tokens 이상일 때만), 나머지는 버립니다.
+    budget_tokens가 0 이하이면 자르지 않습니다.
+    """
+    ranked = sorted(
+        enumerate(docs), key=lambda item: (-(item[1].get("score") or 0.0), item[0])
+    )
+    kept: List[Dict[str, Any]] = []
+    stats = {
+        "docs_in": len(docs),
+        "docs_kept": 0,
+        "docs_truncated": 0,
+        "docs_dropped": 0,
+        "context_tokens_in": 0,
+        "context_tokens_out": 0,
+    }
+    remaining = budget_tokens
+    for _, doc in ranked:
+        text = doc.get(text_key) or ""
+        tokens = count_tokens(text, model)
+        stats["context_tokens_in"] += tokens
+        if budget_tokens <= 0 or tokens <= remaining:
+            kept.append(doc)
+            remaining -= tokens
+            stats["context_tokens_out"] += tokens
+        elif remaining >= min_doc_tokens:
+            truncated = truncate_to_tokens(text, remaining, model)
+            kept.append({**doc, text_key: truncated})
+            stats["docs_truncated"] += 1
+            stats["context_tokens_out"] += remaining
+            remaining = 0
+        else:
+            stats["docs_dropped"] += 1
+    stats["docs_kept"] = len(kept)
+    return kept, stats
+
+
+def log_prompt_stats(name: str, prompt: str, model: str, stats: Dict[str, int]) -> int:
+    """호출마다 프롬프트 크기와 잘라낸 양을 기록하고 최종 프롬프트 토큰 수를 반환합니다."""
+    prompt_tokens = count_tokens(prompt, model)
+    print(
+        f"[prompt:{name}] prompt_tokens={prompt_tokens} "
+        + " ".join(f"{k}={v}" for k, v in stats.items())
+    )
+    metrics.increment(f"prompt.{name}.calls")
+    metrics.increment(f"prompt.{name}.prompt_tokens", prompt_tokens)
+    metrics.increment(
+        f"prompt.{name}.tokens_trimmed",
+        max(0, stats.get("context_tokens_in", 0) - stats.get("context_tokens_out", 0)),
+    )
+    return prompt_tokens
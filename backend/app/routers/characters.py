@@ -25,8 +25,7 @@ def create_character_for_work_route(
     character_data: schemas.CharacterCreate = Body(...),  
     db: Session = Depends(database.get_db),
 ):
-    db_work = crud.works.get_work_by_id(db, work_id=work_id)
-    if not db_work:
+    if not crud.works.work_exists(db, work_id=work_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"ID가 {work_id}인 작품을 찾을 수 없습니다.",
@@ -66,8 +65,7 @@ def read_characters_for_work_route(
     limit: int = Query(100, ge=1, le=200, description="반환할 최대 항목 수"),
     db: Session = Depends(database.get_db),
 ):
-    db_work = crud.works.get_work_by_id(db, work_id=work_id)
-    if not db_work:
+    if not crud.works.work_exists(db, work_id=work_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"ID가 {work_id}인 작품을 찾을 수 없습니다.",
@@ -85,8 +83,7 @@ def read_character_route(
     character_id: int = Path(..., description="조회할 캐릭터의 ID"),
     db: Session = Depends(database.get_db),
 ):
-    db_work = crud.works.get_work_by_id(db, work_id=work_id)
-    if not db_work:
+    if not crud.works.work_exists(db, work_id=work_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"ID가 {work_id}인 작품을 찾을 수 없습니다.",
@@ -110,8 +107,7 @@ def update_character_route(
     character_update: schemas.CharacterUpdate = Body(...),  # Body 명시
     db: Session = Depends(database.get_db),
 ):
-    db_work = crud.works.get_work_by_id(db, work_id=work_id)
-    if not db_work:
+    if not crud.works.work_exists(db, work_id=work_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"ID가 {work_id}인 작품을 찾을 수 없습니다.",
@@ -174,8 +170,7 @@ def delete_character_route(
     character_id: int = Path(..., description="삭제할 캐릭터의 ID"),
     db: Session = Depends(database.get_db),
 ):
-    db_work = crud.works.get_work_by_id(db, work_id=work_id)
-    if not db_work:
+    if not crud.works.work_exists(db, work_id=work_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"ID가 {work_id}인 작품을 찾을 수 없습니다.",
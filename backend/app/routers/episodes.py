@@ -1,15 +1,17 @@
 import os
 from dotenv import load_dotenv, find_dotenv
-from fastapi import APIRouter, Depends, HTTPException, Path, Body, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Path, Body, Request, status, Query
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-from langchain_openai import ChatOpenAI
 
 from .. import crud, models, schemas, database 
 from ..llm_service import llm_service
+from ..llm_clients import get_chat_model
 from ..crud.opensearch_crud import search_relevant_documents
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import StrOutputParser
+from ..streaming import sse_from_tokens, sse_response
+from ..crud.episode_generator import episode_prompt_inputs, get_episode_chain
 
 
 env_loaded = load_dotenv(find_dotenv(usecwd=True))
@@ -23,10 +25,7 @@ MODEL_NAME_ENV = os.getenv("MODEL_NAME")
 
 chat_model = None
 
-chat_model = ChatOpenAI(
-    temperature=0.1,  
-    model=MODEL_NAME_ENV,
-)
+chat_model = get_chat_model(MODEL_NAME_ENV, 0.1)
 print("========================================")
 print(f"Chat model initialized with model: {chat_model.model_name}")
 
@@ -48,8 +47,7 @@ def create_episode_for_work(
     episode_data: schemas.EpisodeCreate,
     db: Session = Depends(database.get_db),
 ):
-    db_work = crud.works.get_work_by_id(db, work_id=work_id)
-    if not db_work:
+    if not crud.works.work_exists(db, work_id=work_id):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"ID가 {work_id}인 작품을 찾을 수 없습니다.")
     try:
         created_episode = crud.episodes.create_work_episode(db=db, work_id=work_id, episode_data=episode_data)
@@ -66,17 +64,32 @@ def create_episode_for_work(
     response_model=List[schemas.Episode],
     summary="특정 작품의 모든 에피소드 목록 조회"
 )
-def get_episodes_for_work(
+async def get_episodes_for_work(
     work_id: int = Path(..., description="에피소드 목록을 조회할 작품의 ID"),
-    db: Session = Depends(database.get_db),
+    db: AsyncSession = Depends(database.get_async_db),
 ):
-    db_work = crud.works.get_work_by_id(db, work_id=work_id)
-    if not db_work:
+    if not await crud.aio.works.work_exists(db, work_id=work_id):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"ID가 {work_id}인 작품을 찾을 수 없습니다.")
-    episodes_list = crud.episodes.get_episodes_by_work_id(db=db, work_id=work_id)
+    episodes_list = await crud.aio.episodes.get_episodes_by_work_id(db=db, work_id=work_id)
     return episodes_list
 
 
+# GET /episodes/{work_id}/summary - 에피소드 목록 요약 (본문 대신 미리보기)
+# /{work_id}/{episode_id} 상세 조회보다 먼저 등록되어야 합니다.
+@router.get(
+    "/{work_id}/summary",
+    response_model=List[schemas.EpisodeSummary],
+    summary="특정 작품의 에피소드 목록 요약 조회 (미리보기, 본문 길이)"
+)
+async def get_episode_summaries_for_work(
+    work_id: int = Path(..., description="에피소드 목록을 조회할 작품의 ID"),
+    db: AsyncSession = Depends(database.get_async_db),
+):
+    if not await crud.aio.works.work_exists(db, work_id=work_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"ID가 {work_id}인 작품을 찾을 수 없습니다.")
+    return await crud.aio.episodes.get_episode_summaries_by_work_id(db=db, work_id=work_id)
+
+
 # DELETE /episodes/{work_id}/{episode_id} - 특정 작품의 특정 에피소드 삭제
 @router.delete(
     "/{work_id}/{episode_id}",
@@ -88,8 +101,7 @@ def delete_episode_from_work(
     episode_id: int = Path(..., description="삭제할 에피소드의 ID"),
     db: Session = Depends(database.get_db),
 ):
-    db_work = crud.works.get_work_by_id(db, work_id=work_id)
-    if not db_work:
+    if not crud.works.work_exists(db, work_id=work_id):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"ID가 {work_id}인 작품을 찾을 수 없습니다.")
     deleted_episode = crud.episodes.delete_episode_by_id_and_work_id(db=db, work_id=work_id, episode_id=episode_id)
     if not deleted_episode:
@@ -108,8 +120,7 @@ def set_episode_content(
     content_data: schemas.EpisodeContentUpdate, 
     db: Session = Depends(database.get_db),
 ):
-    db_work = crud.works.get_work_by_id(db, work_id=work_id)
-    if not db_work:
+    if not crud.works.work_exists(db, work_id=work_id):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"ID가 {work_id}인 작품을 찾을 수 없습니다.")
     updated_episode = crud.episodes.update_episode_content(
         db=db,
@@ -125,6 +136,18 @@ def set_episode_content(
     return updated_episode
 
 
+def _save_episode_content(work_id: int, episode_id: int, content: str) -> bool:
+    """스트리밍 완료 후 저장용. 요청 세션과 분리된 새 세션을 사용합니다."""
+    db = database.SessionLocal()
+    try:
+        updated = crud.episodes.update_episode_content(
+            db=db, work_id=work_id, episode_id=episode_id, content=content
+        )
+        return updated is not None
+    finally:
+        db.close()
+
+
 # PUT /episodes/{work_id}/{episode_id}/ai_episode_content - AI 콘텐츠 생성 및 업데이트
 @router.put(
     "/{work_id}/{episode_id}/ai_episode_content",
@@ -164,40 +187,11 @@ async def generate_and_update_ai_episode_content(
 
     print("AI 모델을 사용하여 콘텐츠 생성 시도...")
 
-    prompt_template = ChatPromptTemplate.from_messages(
-        [
-            (
-                "system",
-                "당신은 주어진 내용을 바탕으로 창의적이고 흥미로운 에피소드 콘텐츠를 작성하거나 수정하는 AI 작가입니다. 기존 내용을 참고하여 요청에 따라 더 발전된 내용을 생성해주세요.",
-            ),
-            (
-                "human",
-                "기존 에피소드 내용:\n"
-                "--------------------\n"
-                "{existing_content}\n"
-                "--------------------\n\n"
-                "다음은 이 내용을 바탕으로 추가적으로 고려해야 할 사항 또는 방향입니다 (만약 이 내용이 비어있다면, 기존 내용을 바탕으로 자유롭게 더 흥미롭게 발전시켜주세요):\n"
-                "--------------------\n"
-                "{additional_prompt}\n"
-                "--------------------\n\n"
-                "위 정보를 종합하여 새롭거나 수정된 에피소드 콘텐츠를 작성해주세요. 다른 부연 설명 없이, 최종 결과물인 에피소드 콘텐츠 본문만 제공해주세요.",
-            ),
-        ]
-    )
-    chain = prompt_template | chat_model | StrOutputParser()
+    chain = get_episode_chain()
 
     try:
         generated_or_modified_content = await chain.ainvoke(
-            {
-                "existing_content": (
-                    existing_content if existing_content else "내용 없음"
-                ),
-                "additional_prompt": (
-                    user_additional_prompt
-                    if user_additional_prompt
-                    else "특별한 추가 요청 없음"
-                ),
-            }
+            episode_prompt_inputs(existing_content, user_additional_prompt)
         )
         print(
             f"AI 모델로부터 생성된 내용 (첫 200자): {generated_or_modified_content[:200]}..."
@@ -231,25 +225,76 @@ async def generate_and_update_ai_episode_content(
     return updated_db_episode
 
 
+# PUT /episodes/{work_id}/{episode_id}/ai_episode_content/stream - AI 콘텐츠 생성 (SSE 스트리밍)
+@router.put(
+    "/{work_id}/{episode_id}/ai_episode_content/stream",
+    summary="Stream AI episode content and save it when complete",
+    description="Streams generated episode content token by token (SSE). The episode is updated only after the stream completes; a client disconnect cancels generation without saving.",
+)
+async def stream_ai_episode_content(
+    http_request: Request,
+    work_id: int = Path(..., description="The ID of the work"),
+    episode_id: int = Path(..., description="The ID of the episode to update"),
+    request_body: Optional[schemas.AIEpisodeContentGenerateRequest] = Body(
+        None,
+        description="Additional prompt for AI content generation",
+    ),
+    db: AsyncSession = Depends(database.get_async_db),
+):
+    if not chat_model:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="AI model is not available. Please check server configuration.",
+        )
+    db_episode = await crud.aio.episodes.get_episode_by_id_and_work_id(
+        db=db, work_id=work_id, episode_id=episode_id
+    )
+    if not db_episode:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Episode not found"
+        )
+
+    existing_content = db_episode.episode_content if db_episode.episode_content else ""
+    user_additional_prompt = ""
+    if request_body and request_body.additional_prompt:
+        user_additional_prompt = request_body.additional_prompt
+
+    chain = get_episode_chain()
+    tokens = chain.astream(
+        episode_prompt_inputs(existing_content, user_additional_prompt)
+    )
+
+    async def save_when_complete(full_text: str) -> dict:
+        if not full_text.strip():
+            raise ValueError("AI failed to generate valid content. The response was empty.")
+        saved = await run_in_threadpool(
+            _save_episode_content, work_id, episode_id, full_text
+        )
+        if not saved:
+            raise ValueError("Failed to update episode with new AI content in the database.")
+        return {"work_id": work_id, "episode_id": episode_id, "saved": True}
+
+    return sse_response(sse_from_tokens(http_request, tokens, save_when_complete))
+
+
 # GET /episodes/{work_id}/{episode_id} - 특정 작품의 특정 에피소드 상세 조회 (새로 추가된 엔드포인트)
 @router.get(
     "/{work_id}/{episode_id}",
     response_model=schemas.Episode,  
     summary="특정 작품의 특정 에피소드 상세 조회",
 )
-def get_episode_detail_for_work(
+async def get_episode_detail_for_work(
     work_id: int = Path(..., description="에피소드가 속한 작품의 ID"),
     episode_id: int = Path(..., description="조회할 에피소드의 ID"),
-    db: Session = Depends(database.get_db),
+    db: AsyncSession = Depends(database.get_async_db),
 ):
-    db_work = crud.works.get_work_by_id(db, work_id=work_id)
-    if not db_work:
+    if not await crud.aio.works.work_exists(db, work_id=work_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"ID가 {work_id}인 작품을 찾을 수 없습니다.",
         )
         
-    db_episode = crud.episodes.get_episode_by_id_and_work_id(
+    db_episode = await crud.aio.episodes.get_episode_by_id_and_work_id(
         db=db, work_id=work_id, episode_id=episode_id
     )
 
@@ -280,8 +325,7 @@ async def preview_dialogue_with_rag_endpoint(
         database.get_db
     ),  
 ):
-    db_work = crud.works.get_work_by_id(db, work_id=works_id)
-    if not db_work:
+    if not crud.works.work_exists(db, work_id=works_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"ID가 {works_id}인 작품을 찾을 수 없습니다.",
@@ -343,3 +387,49 @@ async def preview_dialogue_with_rag_endpoint(
             else ["관련 컨텍스트 없음"]
         ),  
     )
+
+
+# GET /episodes/works/{works_id}/preview_dialogue_with_rag/stream - RAG 대사 미리보기 (SSE 스트리밍)
+@router.get(
+    "/works/{works_id}/preview_dialogue_with_rag/stream",
+    summary="RAG를 사용하여 생성될 대사를 토큰 단위로 스트리밍 (DB 저장 안 함)",
+)
+async def stream_preview_dialogue_with_rag(
+    http_request: Request,
+    works_id: int = Path(..., description="대사를 생성할 작품의 ID"),
+    user_input_content: str = Query(
+        ..., description="생성할 에피소드의 핵심 설명 (사용자 입력)"
+    ),
+    additional_prompt: Optional[str] = Query(
+        None, description="생성을 위한 추가적인 프롬프트 또는 지시사항"
+    ),
+    db: AsyncSession = Depends(database.get_async_db),
+):
+    if not await crud.aio.works.work_exists(db, work_id=works_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"ID가 {works_id}인 작품을 찾을 수 없습니다.",
+        )
+
+    relevant_docs = await run_in_threadpool(
+        search_relevant_documents,
+        query_text=user_input_content,
+        works_id=works_id,
+        top_k=5,
+    )
+    tokens = llm_service.stream_dialogue(
+        relevant_docs=relevant_docs,
+        user_provided_context=user_input_content,
+        additional_prompt=additional_prompt,
+    )
+
+    async def attach_context(full_text: str) -> dict:
+        return {
+            "relevant_context_summary": (
+                [doc.get("text_content", "") for doc in relevant_docs]
+                if relevant_docs
+                else ["관련 컨텍스트 없음"]
+            )
+        }
+
+    return sse_response(sse_from_tokens(http_request, tokens, attach_context))
@@ -0,0 +1,89 @@
+from fastapi import APIRouter, Depends, HTTPException, Path, status
+from fastapi.responses import JSONResponse
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+
+from .. import crud, schemas, database
+from ..config import JOB_MAX_ATTEMPTS
+from ..job_queue import get_job_types, validate_job_payload
+from .. import job_handlers  # noqa: F401  작업 핸들러 등록
+
+router = APIRouter(
+    prefix="/jobs",
+    tags=["jobs"],
+)
+
+
+# POST /jobs - 백그라운드 작업 등록
+@router.post(
+    "/",
+    response_model=schemas.JobStatus,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="오래 걸리는 AI 작업을 백그라운드 큐에 등록",
+)
+def submit_job(
+    request: schemas.JobSubmitRequest,
+    db: Session = Depends(database.get_db),
+):
+    if request.job_type not in get_job_types():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"지원하지 않는 작업 종류입니다: '{request.job_type}'. 가능한 값: {get_job_types()}",
+        )
+    try:
+        payload = validate_job_payload(request.job_type, request.payload)
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=e.errors(include_url=False),
+        )
+    return crud.jobs.enqueue_job(
+        db,
+        job_type=request.job_type,
+        payload=payload,
+        max_attempts=request.max_attempts or JOB_MAX_ATTEMPTS,
+    )
+
+
+# GET /jobs/{job_id} - 작업 상태 조회
+@router.get(
+    "/{job_id}",
+    response_model=schemas.JobStatus,
+    summary="백그라운드 작업 상태 조회",
+)
+def get_job_status(
+    job_id: int = Path(..., description="조회할 작업 ID"),
+    db: Session = Depends(database.get_db),
+):
+    db_job = crud.jobs.get_job_by_id(db, job_id=job_id)
+    if not db_job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"ID가 {job_id}인 작업을 찾을 수 없습니다.",
+        )
+    return db_job
+
+
+# GET /jobs/{job_id}/result - 작업 결과 조회 (완료 전에는 202)
+@router.get(
+    "/{job_id}/result",
+    response_model=schemas.JobResult,
+    summary="백그라운드 작업 결과 조회",
+    responses={202: {"description": "작업이 아직 끝나지 않음"}},
+)
+def get_job_result(
+    job_id: int = Path(..., description="결과를 조회할 작업 ID"),
+    db: Session = Depends(database.get_db),
+):
+    db_job = crud.jobs.get_job_by_id(db, job_id=job_id)
+    if not db_job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"ID가 {job_id}인 작업을 찾을 수 없습니다.",
+        )
+    if db_job.status in ("queued", "running"):
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content={"job_id": db_job.job_id, "status": db_job.status},
+        )
+    return db_job
@@ -23,8 +23,7 @@ def create_planning_for_work_route(
     planning_data: schemas.PlanningCreate,
     db: Session = Depends(database.get_db),
 ):
-    db_work = crud.works.get_work_by_id(db, work_id=work_id) 
-    if not db_work:
+    if not crud.works.work_exists(db, work_id=work_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"ID가 {work_id}인 작품을 찾을 수 없습니다."
@@ -51,8 +50,7 @@ def read_plannings_for_work_route(
     work_id: int = Path(..., description="플랜 목록을 조회할 작품의 ID"),
     db: Session = Depends(database.get_db),
 ):
-    db_work = crud.works.get_work_by_id(db, work_id=work_id)
-    if not db_work:
+    if not crud.works.work_exists(db, work_id=work_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"ID가 {work_id}인 작품을 찾을 수 없습니다."
@@ -74,8 +72,7 @@ def read_planning_route(
     plan_id: int = Path(..., description="조회할 플랜의 ID"),
     db: Session = Depends(database.get_db),
 ):
-    db_work = crud.works.get_work_by_id(db, work_id=work_id)
-    if not db_work:
+    if not crud.works.work_exists(db, work_id=work_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"ID가 {work_id}인 작품을 찾을 수 없습니다."
@@ -104,8 +101,7 @@ def update_planning_route(
     planning_update_data: schemas.PlanningUpdate,
     db: Session = Depends(database.get_db),
 ):
-    db_work = crud.works.get_work_by_id(db, work_id=work_id)
-    if not db_work:
+    if not crud.works.work_exists(db, work_id=work_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"ID가 {work_id}인 작품을 찾을 수 없습니다."
@@ -140,8 +136,7 @@ def delete_planning_route(
     plan_id: int = Path(..., description="삭제할 플랜의 ID"),
     db: Session = Depends(database.get_db),
 ):
-    db_work = crud.works.get_work_by_id(db, work_id=work_id)
-    if not db_work:
+    if not crud.works.work_exists(db, work_id=work_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"ID가 {work_id}인 작품을 찾을 수 없습니다."
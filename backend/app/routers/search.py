@@ -0,0 +1,63 @@
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .. import crud, schemas, database
+from ..config import (
+    SEARCH_DEFAULT_LIMIT,
+    SEARCH_MAX_LIMIT,
+    SEARCH_MAX_OFFSET,
+    SEARCH_MAX_QUERY_LENGTH,
+)
+from ..crud.search import SEARCH_MODES
+from ..view_counter import view_counter
+
+router = APIRouter(
+    prefix="/search",
+    tags=["search"],
+)
+
+
+# GET /search/words/{user_id}?q=...&mode=substring|fuzzy|fulltext
+# 단어 이름 / 설명 / 예문에서 찾아 점수순으로 돌려줍니다. 다음 페이지는 next_offset으로 요청합니다.
+@router.get(
+    "/words/{user_id}",
+    response_model=schemas.WordSearchResponse,
+    summary="사용자 단어장 검색 (부분 일치 / 오타 허용 / 전문 검색)",
+)
+async def search_user_words(
+    user_id: str = Path(..., description="검색할 단어장의 사용자 ID"),
+    q: str = Query(..., min_length=1, max_length=SEARCH_MAX_QUERY_LENGTH, description="검색어"),
+    mode: str = Query(
+        "substring",
+        description="substring: 부분 일치, fuzzy: 오타/유사 표기 허용, fulltext: 단어 단위 전문 검색",
+    ),
+    limit: int = Query(SEARCH_DEFAULT_LIMIT, ge=1, le=SEARCH_MAX_LIMIT),
+    offset: int = Query(0, ge=0, le=SEARCH_MAX_OFFSET),
+    db: AsyncSession = Depends(database.get_async_db),
+):
+    query = q.strip()
+    if not query:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="검색어가 비어 있습니다.")
+    if mode not in SEARCH_MODES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"지원하지 않는 검색 방식입니다: '{mode}'. 가능한 값: {list(SEARCH_MODES)}",
+        )
+    if db.bind.dialect.name != "postgresql":
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="단어 검색은 PostgreSQL(pg_trgm)에서만 지원합니다.",
+        )
+
+    rows, next_offset = await crud.aio.search.search_words(
+        db, user_id=user_id, q=query, mode=mode, limit=limit, offset=offset
+    )
+    results = []
+    for row in rows:
+        hit = schemas.WordSearchHit.model_validate(row)
+        # 응답의 조회수는 다른 단어 조회 응답처럼 아직 반영되지 않은 증가량을 포함합니다.
+        hit.word_count = (hit.word_count or 0) + view_counter.pending(hit.words_id)
+        results.append(hit)
+    return schemas.WordSearchResponse(
+        query=query, mode=mode, results=results, next_offset=next_offset
+    )
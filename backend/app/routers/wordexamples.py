@@ -1,9 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, status, Body
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from dotenv import load_dotenv, find_dotenv
 from ..ai_utils import generate_examples_with_gpt, evaluate_user_example
 from .. import crud, models, schemas, database
+from ..view_counter import view_counter
 import os
 from app.config import (
     OPENSEARCH_HOST,
@@ -22,6 +24,7 @@ from opensearchpy import (
 
 from app.langgraph_logic.graph_builder import compiled_graph
 from ..crud.word_examples import bring_exsen
+from ..bulk_examples import start_bulk_examples, get_bulk_examples_job
 embedding_model = None
 opensearch_client = None
 OPENSEARCH_HOSTS_CONFIG = [
@@ -93,14 +96,14 @@ router = APIRouter(
 )
 
 @router.get("/{user_id}/{word_id}/get_examples",response_model=List[schemas.WordExample],summary="특정 사용자의 특정 단어 ID에 대한 모든 예문(용례) 조회")
-def read_examples_for_word_by_id(  
+async def read_examples_for_word_by_id(  
     user_id: str = Path(..., description="단어를 소유한 사용자의 ID"),
     word_id: int = Path(
         ..., description="예문을 조회할 단어의 ID"
     ),  
-    db: Session = Depends(database.get_db),
+    db: AsyncSession = Depends(database.get_async_db),
 ):
-    db_word = crud.words.get_word_by_id(db, word_id=word_id)
+    db_word = await crud.aio.words.get_word_by_id(db, word_id=word_id)
     if not db_word:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -111,11 +114,8 @@ def read_examples_for_word_by_id(
             status_code=status.HTTP_403_FORBIDDEN,  
             detail=f"사용자 ID '{user_id}'는 ID가 {word_id}인 단어에 접근할 권한이 없습니다.",
         )
-    try:
-        crud.words.increment_word_count_atomic(db, word_id=db_word.words_id)
-    except Exception as e:
-        pass  
-    examples = crud.words.get_word_examples_by_word_id(db, word_id=db_word.words_id)
+    view_counter.record(db_word.words_id)
+    examples = await crud.aio.word_examples.get_word_examples_by_word_id(db, word_id=db_word.words_id)
     return examples
 
 
@@ -216,3 +216,41 @@ def delete_word_example_endpoint(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"예문 삭제 중 오류 발생: {str(e)}",
         )
+
+
+# 사용자 단어장 전체 예문 일괄 생성 (백그라운드 작업)
+@router.post(
+    "/{user_id}/examples/bulk",
+    response_model=schemas.BulkExamplesJobStatus,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="사용자의 모든 단어에 대한 예문 일괄 생성 작업 시작",
+)
+def start_bulk_examples_for_user(
+    user_id: str = Path(..., description="예문을 생성할 단어장 소유자 ID"),
+    request: Optional[schemas.BulkExamplesRequest] = Body(None),
+    db: Session = Depends(database.get_db),
+):
+    if not crud.users.get_user_by_id(db, user_id=user_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"ID가 {user_id}인 사용자를 찾을 수 없습니다.",
+        )
+    only_missing = request.only_missing if request else True
+    job = start_bulk_examples(user_id, only_missing=only_missing)
+    return job.to_dict()
+
+
+# 예문 일괄 생성 작업 진행 상황 조회
+@router.get(
+    "/examples/bulk-jobs/{job_id}",
+    response_model=schemas.BulkExamplesJobStatus,
+    summary="예문 일괄 생성 작업 진행 상황 조회",
+)
+def get_bulk_examples_status(job_id: str = Path(..., description="작업 ID")):
+    job = get_bulk_examples_job(job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"ID가 {job_id}인 작업을 찾을 수 없습니다.",
+        )
+    return job.to_dict()
@@ -1,6 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Response, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 from dotenv import load_dotenv, find_dotenv
 from ..ai_utils import generate_examples_with_gpt, evaluate_user_example
 from .. import crud, models, schemas, database 
@@ -15,6 +18,10 @@ from app.config import (
     LLM_GENERATE_MODEL,
     LLM_GENERATE_TEMP,
     OPENAI_API_KEY,
+    FIND_RELATED_BATCH_MAX_QUERIES,
+    FIND_RELATED_BATCH_CONCURRENCY,
+    WORD_PAGE_MAX_LIMIT,
+    NEXT_CURSOR_HEADER,
 )
 
 from sentence_transformers import SentenceTransformer
@@ -26,7 +33,12 @@ from opensearchpy import (
 )
 
 from app.langgraph_logic.graph_builder import compiled_graph
-from ..crud.word_examples import bring_exsen
+from app.langgraph_nodes.rag_node import check_rag_batch
+from app.langgraph_logic.deadline import deadline_from_budget
+from ..crud.word_examples import bring_exsen, easy_min
+from ..word_enrichment import enqueue_word_enrichment
+from ..singleflight import ai_requests, normalize_key
+from ..view_counter import view_counter
 embedding_model = None
 opensearch_client = None
 OPENSEARCH_HOSTS_CONFIG = [{"host": OPENSEARCH_HOST, "port": OPENSEARCH_PORT}]  
@@ -100,12 +112,16 @@ def create_word_for_user(
 ):
     try:
         created_word = crud.words.create_user_word(db=db, word_data=word_data)
-        return created_word
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"단어 추가 중 오류 발생: {str(e)}",
         )
+    # 단어를 저장한 직후 상세 화면에서 쓸 AI 결과를 백그라운드에서 미리 만듭니다.
+    enqueue_word_enrichment(db, created_word.words_id)
+    return created_word
 
 
 # 단어 삭제
@@ -131,42 +147,35 @@ def delete_word_by_id(  # 함수 이름 명확화
 
 
 @router.get("/{user_id}/{word_name}", response_model=schemas.Word)  
-def get_word_by_name_route(  
+async def get_word_by_name_route(  
     word_name: str = Path(..., description="조회할 단어의 이름"),
     user_id: str = Path(
         ..., description="단어 소유자 ID"
     ),  
-    db: Session = Depends(database.get_db),
+    db: AsyncSession = Depends(database.get_async_db),
 ):
-    db_word = crud.words.get_word_by_name_and_user(
+    db_word = await crud.aio.words.get_word_by_name_and_user(
         db, word_name=word_name, user_id=user_id
     )
     if not db_word:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="단어를 찾을 수 없습니다."
         )
-    try:
-        updated_word = crud.words.increment_word_count_atomic(
-            db, word_id=db_word.words_id
-        )
-        if updated_word:
-            return updated_word
-        else:
-            return db_word
-    except Exception as e:
-        return db_word  
+    # 조회수는 버퍼에 모았다가 주기적으로 한 번에 반영합니다.
+    view_counter.record(db_word.words_id)
+    return view_counter.with_pending(db_word)
 
 
 # 단어 ID로 조회 
 @router.get("/{user_id}/id/{word_id}", response_model=schemas.Word)  
-def get_word_by_id_route(
+async def get_word_by_id_route(
     user_id: str = Path(..., description="단어 소유자 ID"),
     word_id: int = Path(
         ..., description="조회할 단어의 ID"
     ),  
-    db: Session = Depends(database.get_db),
+    db: AsyncSession = Depends(database.get_async_db),
 ):
-    db_word = crud.words.get_word_by_id_and_user_id(
+    db_word = await crud.aio.words.get_word_by_id_and_user_id(
         db, word_id=word_id, user_id=user_id
     )
 
@@ -175,45 +184,77 @@ def get_word_by_id_route(
             status_code=status.HTTP_404_NOT_FOUND, detail="단어를 찾을 수 없습니다."
         )
 
-    try:
-        updated_word = crud.words.increment_word_count_atomic(
-            db, word_id=db_word.words_id
+    view_counter.record(db_word.words_id)
+    return view_counter.with_pending(db_word)
+
+
+# 단어 저장 시 미리 생성해 둔 AI 결과 (예문, 쉬운 뜻, 관련 단어) 조회
+@router.get("/{user_id}/id/{word_id}/enrichment", response_model=schemas.WordEnrichment)
+def get_word_enrichment_route(
+    user_id: str = Path(..., description="단어 소유자 ID"),
+    word_id: int = Path(..., description="조회할 단어의 ID"),
+    db: Session = Depends(database.get_db),
+):
+    db_word = crud.words.get_word_by_id_and_user_id(db, word_id=word_id, user_id=user_id)
+    if not db_word:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="단어를 찾을 수 없습니다."
         )
-        if updated_word:
-            return updated_word
-        else:
-            return db_word
-    except Exception as e:
-        print(f"Error incrementing word count for word_id {db_word.words_id}: {e}")
-        return db_word
+    db_enrichment = crud.word_enrichments.get_enrichment(db, word_id)
+    if not db_enrichment:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="생성된 AI 결과가 없습니다."
+        )
+    return db_enrichment
 
 
 # 특정 사용자의 단어들을 조회수로 내림차순 정렬하여 반환
+# limit을 주면 한 페이지만 돌려주고, 다음 페이지가 있으면 X-Next-Cursor 헤더에 커서를 담습니다.
 @router.get("/count/{user_id}/sort", response_model=List[schemas.Word])
-def get_user_words_sorted_by_count(  
+async def get_user_words_sorted_by_count(  
+    response: Response,
     user_id: str = Path(
         ..., description="단어 목록을 조회할 사용자의 ID"
     ),  
-    db: Session = Depends(database.get_db),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+    limit: Optional[int] = Query(
+        None, ge=1, le=WORD_PAGE_MAX_LIMIT, description="페이지 크기 (없으면 전체)"
+    ),
+    db: AsyncSession = Depends(database.get_async_db),
 ):
-    words = crud.words.get_words_by_user_sorted_by_count(db, user_id=user_id)
-    if not words:  
-        return []
-    return words
+    try:
+        words, next_cursor = await crud.aio.words.get_words_by_user_sorted_by_count(
+            db, user_id=user_id, cursor=cursor, limit=limit
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return view_counter.with_pending_all(words)
 
 
 # 특정 사용자의 단어들을 생성시간으로 내림차순 정렬하여 반환
 @router.get("/created_time/{user_id}/sort", response_model=List[schemas.Word])  
-def get_user_words_sorted_by_creation( 
+async def get_user_words_sorted_by_creation( 
+    response: Response,
     user_id: str = Path(
         ..., description="단어 목록을 조회할 사용자의 ID"
     ),  
-    db: Session = Depends(database.get_db),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+    limit: Optional[int] = Query(
+        None, ge=1, le=WORD_PAGE_MAX_LIMIT, description="페이지 크기 (없으면 전체)"
+    ),
+    db: AsyncSession = Depends(database.get_async_db),
 ):
-    words = crud.words.get_words_by_user_sorted_by_created_time(db, user_id=user_id)
-    if not words:
-        return []
-    return words
+    try:
+        words, next_cursor = await crud.aio.words.get_words_by_user_sorted_by_created_time(
+            db, user_id=user_id, cursor=cursor, limit=limit
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return view_counter.with_pending_all(words)
 
 
 @router.get(
@@ -335,6 +376,30 @@ def get_related_words_knn(
     return related_words_found
 
 
+def _word_response_from_state(
+    final_output_state: dict, query: str, target_word_count: int, include_timings: bool
+) -> dict:
+    return dict(
+        query=final_output_state.get("query", query),
+        final_words=final_output_state.get("final_words", []),
+        target_word_count=final_output_state.get(
+            "target_word_count", target_word_count
+        ),
+        source_counts={
+            "rag": final_output_state.get("rag_source_count", 0),
+            "web": final_output_state.get("web_source_count", 0),
+            "llm": final_output_state.get("llm_source_count", 0),
+        },
+        timings=(
+            final_output_state.get("node_metrics")
+            if include_timings
+            else None
+        ),
+        dropped_sources=final_output_state.get("dropped_sources", []),
+        partial=bool(final_output_state.get("dropped_sources")),
+    )
+
+
 @router.post("/find-related", response_model=schemas.WordResponse)
 async def find_related_words(request_body: schemas.WordRequest):
     """
@@ -343,14 +408,16 @@ async def find_related_words(request_body: schemas.WordRequest):
     initial_state = {
         "query": request_body.query,
         "target_word_count": request_body.target_word_count,
+        "deadline": deadline_from_budget(request_body.latency_budget_ms),
     }
-    print(f"FastAPI: Received request: {request_body.dict()}")
-    print(f"FastAPI: Initial state for graph: {initial_state}")
+    print(f"FastAPI: Received find-related request for '{request_body.query}'")
 
     try:
-        final_output_state = compiled_graph.invoke(initial_state)
+        final_output_state = await run_in_threadpool(compiled_graph.invoke, initial_state)
 
-        print(f"FastAPI: Graph execution finished. Final state: {final_output_state}")
+        print(
+            f"FastAPI: Graph execution finished. Final words: {final_output_state.get('final_words', [])}"
+        )
 
         if final_output_state.get("error"):  
             raise HTTPException(
@@ -359,16 +426,12 @@ async def find_related_words(request_body: schemas.WordRequest):
             )
 
         return schemas.WordResponse(
-            query=final_output_state.get("query", request_body.query),
-            final_words=final_output_state.get("final_words", []),
-            target_word_count=final_output_state.get(
-                "target_word_count", request_body.target_word_count
-            ),
-            source_counts={
-                "rag": final_output_state.get("rag_source_count", 0),
-                "web": final_output_state.get("web_source_count", 0),
-                "llm": final_output_state.get("llm_source_count", 0),
-            },
+            **_word_response_from_state(
+                final_output_state,
+                request_body.query,
+                request_body.target_word_count,
+                request_body.include_timings,
+            )
         )
     except Exception as e:
         import traceback
@@ -379,6 +442,75 @@ async def find_related_words(request_body: schemas.WordRequest):
         )
 
 
+@router.post("/find-related/batch", response_model=schemas.WordBatchResponse)
+async def find_related_words_batch(request_body: schemas.WordBatchRequest):
+    """
+    여러 쿼리의 관련 단어를 한 번에 찾습니다.
+    RAG 단계는 SBERT 배치 임베딩과 OpenSearch msearch 한 번으로 처리하고,
+    부족한 쿼리만 웹 검색/LLM 단계로 넘겨 제한된 동시성으로 실행합니다.
+    """
+    if len(request_body.queries) > FIND_RELATED_BATCH_MAX_QUERIES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"한 번에 최대 {FIND_RELATED_BATCH_MAX_QUERIES}개의 쿼리만 요청할 수 있습니다.",
+        )
+
+    # 같은 쿼리는 한 번만 처리하고 결과를 재사용합니다.
+    unique_queries = list(dict.fromkeys(q.strip() for q in request_body.queries if q.strip()))
+    target_word_count = request_body.target_word_count
+    deadline = deadline_from_budget(request_body.latency_budget_ms)
+    print(f"FastAPI: Received find-related batch with {len(unique_queries)} unique queries")
+
+    rag_states = await run_in_threadpool(
+        check_rag_batch, unique_queries, target_word_count
+    )
+    for rag_state in rag_states:
+        rag_state["deadline"] = deadline
+    semaphore = asyncio.Semaphore(FIND_RELATED_BATCH_CONCURRENCY)
+
+    async def run_remaining_stages(rag_state: dict) -> dict:
+        async with semaphore:
+            return await run_in_threadpool(compiled_graph.invoke, rag_state)
+
+    final_states = await asyncio.gather(
+        *(run_remaining_stages(rag_state) for rag_state in rag_states),
+        return_exceptions=True,
+    )
+
+    results_by_query = {}
+    for query, rag_state, final_state in zip(unique_queries, rag_states, final_states):
+        if isinstance(final_state, Exception):
+            print(f"Error processing batch query '{query}': {final_state}")
+            results_by_query[query] = schemas.WordBatchItem(
+                query=query,
+                final_words=[],
+                target_word_count=target_word_count,
+                source_counts={"rag": 0, "web": 0, "llm": 0},
+                error=str(final_state),
+            )
+            continue
+        results_by_query[query] = schemas.WordBatchItem(
+            **_word_response_from_state(
+                final_state, query, target_word_count, request_body.include_timings
+            ),
+            error=rag_state.get("error"),
+        )
+
+    results = []
+    for query in request_body.queries:
+        item = results_by_query.get(query.strip())
+        if item is None:
+            item = schemas.WordBatchItem(
+                query=query,
+                final_words=[],
+                target_word_count=target_word_count,
+                source_counts={"rag": 0, "web": 0, "llm": 0},
+                error="빈 쿼리입니다.",
+            )
+        results.append(item)
+    return schemas.WordBatchResponse(results=results)
+
+
 # 범기님 코드 =======================================================================
 # 단어 예문 테스트 (사용자 입력 예문 평가)
 @router.post("/{word_id}/test_explain")
@@ -393,7 +525,11 @@ def test_explain(word_id: int, request: schemas.ExampleEvaluationRequest):
 # 단어 예문 생성 (AI를 사용하여 예문 생성)
 @router.post("/{word}/ai_word_example")
 def ai_word_example(word: str):
-    examples = generate_examples_with_gpt(word)
+    # 같은 단어에 대한 동시 요청은 하나의 GPT 호출을 공유합니다.
+    examples = ai_requests.do(
+        normalize_key("ai_word_example", word),
+        lambda: generate_examples_with_gpt(word),
+    )
     return {"word": word, "examples": examples}
 
 
@@ -405,7 +541,11 @@ async def generate_examples_post(request: schemas.WordRequestAI):
     POST 방식으로 단어에 대한 예문을 생성합니다.
     """
     try:
-        result = crud.word_examples.exsen(request.word)
+        result = await run_in_threadpool(
+            ai_requests.do,
+            normalize_key("exsen", request.word),
+            lambda: crud.word_examples.exsen(request.word),
+        )
 
         if not result["success"]:
             raise HTTPException(status_code=400, detail=result["message"])
@@ -425,7 +565,12 @@ async def generate_examples_get(word: str):
     GET 방식으로 단어에 대한 예문을 생성합니다.
     """
     try:
-        result = crud.word_examples.exsen(word)
+        # 같은 단어에 대한 동시 요청은 하나의 LLM 호출을 공유합니다.
+        result = await run_in_threadpool(
+            ai_requests.do,
+            normalize_key("exsen", word),
+            lambda: crud.word_examples.exsen(word),
+        )
 
         if not result["success"]:
             raise HTTPException(status_code=400, detail=result["message"])
@@ -451,6 +596,15 @@ async def generate_examples_get(word_id: int, db: Session = Depends(database.get
     Returns:
         dict: 생성된 예문과 결과 정보
     """
+    db_enrichment = crud.word_enrichments.get_enrichment(db, word_id)
+    if db_enrichment and db_enrichment.status == "ready" and db_enrichment.examples:
+        return {
+            "success": True,
+            "message": "예문 생성 완료",
+            "word": db_enrichment.word.word_name,
+            "examples": db_enrichment.examples,
+        }
+
     result = bring_exsen(word_id, db)
 
     if not result["success"]:
@@ -460,56 +614,40 @@ async def generate_examples_get(word_id: int, db: Session = Depends(database.get
 
 
 
-# LLM 관련 임포트 (여기에 추가)
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.runnables import Runnable
-import re
-from langchain_openai import ChatOpenAI
-import json
-
-prompt = ChatPromptTemplate.from_template(
-    """
-"{word}"라는 단어의 뜻은 다음과 같습니다: {explanation}.
-이 뜻을 기반으로 의미적으로 유사하지만 서로 다른 한국어 단어 5개를 추천해 주세요.
-형태는 JSON 리스트로만 응답해 주세요. 예: ["단어1", "단어2", ...]
-"""
-)
-
-llm = ChatOpenAI(
-    model=LLM_GENERATE_MODEL,
-    temperature=LLM_GENERATE_TEMP,
-    api_key=OPENAI_API_KEY if OPENAI_API_KEY else None,
-)
-chain: Runnable = prompt | llm
-
-
 @router.get("/words/{word_name}/related")
-def get_related_words(word_name: str, db: Session = Depends(database.get_db)):
-    explanation = crud.words.get_word_explanation_by_name(db, word_name)
+def get_related_words(
+    word_name: str,
+    user_id: Optional[str] = Query(
+        None, description="단어 소유자 ID (주면 해당 사용자의 단어 설명을 사용)"
+    ),
+    db: Session = Depends(database.get_db),
+):
+    explanation = crud.words.get_word_explanation_by_name(db, word_name, user_id=user_id)
     if not explanation:
         raise HTTPException(
             status_code=404, detail="해당 단어 설명을 찾을 수 없습니다."
         )
 
-    result = chain.invoke({"word": word_name, "explanation": explanation})
-    raw_output = getattr(result, "content", str(result))
-
-    # 마크다운 코드 블록 제거
-    json_text = re.sub(r"```json|```", "", raw_output).strip()
+    # 미리 만든 결과는 그 사용자의 설명으로 생성된 것이므로 user_id를 줄 때만 씁니다.
+    if user_id is not None:
+        db_enrichment = crud.word_enrichments.get_ready_enrichment_by_word_name(
+            db, word_name, user_id=user_id
+        )
+        if db_enrichment and db_enrichment.related_words is not None:
+            return {"related_words": db_enrichment.related_words}
 
     try:
-        related_words = json.loads(json_text)
-    except Exception as e:
+        related_words = crud.word_examples.generate_related_words(
+            word_name, explanation, user_id=user_id
+        )
+    except ValueError as e:
         raise HTTPException(status_code=500, detail=f"LLM 결과 파싱 실패: {e}")
 
     return {"related_words": related_words}
 
 
 
-from langchain_openai import ChatOpenAI
 from pydantic import BaseModel
-from langchain_core.output_parsers import StrOutputParser
-from langchain_core.prompts import ChatPromptTemplate
 
 
 class WordRequest(BaseModel):
@@ -521,82 +659,32 @@ class ExampleResponse(BaseModel):
     success: bool
     message: str = ""
 
-def easy_min(word: str) -> dict:
+# GET 방식 쉬운 뜻 생성
+@router.get("/generate/{word}/easy")
+async def generate_examples_get(
+    word: str,
+    user_id: Optional[str] = Query(None, description="단어 소유자 ID (미리 생성된 결과 조회용)"),
+    db: Session = Depends(database.get_db),
+):
     """
-    단어의 뜻을 아주 쉽게 설명하는 함수
-    
-    Args:
-        word (str): 뜻을 생성할 단어
-        
-    Returns:
-        dict: 결과를 포함한 딕셔너리
+    GET 방식으로 단어에 대한 쉬운 뜻을 생성합니다.
     """
     try:
-        if not word or word.strip() == "":
+        db_enrichment = None
+        if user_id is not None:
+            # 다른 사용자의 단어로 만든 결과를 주지 않도록 user_id가 있을 때만 미리 만든 결과를 씁니다.
+            db_enrichment = crud.word_enrichments.get_ready_enrichment_by_word_name(
+                db, word, user_id=user_id
+            )
+        if db_enrichment and db_enrichment.easy_meaning:
             return {
-                "success": False,
-                "message": "단어를 입력해주세요.",
+                "success": True,
+                "message": "쉬운 단어 설명 생성 완료",
                 "word": word,
-                "easy_meaning": ""
+                "easy_meaning": db_enrichment.easy_meaning,
             }
 
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", 
-            f"""
-    사용자가 제공한 단어의 정확한 사전적 의미만을 참고하여, 그 뜻을 초등학생 수준에 맞춰 가장 쉽고 명확하게 설명하십시오.
-
-엄격한 제약 조건:
-
-1. 절대 예시나 문맥을 사용하지 마십시오. 오직 단어의 뜻 자체만을 설명해야 합니다.
-2. 부가적인 내용이나 사족을 어떠한 경우에도 넣지 마십시오.
-3. 친근하거나 대화체인 말투는 일체 사용하지 마십시오. 특히, '~의미해', '~있어', '~단어야', '~하는 거야', '예를 들어' 와 같은 표현은 절대 금지합니다.
-4. 존댓말을 사용하지 마십시오.
-5. 사전이나 백과사전에서 정의를 내릴 때 사용하는 방식처럼 격식 있고 간결한 어투를 사용하십시오.
-6. 단어에 동음이의어가 하나라도 존재한다면, 반드시 모든 의미를 빠짐없이 나열하여 설명하십시오. 단 하나의 의미라도 빠뜨리는 것을 금지합니다.(예: 1. 과일의 일종으로...열매. \n2. 물 위에 ...사용)
-7. 초등학생이 이해할 수 있도록 어려운 한자어나 전문 용어는 피하고 일상적인 언어로 설명하십시오.
-8. 설명하고자 하는 단어를 반복적으로 사용하지 마십시오. 특히, 문장이나 문단 시작 시 해당 단어의 반복 사용을 엄격히 금지합니다.
-9. 다음과 같은 구조의 문장 사용을 금지합니다: '단어는/는 ...이다' (예: 배는 ...이다).
-10. 설명 외에 부가적인 정보나 묘사를 추가하지 마십시오. 정의 그 자체에 집중하십시오.
-
-우선순위:
-
-위에 제시된 '엄격한 제약 조건'들을 최우선으로 따르십시오. '쉽게 설명'하는 것은 언어 선택과 개념의 단순화에 한정되며, 말투나 형식에 대한 제약 조건을 위반해서는 안 됩니다.
-    """),
-    ('human', '{input}'),
-])
-
-        llm = ChatOpenAI(
-            model="gpt-4o-mini", 
-            temperature=0,
-            max_tokens=500, 
-        )
-
-        chain = prompt | llm | StrOutputParser()
-        result = chain.invoke({"input": word})
-        
-        return {
-            "success": True,
-            "message": "쉬운 단어 설명 생성 완료",
-            "word": word,
-            "easy_meaning": result
-        }
-        
-    except Exception as e:
-        return {
-            "success": False,
-            "message": f"오류가 발생했습니다: {str(e)}",
-            "word": word,
-            "easy_meaning": ""
-        }
-
-# GET 방식 쉬운 뜻 생성
-@router.get("/generate/{word}/easy")
-async def generate_examples_get(word: str):
-    """
-    GET 방식으로 단어에 대한 쉬운 뜻을 생성합니다.
-    """
-    try:
-        result = easy_min(word)
+        result = await run_in_threadpool(easy_min, word)
         
         if not result["success"]:
             raise HTTPException(status_code=400, detail=result["message"])
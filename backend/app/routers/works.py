@@ -1,5 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, Path, status, Body
+from fastapi import APIRouter, Depends, HTTPException, Path, Request, status, Body
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from ..crud import dialogue_generator  
 from .. import (
@@ -8,6 +10,7 @@ from .. import (
     schemas,
     database,
 )  
+from ..streaming import sse_from_tokens, sse_response
 
 router = APIRouter(
     prefix="/works",  
@@ -49,12 +52,12 @@ def create_work(
     response_model=List[schemas.Work],  
     summary="특정 사용자의 모든 작품 목록 조회",
 )
-def get_user_works(
+async def get_user_works(
     user_id: str = Path(..., description="작품 목록을 조회할 사용자의 ID"),
-    db: Session = Depends(database.get_db),
+    db: AsyncSession = Depends(database.get_async_db),
 ):
     try:
-        user_works = crud.works.get_works_by_user_id(db=db, user_id=user_id)
+        user_works = await crud.aio.works.get_works_by_user_id(db=db, user_id=user_id)
         if not user_works:
             return []  
         return user_works
@@ -65,20 +68,39 @@ def get_user_works(
         )
 
 
+# GET /works/{user_id}/user_works/summary - 작품 목록 요약 (하위 요소 본문 없이 개수만)
+@router.get(
+    "/{user_id}/user_works/summary",
+    response_model=List[schemas.WorkSummary],
+    summary="특정 사용자의 작품 목록 요약 조회 (ID, 제목, 하위 요소 개수)",
+)
+async def get_user_work_summaries(
+    user_id: str = Path(..., description="작품 목록을 조회할 사용자의 ID"),
+    db: AsyncSession = Depends(database.get_async_db),
+):
+    try:
+        return await crud.aio.works.get_work_summaries_by_user_id(db=db, user_id=user_id)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"사용자 작품 목록 조회 중 오류 발생: {str(e)}",
+        )
+
+
 # GET /works/{work_id}/work - 개별 작품 확인
 @router.get(
     "/{work_id}/work", 
     response_model=schemas.Work,
     summary="ID로 개별 작품 상세 정보 조회",
 )
-def get_work_by_id(
+async def get_work_by_id(
     work_id: int = Path(
         ..., description="조회할 작품의 ID"
     ),
-    db: Session = Depends(database.get_db),
+    db: AsyncSession = Depends(database.get_async_db),
 ):
     try:
-        db_work = crud.works.get_work_by_id(db=db, work_id=work_id)
+        db_work = await crud.aio.works.get_work_by_id(db=db, work_id=work_id)
         if not db_work:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -159,80 +181,10 @@ async def generate_dialogue_with_context_route(
     ),
     db: Session = Depends(database.get_db),
 ):
-    db_work = crud.works.get_work_by_id(db, work_id=work_id)
-    if not db_work:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"ID가 {work_id}인 작품을 찾을 수 없습니다.",
-        )
-    worlds_content_data = (
-        db_work.worlds_content
-        if hasattr(db_work, "worlds_content")
-        else "세계관 정보 없음"
-    )
-    episode_content_data = "에피소드 정보 없음"
-    if request.context_ids.episode_id is not None:
-        db_episode = (
-            crud.episodes.get_episode_by_id_and_work_id(  
-                db, work_id=work_id, episode_id=request.context_ids.episode_id
-            )
-        )
-        if not db_episode:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"작품 ID {work_id}에 에피소드 ID {request.context_ids.episode_id}를 찾을 수 없습니다.",
-            )
-        episode_content_data = (
-            db_episode.episode_content
-            if hasattr(db_episode, "episode_content")
-            else "에피소드 내용 없음"
-        )
-    character_settings_data = "캐릭터 설정 정보 없음"
-    if request.context_ids.character_id is not None:
-        if hasattr(crud, "characters") and hasattr(
-            crud.characters, "get_character_by_id_and_work_id"
-        ):
-            db_character = crud.characters.get_character_by_id_and_work_id(
-                db, work_id=work_id, character_id=request.context_ids.character_id
-            )
-            if not db_character:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"작품 ID {work_id}에 캐릭터 ID {request.context_ids.character_id}를 찾을 수 없습니다.",
-                )
-            character_settings_data = (
-                db_character.character_settings
-                if hasattr(db_character, "character_settings")
-                else "캐릭터 설정 없음"
-            )
-        else:
-            print(
-                f"Warning: crud.characters.get_character_by_id_and_work_id function not found. Skipping character settings."
-            )
-    plan_content_data = "스토리 계획 정보 없음"
-    if request.context_ids.plan_id is not None:
-        db_plan = (
-            crud.plannings.get_planning_by_id_and_work_id(  
-                db, work_id=work_id, plan_id=request.context_ids.plan_id
-            )
-        )
-        if not db_plan:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"작품 ID {work_id}에 계획 ID {request.context_ids.plan_id}를 찾을 수 없습니다.",
-            )
-        plan_content_data = (
-            db_plan.plan_content
-            if hasattr(db_plan, "plan_content")
-            else "스토리 계획 내용 없음"
-        )
+    context = dialogue_generator.load_dialogue_context(db, work_id, request)
     try:
         generated_text = dialogue_generator.generate_dialogue_from_context(
-            worlds_content=worlds_content_data,
-            episode_content=episode_content_data,
-            character_settings=character_settings_data,
-            plan_content=plan_content_data,
-            prompt=request.prompt,
+            **context, prompt=request.prompt
         )
         return schemas.DialogueResponse(
             generated_dialogue=generated_text
@@ -249,3 +201,26 @@ async def generate_dialogue_with_context_route(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"대사 생성 중 오류 발생: {str(e)}",
         )
+
+
+# POST /works/{work_id}/generate-dialogue-with-context/stream - AI 대사 생성 (SSE 스트리밍)
+@router.post(
+    "/{work_id}/generate-dialogue-with-context/stream",
+    summary="DB에서 작품 컨텍스트를 조회하여 AI 대사를 토큰 단위로 스트리밍",
+)
+async def stream_dialogue_with_context_route(
+    http_request: Request,
+    work_id: int = Path(..., description="대사를 생성할 작품 ID"),
+    request: schemas.DialogueGenerationRequest = Body(
+        ..., description="대사 생성 요청 본문 (컨텍스트 ID 포함)"
+    ),
+    db: Session = Depends(database.get_db),
+):
+    # 컨텍스트 조회는 동기 쿼리 여러 개이므로 이벤트 루프를 막지 않게 스레드풀에서 실행합니다.
+    context = await run_in_threadpool(
+        dialogue_generator.load_dialogue_context, db, work_id, request
+    )
+    tokens = dialogue_generator.stream_dialogue_from_context(
+        **context, prompt=request.prompt
+    )
+    return sse_response(sse_from_tokens(http_request, tokens))
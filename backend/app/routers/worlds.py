@@ -29,8 +29,7 @@ def create_world_for_work_route(
     world_data: schemas.WorldCreate = Body(...),  
     db: Session = Depends(database.get_db),
 ):
-    db_work = crud.works.get_work_by_id(db, work_id=work_id)
-    if not db_work:
+    if not crud.works.work_exists(db, work_id=work_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"ID가 {work_id}인 작품을 찾을 수 없습니다.",
@@ -69,8 +68,7 @@ def read_worlds_for_work_route(
     work_id: int = Path(..., description="세계관 목록을 조회할 작품의 ID"),
     db: Session = Depends(database.get_db),
 ):
-    db_work = crud.works.get_work_by_id(db, work_id=work_id)
-    if not db_work:
+    if not crud.works.work_exists(db, work_id=work_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"ID가 {work_id}인 작품을 찾을 수 없습니다.",
@@ -90,8 +88,7 @@ def read_world_route(
     world_id: int = Path(..., description="조회할 세계관의 ID"),
     db: Session = Depends(database.get_db),
 ):
-    db_work = crud.works.get_work_by_id(db, work_id=work_id)
-    if not db_work:
+    if not crud.works.work_exists(db, work_id=work_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"ID가 {work_id}인 작품을 찾을 수 없습니다.",
@@ -119,8 +116,7 @@ def update_world_route(
     world_update_data: schemas.WorldUpdate = Body(...),  
     db: Session = Depends(database.get_db),
 ):
-    db_work = crud.works.get_work_by_id(db, work_id=work_id)
-    if not db_work:
+    if not crud.works.work_exists(db, work_id=work_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"ID가 {work_id}인 작품을 찾을 수 없습니다.",
@@ -184,8 +180,7 @@ def delete_world_route(
     world_id: int = Path(..., description="삭제할 세계관의 ID"),
     db: Session = Depends(database.get_db),
 ):
-    db_work = crud.works.get_work_by_id(db, work_id=work_id)
-    if not db_work:
+    if not crud.works.work_exists(db, work_id=work_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"ID가 {work_id}인 작품을 찾을 수 없습니다.",
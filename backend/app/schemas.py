@@ -53,6 +53,42 @@ class Word(WordBase):
     model_config = {"from_attributes": True}
 
 
+class WordEnrichment(BaseModel):
+    """단어 저장 직후 백그라운드에서 미리 생성한 AI 결과."""
+
+    words_id: int
+    status: str  # pending | ready | failed
+    examples: Optional[str] = None
+    easy_meaning: Optional[str] = None
+    related_words: Optional[List[Any]] = None
+    error: Optional[str] = None
+    updated_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class WordSearchHit(BaseModel):
+    """검색 결과 한 건. word_preview는 설명 앞부분만 담습니다."""
+
+    words_id: int
+    user_id: str
+    word_name: str
+    word_preview: Optional[str] = None
+    word_count: Optional[int] = 0
+    word_created_time: datetime
+    score: float
+    matched_in: List[str] = []  # name | content | example
+
+    model_config = {"from_attributes": True}
+
+
+class WordSearchResponse(BaseModel):
+    query: str
+    mode: str
+    results: List[WordSearchHit]
+    next_offset: Optional[int] = None  # 다음 페이지가 없으면 None
+
+
 class RelatedWordBase(BaseModel):
     form: str
     korean_definition: Optional[str] = None
@@ -72,6 +108,29 @@ class WordRequest(BaseModel):
     target_word_count: int = Field(
         default=5, ge=1, le=20, description="최종적으로 받고 싶은 단어의 수 (1~20)"
     )
+    include_timings: bool = Field(
+        default=False, description="응답에 노드별 소요 시간/토큰 사용량을 포함할지 여부"
+    )
+    latency_budget_ms: Optional[int] = Field(
+        default=None,
+        ge=100,
+        le=120000,
+        description="요청 단위 지연 예산 (ms). 초과 시 그때까지 찾은 단어만 반환",
+    )
+
+
+class NodeTiming(BaseModel):
+    wall_ms: float
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_tokens: int = 0
+    cost_usd: float = 0.0
+    error: Optional[str] = None
+
+
+class DroppedSource(BaseModel):
+    source: str
+    reason: str
 
 
 class WordResponse(BaseModel):
@@ -79,6 +138,53 @@ class WordResponse(BaseModel):
     final_words: List[str]
     target_word_count: int
     source_counts: Dict[str, int]  # 
+    timings: Optional[Dict[str, NodeTiming]] = None
+    dropped_sources: List[DroppedSource] = []
+    partial: bool = False
+
+
+class WordBatchRequest(BaseModel):
+    queries: List[str] = Field(
+        ..., min_length=1, description="관련 단어를 찾을 쿼리 목록"
+    )
+    target_word_count: int = Field(
+        default=5, ge=1, le=20, description="쿼리별로 받고 싶은 단어의 수 (1~20)"
+    )
+    include_timings: bool = Field(
+        default=False, description="응답에 쿼리별 노드 소요 시간을 포함할지 여부"
+    )
+    latency_budget_ms: Optional[int] = Field(
+        default=None,
+        ge=100,
+        le=300000,
+        description="배치 요청 전체에 대한 지연 예산 (ms)",
+    )
+
+
+class WordBatchItem(WordResponse):
+    error: Optional[str] = None
+
+
+class WordBatchResponse(BaseModel):
+    results: List[WordBatchItem]
+
+
+class BulkExamplesRequest(BaseModel):
+    only_missing: bool = Field(
+        default=True, description="예문이 하나도 없는 단어만 생성할지 여부"
+    )
+
+
+class BulkExamplesJobStatus(BaseModel):
+    job_id: str
+    user_id: str
+    status: str
+    total_words: int
+    processed_words: int
+    failed_words: List[str] = []
+    inserted_examples: int
+    progress: float
+    error: Optional[str] = None
 
 
 # --- WordExample Schemas ---
@@ -212,6 +318,17 @@ class Episode(EpisodeBase):
     model_config = ConfigDict(from_attributes=True)  
 
 
+class EpisodeSummary(BaseModel):
+    """에피소드 목록용 요약 (본문 대신 미리보기와 길이)."""
+
+    episode_id: int
+    works_id: int
+    preview: str = Field("", description="본문 앞부분 미리보기")
+    content_length: int = Field(0, description="본문 전체 글자 수")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class EpisodeContentUpdate(BaseModel):
     episode_content: str = Field(..., description="업데이트할 새로운 에피소드 내용")
 
@@ -256,6 +373,20 @@ class Work(WorkBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class WorkSummary(BaseModel):
+    """작품 목록용 요약 (하위 요소 본문 없이 개수만)."""
+
+    works_id: int
+    user_id: str
+    works_title: Optional[str] = None
+    character_count: int = 0
+    world_count: int = 0
+    planning_count: int = 0
+    episode_count: int = 0
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class WorkUpdate(BaseModel):
     works_title: Optional[str] = None
     model_config = ConfigDict(from_attributes=True)
@@ -331,3 +462,40 @@ class EpisodeContentPreview(BaseModel):
     relevant_context_summary: Optional[List[str]] = Field(
         None, description="대사 생성에 사용된 RAG 컨텍스트 요약 (선택 사항)"
     )
+
+
+# --- Background Job Schemas ---
+class JobSubmitRequest(BaseModel):
+    job_type: str = Field(
+        ...,
+        description="작업 종류 (episode_ai_content, dialogue_with_context, word_examples, bulk_examples)",
+    )
+    payload: Dict[str, Any] = Field(default_factory=dict, description="작업 입력값")
+    max_attempts: Optional[int] = Field(
+        None, ge=1, le=10, description="최대 시도 횟수 (미지정 시 서버 기본값)"
+    )
+
+
+class JobStatus(BaseModel):
+    job_id: int
+    job_type: str
+    status: str = Field(description="queued | running | succeeded | failed")
+    attempts: int
+    max_attempts: int
+    progress: Optional[float] = None
+    error: Optional[str] = None
+    run_after: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    model_config = {"from_attributes": True}
+
+
+class JobResult(BaseModel):
+    job_id: int
+    status: str
+    result: Optional[Any] = None
+    error: Optional[str] = None
+
+    model_config = {"from_attributes": True}
@@ -0,0 +1,168 @@
+# app/search_provider.py
+import json
+import threading
+from abc import ABC, abstractmethod
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from functools import lru_cache
+from typing import List, Optional
+
+from . import config
+from .metrics import metrics
+
+
+class SearchTimeoutError(Exception):
+    """검색이 주어진 시간 안에 끝나지 않았을 때 발생합니다."""
+
+
+class SearchProvider(ABC):
+    """웹 검색 제공자 인터페이스. search()는 스니펫 문자열 목록을 반환합니다."""
+
+    name = "base"
+
+    @abstractmethod
+    def search(
+        self, query: str, max_results: int, timeout: Optional[float] = None
+    ) -> List[str]:
+        ...
+
+
+class DuckDuckGoSearchProvider(SearchProvider):
+    """
+    DuckDuckGo 검색 제공자.
+    검색 래퍼는 한 번만 만들어 재사용하고, 동시 검색 수는 스레드 풀 크기로 제한합니다.
+    """
+
+    name = "duckduckgo"
+
+    def __init__(self, max_concurrency: int, default_timeout: float):
+        from langchain_community.utilities import DuckDuckGoSearchAPIWrapper
+
+        self._wrapper = DuckDuckGoSearchAPIWrapper()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="web-search"
+        )
+        self.default_timeout = default_timeout
+
+    def _search_blocking(self, query: str, max_results: int) -> List[str]:
+        results = self._wrapper.results(query, max_results=max_results)
+        return [item["snippet"] for item in results if item.get("snippet")]
+
+    def search(
+        self, query: str, max_results: int, timeout: Optional[float] = None
+    ) -> List[str]:
+        timeout = self.default_timeout if timeout is None else timeout
+        future = self._executor.submit(self._search_blocking, query, max_results)
+        started = time.perf_counter()
+        try:
+            return future.result(timeout=max(timeout, 0))
+        except FutureTimeoutError:
+            # 대기 중이면 취소되고, 이미 실행 중이면 결과만 버려집니다.
+            future.cancel()
+            metrics.increment("web_search.timeouts")
+            raise SearchTimeoutError(
+                f"Web search exceeded {timeout:.2f}s deadline for query: {query[:50]}"
+            )
+        finally:
+            metrics.observe("web_search.upstream", time.perf_counter() - started)
+
+
+class FixtureSearchProvider(SearchProvider):
+    """
+    로컬 JSON 픽스처를 사용하는 오프라인 검색 제공자 (부하 테스트/벤치마크용).
+    픽스처의 키가 검색어에 포함되어 있으면 해당 스니펫을, 없으면 default 템플릿을 반환합니다.
+    """
+
+    name = "fixture"
+
+    def __init__(self, fixture_path: str, latency_ms: float = 0.0):
+        with open(fixture_path, encoding="utf-8") as f:
+            fixture = json.load(f)
+        self._snippets = fixture.get("snippets", {})
+        self._default = fixture.get("default", [])
+        self.latency_ms = latency_ms
+        print(
+            f"Fixture search provider loaded {len(self._snippets)} entries from {fixture_path}"
+        )
+
+    def search(
+        self, query: str, max_results: int, timeout: Optional[float] = None
+    ) -> List[str]:
+        if self.latency_ms:
+            delay = self.latency_ms / 1000
+            if timeout is not None and delay > timeout:
+                time.sleep(max(timeout, 0))
+                raise SearchTimeoutError(
+                    f"Fixture search exceeded {timeout:.2f}s deadline"
+                )
+            time.sleep(delay)
+        for key, snippets in self._snippets.items():
+            if key in query:
+                return snippets[:max_results]
+        return [template.format(query=query) for template in self._default][:max_results]
+
+
+class CachedSearchProvider(SearchProvider):
+    """검색어별 스니펫을 TTL 동안 보관하는 LRU 캐시 래퍼입니다."""
+
+    def __init__(self, provider: SearchProvider, ttl_seconds: float, max_entries: int):
+        self.provider = provider
+        self.name = f"cached:{provider.name}"
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: tuple) -> Optional[List[str]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, snippets = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return snippets
+
+    def _put(self, key: tuple, snippets: List[str]) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, snippets)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def search(
+        self, query: str, max_results: int, timeout: Optional[float] = None
+    ) -> List[str]:
+        # 대소문자/공백 차이는 같은 검색어로 봅니다.
+        key = (" ".join(query.split()).lower(), max_results)
+        cached = self._get(key)
+        if cached is not None:
+            metrics.increment("web_search.cache.hits")
+            return list(cached)
+        metrics.increment("web_search.cache.misses")
+        snippets = self.provider.search(query, max_results, timeout=timeout)
+        if snippets:
+            self._put(key, list(snippets))
+        return snippets
+
+
+@lru_cache()
+def get_search_provider() -> SearchProvider:
+    if config.WEB_SEARCH_PROVIDER == "fixture":
+        provider = FixtureSearchProvider(
+            config.WEB_SEARCH_FIXTURE_PATH, config.WEB_SEARCH_FIXTURE_LATENCY_MS
+        )
+    else:
+        provider = DuckDuckGoSearchProvider(
+            max_concurrency=config.WEB_SEARCH_MAX_CONCURRENCY,
+            default_timeout=config.WEB_SEARCH_TIMEOUT_SECONDS,
+        )
+    print(f"Web search provider initialized: {provider.name}")
+    return CachedSearchProvider(
+        provider,
+        ttl_seconds=config.WEB_SEARCH_CACHE_TTL_SECONDS,
+        max_entries=config.WEB_SEARCH_CACHE_MAX_ENTRIES,
+    )
@@ -0,0 +1,224 @@
+# app/semantic_cache.py
+"""
+SBERT 임베딩 기반 의미(semantic) LLM 응답 캐시.
+
+정확히 같은 요청만 맞추는 llm_cache와 달리, 띄어쓰기 차이나 활용형처럼 거의 같은 요청을
+코사인 유사도(SEMANTIC_CACHE_THRESHOLD 이상)로 찾아 이전 LLM 응답을 돌려줍니다.
+의미 매칭으로 맞춘 결과 중 일부는 샘플로 남겨 두어 오탐(false hit) 비율을 사람이 확인할 수 있게 합니다.
+"""
+import itertools
+import random
+import re
+import threading
+import time
+import unicodedata
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from . import config
+from .metrics import metrics
+from .sbert_model import get_embedder
+
+
+def normalize_query(text: str) -> str:
+    """NFC 정규화 + 소문자화 + 공백 제거 (띄어쓰기 변형을 같은 키로)."""
+    text = unicodedata.normalize("NFC", text or "").lower()
+    return re.sub(r"\s+", "", text)
+
+
+class SemanticCache:
+    """
+    정확 일치는 (scope, 정규화 키) -> 행 번호 dict로 찾고, 의미 매칭은 미리 할당한
+    (max_entries x dim) 벡터 행렬을 링 버퍼로 씁니다. 저장/교체가 행렬 전체를 복사하지 않으며,
+    가득 차면 가장 오래전에 저장한 행을 덮어씁니다.
+    scope(예: 사용자 ID)가 다른 항목끼리는 정확 일치도 의미 매칭도 하지 않습니다.
+    """
+
+    def __init__(self, namespace: str, threshold: float, max_entries: int, ttl_seconds: float):
+        self.namespace = namespace
+        self.threshold = threshold
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._slots: Dict[Tuple[Optional[str], str], int] = {}
+        self._keys: List[Optional[Tuple[Optional[str], str]]] = [None] * self.max_entries
+        self._values: List[Any] = [None] * self.max_entries
+        self._scopes = np.full(self.max_entries, None, dtype=object)
+        self._created = np.full(self.max_entries, -np.inf)  # 빈 행은 -inf라 TTL 검사에서 빠집니다
+        self._vectors: Optional[np.ndarray] = None  # 첫 저장 때 임베딩 차원을 알고 할당
+        self._next = 0
+        self._filled = 0
+        self._samples: deque = deque(maxlen=config.SEMANTIC_CACHE_SAMPLE_SIZE)
+        self._sample_ids = itertools.count(1)
+
+    def _embed(self, key: str) -> np.ndarray:
+        vector = np.asarray(get_embedder().encode([key])[0], dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _count(self, outcome: str) -> None:
+        metrics.increment(f"semantic_cache.{self.namespace}.{outcome}")
+
+    def _clear_slot_locked(self, slot: int) -> None:
+        self._slots.pop(self._keys[slot], None)
+        self._keys[slot] = None
+        self._values[slot] = None
+        self._scopes[slot] = None
+        self._created[slot] = -np.inf
+
+    def lookup(
+        self,
+        text: str,
+        scope: Optional[str] = None,
+        accept: Optional[Callable[[Any], bool]] = None,
+    ) -> Optional[Any]:
+        """
+        캐시된 값을 찾습니다. accept를 주면 의미 매칭(정확 일치가 아닌) 결과가 이 검사를 통과할 때만 씁니다.
+        """
+        key = normalize_query(text)
+        slot_key = (scope, key)
+        now = time.time()
+        with self._lock:
+            slot = self._slots.get(slot_key)
+            if slot is not None:
+                if now - self._created[slot] <= self.ttl_seconds:
+                    self._count("exact_hits")
+                    return self._values[slot]
+                self._clear_slot_locked(slot)
+
+        try:
+            query = self._embed(key)
+        except Exception as e:
+            print(f"Semantic cache ({self.namespace}): embedding failed, skipping lookup: {e}")
+            self._count("errors")
+            return None
+
+        with self._lock:
+            if self._vectors is None or not self._slots:
+                self._count("misses")
+                return None
+            n = self._filled
+            live = (self._created[:n] >= now - self.ttl_seconds) & (self._scopes[:n] == scope)
+            if not live.any():
+                self._count("misses")
+                return None
+            scores = np.where(live, self._vectors[:n] @ query, -np.inf)
+            index = int(np.argmax(scores))
+            score = float(scores[index])
+            if score < self.threshold:
+                self._count("misses")
+                return None
+            matched_key = self._keys[index][1]
+            value = self._values[index]
+
+        if accept is not None and not accept(value):
+            self._count("rejected_hits")
+            self._count("misses")
+            return None
+        if random.random() < config.SEMANTIC_CACHE_SAMPLE_RATE:
+            with self._lock:
+                self._samples.append(
+                    {
+                        "sample_id": next(self._sample_ids),
+                        "query": key,
+                        "matched": matched_key,
+                        "similarity": round(score, 4),
+                        "false_hit": None,
+                    }
+                )
+        self._count("semantic_hits")
+        return value
+
+    def store(self, text: str, value: Any, scope: Optional[str] = None) -> None:
+        key = normalize_query(text)
+        try:
+            vector = self._embed(key)
+        except Exception as e:
+            print(f"Semantic cache ({self.namespace}): embedding failed, not storing: {e}")
+            return
+        with self._lock:
+            if self._vectors is None:
+                self._vectors = np.zeros((self.max_entries, vector.shape[0]), dtype=np.float32)
+            slot_key = (scope, key)
+            old = self._slots.get(slot_key)
+            if old is not None:
+                self._clear_slot_locked(old)
+            slot = self._next
+            self._next = (slot + 1) % self.max_entries
+            if self._keys[slot] is not None:
+                self._clear_slot_locked(slot)  # 가장 오래된 항목부터 덮어씀
+            self._slots[slot_key] = slot
+            self._keys[slot] = slot_key
+            self._values[slot] = value
+            self._scopes[slot] = scope
+            self._created[slot] = time.time()
+            self._vectors[slot] = vector
+            self._filled = max(self._filled, slot + 1)
+
+    def mark_sample(self, sample_id: int, false_hit: bool) -> bool:
+        """샘플을 사람이 검토한 결과(오탐 여부)를 기록합니다."""
+        with self._lock:
+            for sample in self._samples:
+                if sample["sample_id"] == sample_id:
+                    sample["false_hit"] = false_hit
+                    return True
+        return False
+
+    def samples(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._samples)
+
+    def stats(self) -> Dict[str, Any]:
+        counters = metrics.snapshot_counters(f"semantic_cache.{self.namespace}.")
+        get = lambda name: counters.get(f"semantic_cache.{self.namespace}.{name}", 0)
+        exact, semantic, misses = get("exact_hits"), get("semantic_hits"), get("misses")
+        total = exact + semantic + misses
+        with self._lock:
+            reviewed = [s for s in self._samples if s["false_hit"] is not None]
+            entries = len(self._slots)
+        return {
+            "entries": entries,
+            "threshold": self.threshold,
+            "exact_hits": exact,
+            "semantic_hits": semantic,
+            "misses": misses,
+            "hit_rate": (exact + semantic) / total if total else 0.0,
+            "samples_reviewed": len(reviewed),
+            "false_hit_rate": (
+                sum(1 for s in reviewed if s["false_hit"]) / len(reviewed) if reviewed else None
+            ),
+        }
+
+
+_caches: Dict[str, SemanticCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_semantic_cache(namespace: str) -> Optional[SemanticCache]:
+    """namespace(작업 종류)별 캐시. SEMANTIC_CACHE_ENABLED가 꺼져 있으면 None."""
+    if not config.SEMANTIC_CACHE_ENABLED:
+        return None
+    with _caches_lock:
+        cache = _caches.get(namespace)
+        if cache is None:
+            cache = SemanticCache(
+                namespace,
+                threshold=config.SEMANTIC_CACHE_THRESHOLD,
+                max_entries=config.SEMANTIC_CACHE_MAX_ENTRIES,
+                ttl_seconds=config.SEMANTIC_CACHE_TTL_SECONDS,
+            )
+            _caches[namespace] = cache
+        return cache
+
+
+def all_semantic_caches() -> Dict[str, SemanticCache]:
+    with _caches_lock:
+        return dict(_caches)
+
+
+metrics.register_reporter(
+    "semantic_cache",
+    lambda: {name: cache.stats() for name, cache in all_semantic_caches().items()},
+)
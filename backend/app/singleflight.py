@@ -0,0 +1,71 @@
+# app/singleflight.py
+import threading
+import unicodedata
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+from .metrics import metrics
+
+
+def normalize_key(operation: str, *args: Any) -> Tuple[Hashable, ...]:
+    """작업 이름과 인자로 병합 키를 만듭니다. 문자열은 NFC 정규화 + 공백 제거 + 소문자화합니다."""
+    normalized = []
+    for arg in args:
+        if isinstance(arg, str):
+            arg = unicodedata.normalize("NFC", arg).strip().lower()
+        normalized.append(arg)
+    return (operation, *normalized)
+
+
+class SingleFlight:
+    """
+    같은 키로 동시에 들어온 호출을 하나의 업스트림 호출로 합칩니다.
+    먼저 들어온 호출(leader)만 fn을 실행하고, 나머지는 그 결과(또는 예외)를 함께 받습니다.
+    결과는 호출이 끝나는 즉시 잊으므로 캐시가 아닌 '진행 중 요청 병합'만 합니다.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            future = self._in_flight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._in_flight[key] = future
+
+        if not is_leader:
+            metrics.increment(f"singleflight.{self.name}.coalesced")
+            return future.result()
+
+        metrics.increment(f"singleflight.{self.name}.executed")
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def in_flight_count(self) -> int:
+        with self._lock:
+            return len(self._in_flight)
+
+
+# 단어 예문 생성처럼 같은 단어에 대한 동시 요청이 몰리는 AI 호출용
+ai_requests = SingleFlight("ai_requests")
+
+metrics.register_reporter(
+    "singleflight",
+    lambda: {
+        "in_flight": ai_requests.in_flight_count(),
+        **metrics.snapshot_counters("singleflight."),
+    },
+)
@@ -0,0 +1,56 @@
+# app/streaming.py
+import asyncio
+import json
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+
+
+def sse_event(data: Dict[str, Any], event: Optional[str] = None) -> str:
+    """Server-Sent Events 형식의 메시지 한 개를 만듭니다."""
+    message = ""
+    if event:
+        message += f"event: {event}\n"
+    message += f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+    return message
+
+
+async def sse_from_tokens(
+    request: Request,
+    tokens: AsyncIterator[str],
+    on_complete: Optional[Callable[[str], Awaitable[Dict[str, Any]]]] = None,
+) -> AsyncIterator[str]:
+    """
+    LLM 토큰 스트림을 SSE 이벤트(token → done/error)로 변환합니다.
+    클라이언트 연결이 끊기면 업스트림 LLM 스트림을 닫아 생성을 중단합니다.
+    on_complete는 스트림이 끝까지 완료된 경우에만 전체 텍스트로 호출됩니다.
+    """
+    chunks = []
+    try:
+        async for token in tokens:
+            if await request.is_disconnected():
+                print("SSE: Client disconnected, cancelling upstream LLM stream.")
+                return
+            chunks.append(token)
+            yield sse_event({"token": token}, event="token")
+
+        full_text = "".join(chunks)
+        extra = await on_complete(full_text) if on_complete else {}
+        yield sse_event({"text": full_text, **extra}, event="done")
+    except asyncio.CancelledError:
+        print("SSE: Stream cancelled, cancelling upstream LLM stream.")
+        raise
+    except Exception as e:
+        print(f"SSE: Error while streaming LLM output: {e}")
+        yield sse_event({"detail": str(e)}, event="error")
+    finally:
+        await tokens.aclose()
+
+
+def sse_response(events: AsyncIterator[str]) -> StreamingResponse:
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,136 @@
+# app/view_counter.py
+"""
+단어 조회수 write-behind 버퍼.
+
+조회 요청마다 words.word_count를 UPDATE/COMMIT하면 읽기가 전부 쓰기 트랜잭션이 되고,
+인기 단어는 같은 행 잠금을 두고 경쟁합니다. 대신 증가량을 메모리에 모았다가
+VIEW_COUNT_FLUSH_SECONDS마다(또는 대기 단어 수가 VIEW_COUNT_MAX_PENDING_WORDS를 넘으면)
+UPDATE 한 번으로 반영합니다. 응답에는 아직 반영되지 않은 증가량을 더해서 보여줍니다.
+프로세스가 비정상 종료되면 마지막 플러시 이후의 증가량은 사라집니다 (조회수는 근사치로 충분).
+"""
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy.orm.attributes import set_committed_value
+
+from . import crud, database
+from .config import (
+    VIEW_COUNT_FLUSH_SECONDS,
+    VIEW_COUNT_MAX_PENDING_WORDS,
+    VIEW_COUNT_FLUSH_BATCH_SIZE,
+)
+from .metrics import metrics
+
+
+class ViewCounter:
+    def __init__(self, flush_seconds: float, max_pending_words: int, batch_size: int):
+        self.flush_seconds = flush_seconds
+        self.max_pending_words = max_pending_words
+        self.batch_size = max(1, batch_size)
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # 플러시는 한 번에 하나만
+        self._pending: Dict[int, int] = {}
+        self._in_flight: Dict[int, int] = {}  # 플러시 중이라 아직 커밋되지 않은 증가량
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def record(self, word_id: int, delta: int = 1) -> None:
+        with self._lock:
+            self._pending[word_id] = self._pending.get(word_id, 0) + delta
+            too_many = len(self._pending) >= self.max_pending_words
+        metrics.increment("view_counter.recorded", delta)
+        if too_many:
+            self._wakeup.set()
+
+    def pending(self, word_id: int) -> int:
+        """DB에 아직 반영되지 않은 증가량 (대기 + 플러시 중)."""
+        with self._lock:
+            return self._pending.get(word_id, 0) + self._in_flight.get(word_id, 0)
+
+    def with_pending(self, db_word):
+        """
+        응답용으로 word_count에 미반영 증가량을 더합니다.
+        set_committed_value라 세션이 변경으로 인식하지 않아 DB에 다시 쓰이지 않습니다.
+        """
+        delta = self.pending(db_word.words_id)
+        if delta:
+            set_committed_value(db_word, "word_count", (db_word.word_count or 0) + delta)
+        return db_word
+
+    def with_pending_all(self, db_words: Iterable):
+        return [self.with_pending(db_word) for db_word in db_words]
+
+    def flush(self) -> int:
+        """모인 증가량을 DB에 반영하고 갱신된 행 수를 반환합니다. 실패하면 다음 플러시로 되돌립니다."""
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return 0
+                self._in_flight, self._pending = self._pending, {}
+                deltas = dict(self._in_flight)
+
+            started = time.perf_counter()
+            updated = 0
+            db = database.SessionLocal()
+            try:
+                items = list(deltas.items())
+                for i in range(0, len(items), self.batch_size):
+                    batch = dict(items[i : i + self.batch_size])
+                    updated += crud.words.bulk_increment_word_counts(db, batch)
+                    with self._lock:
+                        for word_id in batch:
+                            self._in_flight.pop(word_id, None)
+            except Exception as e:
+                db.rollback()
+                with self._lock:
+                    for word_id, delta in self._in_flight.items():
+                        self._pending[word_id] = self._pending.get(word_id, 0) + delta
+                    self._in_flight = {}
+                metrics.increment("view_counter.flush_failed")
+                print(f"View counter: flush failed, {len(deltas)} words kept for retry: {e}")
+            finally:
+                db.close()
+                metrics.observe("view_counter.flush", time.perf_counter() - started)
+            metrics.increment("view_counter.flushed_rows", updated)
+            return updated
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wakeup.wait(self.flush_seconds)
+            self._wakeup.clear()
+            self.flush()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="view-counter", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """플러시 스레드를 멈추고 남은 증가량을 마지막으로 반영합니다."""
+        self._stop.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        self.flush()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "pending_words": len(self._pending),
+                "pending_views": sum(self._pending.values()),
+                "in_flight_words": len(self._in_flight),
+            }
+
+
+view_counter = ViewCounter(
+    flush_seconds=VIEW_COUNT_FLUSH_SECONDS,
+    max_pending_words=VIEW_COUNT_MAX_PENDING_WORDS,
+    batch_size=VIEW_COUNT_FLUSH_BATCH_SIZE,
+)
+
+metrics.register_reporter("view_counter", view_counter.stats)
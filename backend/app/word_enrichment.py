@@ -0,0 +1,110 @@
+# app/word_enrichment.py
+"""
+단어 저장 직후 예문 / 쉬운 뜻 / 관련 단어를 미리 생성해 word_enrichments에 저장합니다.
+사용자는 단어를 추가한 뒤 거의 항상 바로 상세 화면을 열기 때문에, 그때 GPT를 기다리지 않고 DB에서 읽게 합니다.
+실행은 jobs 큐(job_handlers의 "word_enrichment")가 맡습니다.
+"""
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict
+
+from sqlalchemy.orm import Session
+
+from . import crud, database
+from .config import JOB_MAX_ATTEMPTS, WORD_ENRICHMENT_ENABLED
+from .metrics import metrics
+
+WORD_ENRICHMENT_JOB_TYPE = "word_enrichment"
+
+
+def enqueue_word_enrichment(db: Session, words_id: int) -> None:
+    """생성 작업을 큐에 넣습니다. 실패해도 단어 저장에는 영향을 주지 않습니다."""
+    if not WORD_ENRICHMENT_ENABLED:
+        return
+    try:
+        crud.word_enrichments.mark_enrichment_pending(db, words_id)
+        crud.jobs.enqueue_job(
+            db,
+            job_type=WORD_ENRICHMENT_JOB_TYPE,
+            payload={"words_id": words_id},
+            max_attempts=JOB_MAX_ATTEMPTS,
+        )
+        metrics.increment("word_enrichment.enqueued")
+    except Exception as e:
+        db.rollback()
+        print(f"Word enrichment: failed to enqueue word {words_id}: {e}")
+
+
+def enrich_word(words_id: int) -> Dict[str, Any]:
+    """
+    세 가지 AI 결과를 동시에 만들어 저장합니다.
+    일부만 실패하면 성공한 결과만 저장하고, 실패 내용은 error에 남깁니다. 모두 실패하면 RuntimeError (재시도 대상).
+    단어가 없으면 LookupError.
+    """
+    db = database.SessionLocal()
+    try:
+        db_word = crud.words.get_word_by_id(db, words_id)
+        if not db_word:
+            raise LookupError(f"Word {words_id} not found")
+        word_name = db_word.word_name
+        user_id = db_word.user_id
+        explanation = db_word.word_content or ""
+    finally:
+        db.close()
+
+    def examples() -> str:
+        db = database.SessionLocal()
+        try:
+            result = crud.word_examples.bring_exsen(words_id, db)
+        finally:
+            db.close()
+        if not result["success"]:
+            raise RuntimeError(result["message"])
+        return result["examples"]
+
+    def easy_meaning() -> str:
+        result = crud.word_examples.easy_min(word_name)
+        if not result["success"]:
+            raise RuntimeError(result["message"])
+        return result["easy_meaning"]
+
+    def related_words() -> list:
+        if not explanation.strip():
+            raise RuntimeError("단어 설명이 없어 관련 단어를 만들 수 없습니다.")
+        return crud.word_examples.generate_related_words(word_name, explanation, user_id=user_id)
+
+    tasks = {"examples": examples, "easy_meaning": easy_meaning, "related_words": related_words}
+    results: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+    with ThreadPoolExecutor(max_workers=len(tasks), thread_name_prefix="word-enrichment") as pool:
+        # 호출한 스레드의 LLM 우선순위(batch)를 각 작업 스레드에도 그대로 넘깁니다.
+        futures = {
+            name: pool.submit(contextvars.copy_context().run, fn) for name, fn in tasks.items()
+        }
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                errors[name] = str(e)
+                metrics.increment(f"word_enrichment.{name}.failed")
+
+    if not results:
+        raise RuntimeError(f"Word enrichment failed for word {words_id}: {errors}")
+
+    db = database.SessionLocal()
+    try:
+        saved = crud.word_enrichments.save_enrichment(
+            db,
+            words_id,
+            examples=results.get("examples"),
+            easy_meaning=results.get("easy_meaning"),
+            related_words=results.get("related_words"),
+            error="; ".join(f"{k}: {v}" for k, v in errors.items()) or None,
+        )
+    finally:
+        db.close()
+    if saved is None:
+        raise LookupError(f"Word {words_id} was deleted during enrichment")
+
+    metrics.increment("word_enrichment.completed")
+    return {"words_id": words_id, "generated": sorted(results), "failed": errors}
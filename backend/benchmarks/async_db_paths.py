@@ -0,0 +1,108 @@
+"""
+동기(Session + 스레드풀) 경로와 비동기(AsyncSession + asyncpg) 경로의 DB 조회 처리량 비교.
+
+같은 조회(사용자 단어 목록, 조회수 정렬)를 두 경로로 노출하는 최소 FastAPI 앱을 만들고,
+httpx ASGITransport로 동시에 요청을 보내 처리량과 지연을 잽니다. 네트워크/LLM은 쓰지 않습니다.
+--sleep-ms를 주면 요청마다 pg_sleep을 한 번 더 실행해 느린 쿼리를 흉내 냅니다 (PostgreSQL 전용).
+동기 경로는 FastAPI 기본 스레드풀(약 40개)에, 비동기 경로는 DB 풀 크기에만 묶이는 차이가 드러납니다.
+
+실행 (backend 디렉터리에서, DATABASE_URL이 실제 DB를 가리켜야 함):
+    python -m benchmarks.async_db_paths --user-id demo --requests 2000 --concurrency 200 --sleep-ms 20
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from typing import List
+
+os.environ.setdefault("OPENSEARCH_SINGLE_PORT", "9200")
+
+import httpx  # noqa: E402
+from fastapi import Depends, FastAPI  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app import crud, database, schemas  # noqa: E402
+from app.metrics import metrics  # noqa: E402
+
+
+def _build_app(sleep_seconds: float) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/sync/{user_id}", response_model=List[schemas.Word])
+    def sync_words(user_id: str, db: Session = Depends(database.get_db)):
+        if sleep_seconds:
+            db.execute(text("SELECT pg_sleep(:s)"), {"s": sleep_seconds})
+        return crud.words.get_words_by_user_sorted_by_count(db, user_id=user_id)
+
+    @app.get("/async/{user_id}", response_model=List[schemas.Word])
+    async def async_words(user_id: str, db: AsyncSession = Depends(database.get_async_db)):
+        if sleep_seconds:
+            await db.execute(text("SELECT pg_sleep(:s)"), {"s": sleep_seconds})
+        words, _ = await crud.aio.words.get_words_by_user_sorted_by_count(db, user_id=user_id)
+        return words
+
+    return app
+
+
+async def _run(client: httpx.AsyncClient, path: str, total: int, concurrency: int) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors = 0
+
+    async def one():
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.get(path)
+            latencies.append((time.perf_counter() - started) * 1000)
+            if response.status_code != 200:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "requests_per_second": total / elapsed,
+        "mean_ms": statistics.mean(latencies),
+        "p50_ms": latencies[len(latencies) // 2],
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1],
+        "errors": errors,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--user-id", required=True, help="단어가 있는 사용자 ID")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--sleep-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    app = _build_app(args.sleep_ms / 1000.0)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # 워밍업: 커넥션 풀과 비동기 엔진 생성
+        await _run(client, f"/sync/{args.user_id}", 10, 10)
+        await _run(client, f"/async/{args.user_id}", 10, 10)
+
+        for name in ("sync", "async"):
+            result = await _run(client, f"/{name}/{args.user_id}", args.requests, args.concurrency)
+            print(
+                f"{name:>5}: {result['requests_per_second']:8.1f} req/s  "
+                f"mean={result['mean_ms']:7.1f}ms  p50={result['p50_ms']:7.1f}ms  "
+                f"p95={result['p95_ms']:7.1f}ms  errors={result['errors']}"
+            )
+
+    timers = metrics.snapshot().get("timers", {})
+    for key in ("db.pool.wait", "db.async_pool.wait"):
+        if key in timers:
+            print(f"{key}: {timers[key]}")
+    await database.dispose_async_engine()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,85 @@
+"""
+요청당 체인 조립 오버헤드 측정 (LLM 호출 없음).
+
+before: 기존 방식처럼 요청마다 ChatPromptTemplate.from_messages + ChatOpenAI + LCEL 체인을 새로 만듭니다.
+after : app.chains 레지스트리에서 미리 조립된 체인을 꺼내 씁니다.
+두 경우 모두 프롬프트 포맷팅(prompt.invoke)까지만 수행하고 실제 API는 부르지 않습니다.
+
+실행 (backend 디렉터리에서):
+    python -m benchmarks.chain_construction --iterations 500
+"""
+import argparse
+import os
+import statistics
+import time
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+os.environ.setdefault("OPENSEARCH_SINGLE_PORT", "9200")
+
+from langchain_core.output_parsers import StrOutputParser  # noqa: E402
+from langchain_core.prompts import ChatPromptTemplate  # noqa: E402
+from langchain_openai import ChatOpenAI  # noqa: E402
+
+from app import chains, config  # noqa: E402
+
+
+def _before(task: str):
+    prompt = ChatPromptTemplate.from_messages(chains._PROMPTS[task].messages)
+    spec = chains._SPECS[task]()
+    llm = ChatOpenAI(
+        model=spec.model,
+        temperature=spec.temperature,
+        max_tokens=spec.max_tokens,
+        api_key=config.OPENAI_API_KEY,
+    )
+    chain = prompt | llm
+    if spec.parse_str:
+        chain = chain | StrOutputParser()
+    return chain
+
+
+def _after(task: str):
+    return chains.get_chain(task)
+
+
+def _measure(build, task: str, inputs: dict, iterations: int):
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        chain = build(task)
+        chain.first.invoke(inputs)  # 프롬프트 포맷팅까지만
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return {
+        "mean_ms": statistics.mean(samples),
+        "p50_ms": samples[len(samples) // 2],
+        "p95_ms": samples[int(len(samples) * 0.95) - 1],
+    }
+
+
+TASK_INPUTS = {
+    "exsen": {"input": "사과"},
+    "bring_exsen": {"word": "사과"},
+    "easy_min": {"input": "사과"},
+    "episode_content": {"existing_content": "내용 없음", "additional_prompt": "특별한 추가 요청 없음"},
+}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    chains.warm_chains()
+    print(f"{'task':<16}{'before mean':>14}{'after mean':>14}{'before p95':>14}{'after p95':>14}")
+    for task, inputs in TASK_INPUTS.items():
+        before = _measure(_before, task, inputs, args.iterations)
+        after = _measure(_after, task, inputs, args.iterations)
+        print(
+            f"{task:<16}{before['mean_ms']:>12.3f}ms{after['mean_ms']:>12.3f}ms"
+            f"{before['p95_ms']:>12.3f}ms{after['p95_ms']:>12.3f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
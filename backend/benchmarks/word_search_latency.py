@@ -0,0 +1,146 @@
+"""
+단어장 검색(crud.search) 지연 측정.
+
+한 사용자에게 단어 N개(단어마다 예문 1개)를 넣고, 모드(substring / fuzzy / fulltext)별로
+검색어 몇 개를 반복 실행해 p50/p95 지연을 출력합니다. 모드마다 EXPLAIN을 한 번 찍어
+pg_trgm / tsvector GIN 인덱스(ix_*_trgm, ix_*_search_vector)를 타는지도 보여줍니다.
+PostgreSQL 전용이며, 테이블/인덱스는 models.ensure_schema로 만듭니다.
+
+실행 (backend 디렉터리에서, DATABASE_URL이 실제 DB를 가리켜야 함). 넣은 사용자/단어/예문은 끝나면 지웁니다:
+    python -m benchmarks.word_search_latency --words 100000 --repeat 50
+"""
+import argparse
+import os
+import random
+import time
+import uuid
+
+os.environ.setdefault("OPENSEARCH_SINGLE_PORT", "9200")
+
+from sqlalchemy import delete, insert, select, text  # noqa: E402
+
+from app import crud, database, models  # noqa: E402
+
+_SYLLABLES = "가나다라마바사아자차카타파하거너더러머버서어저처커터퍼허고노도로모보소오조초"
+
+
+def _fake_word(rng: random.Random) -> str:
+    return "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+
+def _seed(db, user_id: str, count: int, rng: random.Random) -> list:
+    db.add(models.User(user_id=user_id, password="benchmark"))
+    db.commit()
+    names = []
+    batch = 5000
+    for start in range(0, count, batch):
+        rows = []
+        for i in range(start, min(start + batch, count)):
+            name = f"{_fake_word(rng)}{i}"
+            names.append(name)
+            rows.append(
+                {
+                    "user_id": user_id,
+                    "word_name": name,
+                    "word_content": f"{_fake_word(rng)} {_fake_word(rng)} 뜻을 가진 말",
+                }
+            )
+        ids = db.execute(
+            insert(models.Word).returning(models.Word.words_id, models.Word.word_name), rows
+        ).all()
+        db.execute(
+            insert(models.WordExample),
+            [
+                {
+                    "words_id": row.words_id,
+                    "example_sequence": 1,
+                    "word_example_content": f"{row.word_name}{_fake_word(rng)} 예문입니다",
+                }
+                for row in ids
+            ],
+        )
+        db.commit()
+    db.execute(text("ANALYZE words"))
+    db.execute(text("ANALYZE word_examples"))
+    db.commit()
+    return names
+
+
+def _cleanup(user_id: str) -> None:
+    """벤치마크가 넣은 예문, 단어, 사용자를 지웁니다 (시딩 중 실패해도 호출)."""
+    db = database.SessionLocal()
+    try:
+        word_ids = select(models.Word.words_id).where(models.Word.user_id == user_id)
+        db.execute(delete(models.WordExample).where(models.WordExample.words_id.in_(word_ids)))
+        db.execute(delete(models.Word).where(models.Word.user_id == user_id))
+        db.execute(delete(models.User).where(models.User.user_id == user_id))
+        db.commit()
+        print(f"cleaned up benchmark user '{user_id}'")
+    finally:
+        db.close()
+
+
+def _queries(mode: str, names: list, rng: random.Random) -> list:
+    picks = rng.sample(names, 5)
+    if mode == "fuzzy":
+        # 한 글자를 바꿔 오타를 흉내 냅니다.
+        return [n[:1] + rng.choice(_SYLLABLES) + n[2:] for n in picks]
+    if mode == "substring":
+        return [n[1:] for n in picks]
+    return picks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--words", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=30)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    if database.engine.dialect.name != "postgresql":
+        raise SystemExit("word search requires PostgreSQL (pg_trgm)")
+
+    database.Base.metadata.create_all(bind=database.engine)
+    models.ensure_schema(database.engine)
+
+    rng = random.Random(42)
+    user_id = f"search-bench-{uuid.uuid4().hex[:8]}"
+    db = database.SessionLocal()
+    try:
+        started = time.perf_counter()
+        names = _seed(db, user_id, args.words, rng)
+        print(f"seeded {len(names)} words in {time.perf_counter() - started:.1f}s")
+
+        for mode in crud.search.SEARCH_MODES:
+            queries = _queries(mode, names, rng)
+            stmt = crud.search.word_search_query(user_id, queries[0], mode, args.limit)
+            compiled = stmt.compile(database.engine, compile_kwargs={"literal_binds": True})
+            if mode == "fuzzy":
+                db.execute(crud.search.fuzzy_threshold_statement())
+            plan = db.execute(text(f"EXPLAIN {compiled}")).scalars().all()
+            db.rollback()
+            indexes = sorted({line.split(" on ")[-1].split()[0] for line in plan if "Index Scan" in line})
+
+            latencies = []
+            hits = 0
+            for _ in range(args.repeat):
+                for q in queries:
+                    t0 = time.perf_counter()
+                    rows, _ = crud.search.search_words(db, user_id, q, mode=mode, limit=args.limit)
+                    latencies.append((time.perf_counter() - t0) * 1000)
+                    hits += bool(rows)
+                    db.rollback()
+            latencies.sort()
+            print(
+                f"{mode:>9}: p50={latencies[len(latencies) // 2]:6.2f}ms  "
+                f"p95={latencies[int(len(latencies) * 0.95) - 1]:6.2f}ms  "
+                f"queries_with_hits={hits}/{len(latencies)}  indexes={indexes}"
+            )
+    finally:
+        db.rollback()
+        db.close()
+        _cleanup(user_id)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+작품 응답(schemas.Work) 직렬화에 드는 SQL 쿼리 수 측정.
+
+작품 수를 늘려 가며 crud.works.get_works_by_user_id / get_work_by_id 결과를 schemas.Work로 직렬화하고,
+엔진에서 실행된 쿼리 수를 셉니다. 하위 목록(characters, worlds, plannings, episodes)을 미리 불러오므로
+작품 수와 관계없이 쿼리 수가 일정해야 하며, 아니면 AssertionError로 끝납니다.
+비교용으로 옵션 없이 조회했을 때(지연 로딩, 4N+1)의 쿼리 수도 함께 출력합니다.
+
+실행 (backend 디렉터리에서, 기본은 임시 sqlite 파일):
+    python -m benchmarks.work_query_count --sizes 1 5 20 50
+"""
+import argparse
+import os
+import tempfile
+
+parser = argparse.ArgumentParser(description=__doc__)
+parser.add_argument("--sizes", type=int, nargs="+", default=[1, 5, 20, 50])
+parser.add_argument("--children", type=int, default=2, help="작품마다 만들 하위 요소 수 (종류별)")
+parser.add_argument(
+    "--database-url",
+    default=None,
+    help="측정할 DB (기본: 임시 sqlite 파일). 실제 DB를 쓰면 테이블이 만들어지고 데이터가 추가됩니다.",
+)
+args = parser.parse_args()
+
+os.environ["DATABASE_URL"] = args.database_url or (
+    "sqlite:///" + os.path.join(tempfile.mkdtemp(prefix="work-query-count-"), "bench.db")
+)
+os.environ.setdefault("OPENSEARCH_SINGLE_PORT", "9200")
+
+from sqlalchemy import event  # noqa: E402
+
+from app import crud, database, models, schemas  # noqa: E402
+
+
+class QueryCounter:
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+    def measure(self, fn) -> int:
+        before = self.count
+        fn()
+        return self.count - before
+
+
+_next_id = iter(range(1, 10**9))
+
+
+def _seed(db, user_id: str, works: int, children: int) -> None:
+    db.add(models.User(user_id=user_id, password="benchmark"))
+    for w in range(works):
+        work_id = next(_next_id)
+        db.add(models.Work(works_id=work_id, user_id=user_id, works_title=f"work {w}"))
+        for c in range(children):
+            db.add(models.Character(character_id=next(_next_id), works_id=work_id, character_name=f"c{c}"))
+            db.add(models.World(worlds_id=next(_next_id), works_id=work_id, worlds_content=f"world {c}"))
+            db.add(models.Planning(plan_id=next(_next_id), works_id=work_id, plan_title=f"plan {c}"))
+            db.add(models.Episode(episode_id=next(_next_id), works_id=work_id, episode_content=f"ep {c}"))
+    db.commit()
+
+
+def _serialize(works):
+    return [schemas.Work.model_validate(w).model_dump() for w in works]
+
+
+def main() -> None:
+    database.Base.metadata.create_all(bind=database.engine)
+    counter = QueryCounter(database.engine)
+
+    list_counts = {}
+    detail_counts = {}
+    print(f"{'works':>6} {'list(eager)':>12} {'list(lazy)':>11} {'detail(eager)':>14}")
+    for size in args.sizes:
+        user_id = f"query-count-{size}-{next(_next_id)}"
+        db = database.SessionLocal()
+        try:
+            _seed(db, user_id, size, args.children)
+        finally:
+            db.close()
+
+        def eager_list():
+            db = database.SessionLocal()
+            try:
+                works = crud.works.get_works_by_user_id(db, user_id=user_id)
+                assert len(_serialize(works)) == size
+            finally:
+                db.close()
+
+        def lazy_list():
+            db = database.SessionLocal()
+            try:
+                works = db.query(models.Work).filter(models.Work.user_id == user_id).all()
+                _serialize(works)
+            finally:
+                db.close()
+
+        def eager_detail():
+            db = database.SessionLocal()
+            try:
+                first = db.query(models.Work.works_id).filter(models.Work.user_id == user_id).first()
+            finally:
+                db.close()
+            db = database.SessionLocal()
+            try:
+                _serialize([crud.works.get_work_by_id(db, work_id=first.works_id)])
+            finally:
+                db.close()
+
+        list_counts[size] = counter.measure(eager_list)
+        lazy = counter.measure(lazy_list)
+        # 상세 조회는 첫 작품 ID를 찾는 쿼리 1회를 빼고 셉니다.
+        detail_counts[size] = counter.measure(eager_detail) - 1
+        print(f"{size:>6} {list_counts[size]:>12} {lazy:>11} {detail_counts[size]:>14}")
+
+    assert len(set(list_counts.values())) == 1, f"list query count grows with works: {list_counts}"
+    assert len(set(detail_counts.values())) == 1, f"detail query count varies: {detail_counts}"
+    print("OK: query count is constant regardless of the number of works")
+
+
+if __name__ == "__main__":
+    main()
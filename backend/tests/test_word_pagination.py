@@ -0,0 +1,66 @@
+"""
+정렬 목록 keyset 페이지네이션(crud.words.sorted_words_query / split_page) 테스트.
+
+SQLite 메모리 DB에 같은 초에 만든 단어들을 넣고, 커서를 따라 마지막 페이지까지 읽어
+모든 단어가 정확히 한 번씩 나오는지 확인합니다.
+실행 (backend 디렉터리에서):
+    python -m pytest -q tests
+"""
+import os
+
+os.environ.setdefault("OPENSEARCH_SINGLE_PORT", "9200")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+import pytest  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app import crud, database, models  # noqa: E402
+
+WORD_COUNT = 7
+
+
+@pytest.fixture()
+def db():
+    engine = create_engine("sqlite://")
+    database.Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    session.add(models.User(user_id="u1", password="test"))
+    session.add(models.User(user_id="u2", password="test"))
+    # word_created_time은 server_default(func.now())라 모두 같은 초가 됩니다.
+    # SQLite의 BigInteger 기본 키는 자동 증가하지 않으므로 ID를 직접 넣습니다.
+    for i in range(WORD_COUNT):
+        session.add(
+            models.Word(words_id=i + 1, user_id="u1", word_name=f"w{i}", word_count=i % 3)
+        )
+    session.add(models.Word(words_id=WORD_COUNT + 1, user_id="u2", word_name="other"))
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def _walk(db, sort: str, limit: int) -> list:
+    ids, cursor = [], None
+    for _ in range(WORD_COUNT + 1):
+        rows = db.execute(crud.words.sorted_words_query("u1", sort, cursor, limit)).scalars().all()
+        page, cursor = crud.words.split_page(sort, list(rows), limit)
+        ids += [word.words_id for word in page]
+        if cursor is None:
+            return ids
+    pytest.fail(f"cursor pagination for '{sort}' did not finish: {ids}")
+
+
+def _full_list(db, sort: str) -> list:
+    if sort == "count":
+        return crud.words.get_words_by_user_sorted_by_count(db, "u1")
+    return crud.words.get_words_by_user_sorted_by_created_time(db, "u1")
+
+
+@pytest.mark.parametrize("sort", sorted(crud.words.WORD_SORT_KEYS))
+@pytest.mark.parametrize("limit", [1, 2, 3, WORD_COUNT])
+def test_cursor_pages_return_every_word_once(db, sort, limit):
+    ids = _walk(db, sort, limit)
+
+    assert sorted(ids) == list(range(1, WORD_COUNT + 1))
+    assert ids == [word.words_id for word in _full_list(db, sort)]